@@ -1,53 +1,101 @@
-from fastapi import APIRouter, HTTPException, BackgroundTasks, UploadFile, File, Depends
-from sqlalchemy.orm import Session
-from typing import Optional
-from app.models.database import ProcessingJob, Meeting, Requirement, JiraTicket, get_db
-from app.services.jira_service import JiraService
+from fastapi import APIRouter, HTTPException, UploadFile, File, Depends, Query, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import select, text, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from typing import Optional, Tuple
+from datetime import datetime
+import asyncio
+import base64
+import hashlib
+import json
+from app.models.database import ProcessingJob, Meeting, Requirement, JiraTicket, TranscriptSegment, AsyncSessionLocal, async_engine, get_db
+from app.services.events import get_event_bus, job_event, publish_job, stream_check_interval
+from app.services.response_cache import get_response_cache, meeting_tag, MEETINGS_TAG
+from app.services.jira_service import JiraService, DEFAULT_ISSUE_TYPE, get_jira_service, requirement_to_extracted
 from app.utils.logger import logger
-from app.services.file_service import FileService
-from app.services.transcription import TranscriptionService
-from app.services.extraction import RequirementExtractionService
-from app.models.schemas import RequirementExtracted, RequirementType, Priority
+from app.utils.metrics import metrics
+from app.services.file_service import FileService, get_file_service
+from app.services.job_queue import STAGES, get_job_queue, resume_job, stage_statuses
+from app.config import settings
 
 router = APIRouter()
 
-file_service = FileService()
-transcription_service = TranscriptionService()
-extraction_service = RequirementExtractionService()
-jira_service = JiraService()
+def _cached_response(request: Request, response: Response, payload: dict, cache_control: str):
+     """
+     Set ETag and Cache-Control on a JSON payload, and answer 304 when the
+     client already has this version
+     """
+     body = json.dumps(jsonable_encoder(payload), sort_keys=True, separators=(',', ':'))
+     etag = f'"{hashlib.sha256(body.encode()).hexdigest()[:32]}"'
+     headers = {"ETag": etag, "Cache-Control": cache_control}
+
+     if etag in request.headers.get("if-none-match", ""):
+          return Response(status_code=304, headers=headers)
+
+     response.headers.update(headers)
+     return payload
+
+def _meeting_cache_ttl(job: Optional[ProcessingJob]) -> Optional[int]:
+     """
+     Meeting reads are only cached once the job has finished; until then
+     progress changes too often to be worth it
+     """
+     if job and job.status in ("completed", "failed"):
+          return settings.RESPONSE_CACHE_TTL_SECONDS
+     return None
+
+def _metadata_cache_control() -> str:
+     return (
+          f"private, max-age={settings.JIRA_METADATA_TTL_SECONDS}, "
+          f"stale-while-revalidate={settings.JIRA_METADATA_STALE_SECONDS}"
+     )
 
 @router.post("/upload", response_model=dict)
 async def upload_meeting_file(
-     background_tasks: BackgroundTasks,
      file: UploadFile = File(...),
      project_key: str = "PROJ",
      assignee: Optional[str] = None,
-     db: Session = Depends(get_db)):
+     db: AsyncSession = Depends(get_db),
+     file_service: FileService = Depends(get_file_service),
+     jira_service: JiraService = Depends(get_jira_service)):
      """
      Upload meeting recording and start processing
      """
      try:
           await file_service.validate_file(file)
+          await jira_service.metadata.validate_project(project_key, DEFAULT_ISSUE_TYPE)
 
-          file_path, unique_filename = await file_service.save_uploaded_file(file)
+          file_path, unique_filename, content_hash = await file_service.save_uploaded_file(file)
 
           meeting = Meeting(
                filename=unique_filename,
                original_filename=file.filename,
-               file_path=file_path
+               file_path=file_path,
+               content_hash=content_hash
           )
 
           db.add(meeting)
-          db.commit()
-
-          background_tasks.add_task(
-               process_meeting_async,
-               meeting.id,
-               file_path,
-               project_key,
-               assignee,
-               db
+          await db.flush()
+
+          job = ProcessingJob(
+               meeting_id=meeting.id,
+               stage=STAGES[0],
+               status="queued",
+               progress=0,
+               message="Queued for processing....",
+               payload={
+                    "project_key": project_key,
+                    "assignee": assignee
+               },
+               max_attempts=settings.JOB_MAX_ATTEMPTS
           )
+          db.add(job)
+          await db.commit()
+
+          await get_response_cache().invalidate_meeting()
+          await get_job_queue().enqueue(job.id, STAGES[0])
 
           return {
                "message": "File Upload Successfully",
@@ -59,36 +107,286 @@ async def upload_meeting_file(
           raise HTTPException(status_code=400, detail=str(e))
 
 
+MEETING_DETAIL_FIELDS = {"meeting", "job", "requirements", "tickets", "transcript"}
+DEFAULT_MEETING_DETAIL_FIELDS = "meeting,job,requirements,tickets"
+
+@router.get('/meetings/{meeting_id}')
+async def get_meeting_detail(
+     meeting_id: str,
+     request: Request,
+     response: Response,
+     fields: str = DEFAULT_MEETING_DETAIL_FIELDS,
+     db: AsyncSession = Depends(get_db)
+):
+     """
+     Meeting, job, requirements and tickets in one response, loaded with a
+     single joined query. `fields` picks the parts to return (add
+     "transcript" for the full text). Send the ETag back in If-None-Match to
+     get a 304 when nothing changed.
+     """
+     try:
+          selected = {field.strip() for field in fields.split(",") if field.strip()}
+          unknown = selected - MEETING_DETAIL_FIELDS
+          if unknown:
+               raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}")
+
+          async def load():
+               # The job is always loaded, its status decides whether the response is cacheable
+               query = select(Meeting).where(Meeting.id == meeting_id).options(joinedload(Meeting.job))
+               if "tickets" in selected:
+                    query = query.options(joinedload(Meeting.requirements).joinedload(Requirement.tickets))
+               elif "requirements" in selected:
+                    query = query.options(joinedload(Meeting.requirements))
+
+               meeting = (await db.scalars(query)).unique().first()
+               if not meeting:
+                    raise HTTPException(status_code=404, detail="Meeting not found")
+
+               payload = {"id": meeting.id}
+               if "meeting" in selected:
+                    payload["meeting"] = {
+                         "filename": meeting.original_filename,
+                         "duration": meeting.duration,
+                         "processed": meeting.processed,
+                         "transcription_confidence": meeting.transcription_confidence,
+                         "created_at": meeting.created_at,
+                         "updated_at": meeting.updated_at
+                    }
+               if "transcript" in selected:
+                    payload["transcript"] = meeting.transcription_text
+               if "job" in selected:
+                    job = meeting.job
+                    payload["job"] = {
+                         "id": job.id,
+                         "status": job.status,
+                         "stage": job.stage,
+                         "stages": stage_statuses(job),
+                         "progress": job.progress,
+                         "message": job.message,
+                         "attempts": job.attempts,
+                         "result": job.result,
+                         "updated_at": job.updated_at
+                    } if job else None
+               if "requirements" in selected:
+                    payload["requirements"] = [
+                         {
+                              "id": req.id,
+                              "summary": req.summary,
+                              "description": req.description,
+                              "type": req.requirement_type,
+                              "priority": req.priority,
+                              "labels": req.labels,
+                              "acceptance_criteria": req.acceptance_criteria,
+                              "confidence": req.confidence,
+                              "timestamp": req.timestamp,
+                              "jira_ticket_key": req.jira_ticket_key,
+                              "jira_error": req.jira_error,
+                              "created_at": req.created_at
+                         }
+                         for req in meeting.requirements
+                    ]
+               if "tickets" in selected:
+                    payload["tickets"] = [
+                         {
+                              "id": ticket.id,
+                              "requirement_id": ticket.requirement_id,
+                              "ticket_key": ticket.ticket_key,
+                              "url": ticket.url,
+                              "summary": ticket.summary,
+                              "status": ticket.status,
+                              "created_at": ticket.created_at
+                         }
+                         for req in meeting.requirements
+                         for ticket in req.tickets
+                    ]
+               return payload, _meeting_cache_ttl(meeting.job)
+
+          payload = await get_response_cache().get_or_load(
+               "meeting_detail",
+               f"meeting:{meeting_id}:detail:{','.join(sorted(selected))}",
+               [meeting_tag(meeting_id)],
+               load
+          )
+
+          # Revalidate every time; unchanged meetings cost a 304 without a body
+          return _cached_response(request, response, payload, "private, no-cache")
+     except HTTPException:
+          raise
+     except Exception as e:
+          logger.error(f"Meeting fetch failed: {str(e)}")
+          raise HTTPException(status_code=500, detail="Failed to get meeting")
+
 @router.get('/meetings/{meeting_id}/status')
-async def get_meeting_status(meeting_id: str, db: Session=Depends(get_db)):
+async def get_meeting_status(meeting_id: str, db: AsyncSession = Depends(get_db)):
      try:
-          meeting = db.query(Meeting).filter(Meeting.id == meeting_id).first()
+          async def load():
+               meeting = await db.get(Meeting, meeting_id)
+               if not meeting:
+                    raise HTTPException(status_code=404, detail="Meeting not found")
+
+               job = await db.scalar(
+                    select(ProcessingJob).where(ProcessingJob.meeting_id == meeting_id).limit(1)
+               )
+
+               return {
+                    "meeting_id" : meeting_id,
+                    "file_name" : meeting.original_filename,
+                    "status" : job.status if job else "pending",
+                    "stage" : job.stage if job else None,
+                    "stages" : stage_statuses(job) if job else None,
+                    "progress" : job.progress if job else 0,
+                    "message" : job.message,
+                    "processed" : meeting.processed,
+                    "created_at" : meeting.created_at
+               }, _meeting_cache_ttl(job)
+
+          return await get_response_cache().get_or_load(
+               "meeting_status", f"meeting:{meeting_id}:status", [meeting_tag(meeting_id)], load
+          )
+     except HTTPException:
+          raise
+     except Exception as e:
+          logger.error(f"status check failed: {str(e)}")
+          raise HTTPException(status_code=500, detail="Failed to get status")
+
+@router.post('/meetings/{meeting_id}/resume')
+async def resume_meeting_processing(meeting_id: str, db: AsyncSession = Depends(get_db)):
+     """
+     Re-run a failed job from the stage it failed at (or ticket creation for
+     tickets that could not be created). Completed stages are not repeated.
+     """
+     try:
+          job = await db.scalar(
+               select(ProcessingJob).where(ProcessingJob.meeting_id == meeting_id).limit(1).with_for_update()
+          )
+          if not job:
+               raise HTTPException(status_code=404, detail="Meeting not found")
+
+          try:
+               stage = resume_job(job)
+          except ValueError as e:
+               raise HTTPException(status_code=409, detail=str(e))
+          await db.commit()
+
+          await get_response_cache().invalidate_meeting(meeting_id)
+          await publish_job(job)
+          await get_job_queue().enqueue(job.id, stage)
+
+          return {
+               "meeting_id": meeting_id,
+               "job_id": job.id,
+               "stage": stage,
+               "status": job.status
+          }
+     except HTTPException:
+          raise
+     except Exception as e:
+          logger.error(f"Resume failed: {str(e)}")
+          raise HTTPException(status_code=500, detail="Failed to resume processing")
+
+async def _load_job_event(meeting_id: str) -> Optional[dict]:
+     # Short-lived session: a stream can stay open for the whole job
+     async with AsyncSessionLocal() as db:
+          job = await db.scalar(
+               select(ProcessingJob).where(ProcessingJob.meeting_id == meeting_id).limit(1)
+          )
+          return job_event(job) if job else None
+
+@router.get('/meetings/{meeting_id}/events')
+async def stream_meeting_events(meeting_id: str, request: Request):
+     """
+     Server-Sent Events stream of job progress for a meeting. Sends the
+     current state first, then every change until the job completes or
+     fails. The job row is re-checked on every keepalive, and every
+     EVENTS_FALLBACK_POLL_SECONDS when the event bus can't reach the
+     workers, so progress still arrives without it.
+     """
+     if await _load_job_event(meeting_id) is None:
+          raise HTTPException(status_code=404, detail="Meeting not found")
+
+     def format_event(event: dict) -> str:
+          return f"data: {json.dumps(event)}\n\n"
+
+     async def stream():
+          async with get_event_bus().subscribe(meeting_id) as subscription:
+               # Read the row after subscribing so no change falls in between
+               last = await _load_job_event(meeting_id)
+               if last is None:
+                    return
+               yield f"retry: 3000\n{format_event(last)}"
+               while last["status"] not in ("completed", "failed"):
+                    if await request.is_disconnected():
+                         break
+                    event = await subscription.next(stream_check_interval())
+                    if event is None:
+                         event = await _load_job_event(meeting_id)
+                         if event is None or event == last:
+                              yield ": keepalive\n\n"
+                              continue
+                    last = event
+                    yield format_event(last)
+
+     return StreamingResponse(
+          stream(),
+          media_type="text/event-stream",
+          headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+     )
+
+@router.get("/meetings/{meeting_id}/transcript")
+async def get_meeting_transcript(
+     meeting_id: str,
+     after: int = -1,
+     db: AsyncSession = Depends(get_db)
+):
+     """
+     Get the transcript segments persisted so far. Pass the last seen
+     position as `after` to only fetch new segments while transcription runs.
+     """
+     try:
+          meeting = await db.get(Meeting, meeting_id)
           if not meeting:
                raise HTTPException(status_code=404, detail="Meeting not found")
-          
-          job = db.query(ProcessingJob).filter(ProcessingJob.meeting_id == meeting_id).first()
+
+          job = await db.scalar(
+               select(ProcessingJob).where(ProcessingJob.meeting_id == meeting_id).limit(1)
+          )
+
+          segments = (await db.scalars(
+               select(TranscriptSegment).where(
+                    TranscriptSegment.meeting_id == meeting_id,
+                    TranscriptSegment.position > after
+               ).order_by(TranscriptSegment.position)
+          )).all()
 
           return {
-               "meeting_id" : meeting_id,
-               "file_name" : meeting.original_filename,
-               "status" : job.status if job else "pending",
-               "progress" : job.progress if job else 0,
-               "message" : job.message,
-               "processed" : meeting.processed,
-               "created_at" : meeting.created_at
+               "meeting_id": meeting_id,
+               "complete": meeting.transcription_text is not None,
+               "duration": meeting.duration,
+               "progress": job.progress if job else 0,
+               "segments": [
+                    {
+                         "position": segment.position,
+                         "start": segment.start,
+                         "end": segment.end,
+                         "text": segment.text
+                    }
+                    for segment in segments
+               ]
           }
      except HTTPException:
           raise
      except Exception as e:
-          logger.error(f"status check failed: {str(e)}")
-          raise HTTPException(status_code=500, detail="Failed to get status")
+          logger.error(f"Transcript fetch failed: {str(e)}")
+          raise HTTPException(status_code=500, detail="Failed to get transcript")
 
-@router.get("meetings/{meeting_id}/requirements")
-async def get_meeeting_requirements(meeting_id: str, db: Session=Depends(get_db)):
+@router.get("/meetings/{meeting_id}/requirements")
+async def get_meeeting_requirements(meeting_id: str, db: AsyncSession = Depends(get_db)):
      """Get eextracted requirements for a meeting
      """
      try:
-          requirements = db.query(Meeting).filter(Requirement.meeting_id == meeting_id).all()
+          requirements = (await db.scalars(
+               select(Requirement).where(Requirement.meeting_id == meeting_id)
+          )).all()
 
           if not requirements:
                raise HTTPException(status_code=404, detail="No requirements found")
@@ -106,6 +404,7 @@ async def get_meeeting_requirements(meeting_id: str, db: Session=Depends(get_db)
                          "acceptance_criteria": req.acceptance_criteria,
                          "confidence": req.confidence,
                          "jira_ticket_key": req.jira_ticket_key,
+                         "jira_error": req.jira_error,
                          "created_at": req.created_at
                     }
                     for req in requirements
@@ -118,38 +417,47 @@ async def get_meeeting_requirements(meeting_id: str, db: Session=Depends(get_db)
           raise HTTPException(status_code=500, detail="Failed to get requirements")
 
 @router.get("/meetings/{meeting_id}/tickets")
-async def get_meeting_tickets(meeting_id: str, db: Session = Depends(get_db)):
+async def get_meeting_tickets(meeting_id: str, db: AsyncSession = Depends(get_db)):
      """
      Get Jira tickets created for a meeting
      """
      try:
-          requirements = db.query(Requirement).filter(
-               Requirement.meeting_id == meeting_id
-          ).all()
+          async def load():
+               requirements = (await db.scalars(
+                    select(Requirement).where(Requirement.meeting_id == meeting_id)
+               )).all()
 
-          if not requirements:
-               raise HTTPException(status_code=404, detail="No requirements found")
+               if not requirements:
+                    raise HTTPException(status_code=404, detail="No requirements found")
           
-          requirement_ids = [req.id for req in requirements]
+               requirement_ids = [req.id for req in requirements]
 
-          tickets = db.query(JiraTicket).filter(
-               JiraTicket.requirement_id.in_(requirement_ids)
-          ).all()
+               tickets = (await db.scalars(
+                    select(JiraTicket).where(JiraTicket.requirement_id.in_(requirement_ids))
+               )).all()
 
-          return {
-               "meeting_id": meeting_id,
-               "tickets": [
-                    {
-                         "id": ticket.id,
-                         "ticket_key": ticket.ticket_key,
-                         "url": ticket.url,
-                         "summary": ticket.summary,
-                         "status": ticket.status,
-                         "created_at": ticket.created_at
-                    }
-                    for ticket in tickets
-               ]
-          }
+               job = await db.scalar(
+                    select(ProcessingJob).where(ProcessingJob.meeting_id == meeting_id).limit(1)
+               )
+
+               return {
+                    "meeting_id": meeting_id,
+                    "tickets": [
+                         {
+                              "id": ticket.id,
+                              "ticket_key": ticket.ticket_key,
+                              "url": ticket.url,
+                              "summary": ticket.summary,
+                              "status": ticket.status,
+                              "created_at": ticket.created_at
+                         }
+                         for ticket in tickets
+                    ]
+               }, _meeting_cache_ttl(job)
+
+          return await get_response_cache().get_or_load(
+               "meeting_tickets", f"meeting:{meeting_id}:tickets", [meeting_tag(meeting_id)], load
+          )
      except HTTPException:
           raise
      except Exception as e:
@@ -157,28 +465,77 @@ async def get_meeting_tickets(meeting_id: str, db: Session = Depends(get_db)):
           raise HTTPException(status_code=500, detail="Failed to get tickets")
 
 @router.get("/projects")
-async def get_jira_projects():
+async def get_jira_projects(
+     request: Request,
+     response: Response,
+     jira_service: JiraService = Depends(get_jira_service)
+):
      """
      Get Avialable Projects
      """
      try:
           projects = await jira_service.get_projects()
-          return {"projects": projects}
+          if not projects:
+               # Don't let clients hold on to the empty answer of a Jira outage
+               response.headers["Cache-Control"] = "no-store"
+               return {"projects": projects}
+          return _cached_response(request, response, {"projects": projects}, _metadata_cache_control())
      except Exception as e:
           logger.error(f"Project fetch failed: {str(e)}")
           raise HTTPException(status_code=500,detail="Failed tp get projects")
 
+@router.get("/projects/{project_key}/issue-types")
+async def get_jira_issue_types(
+     project_key: str,
+     request: Request,
+     response: Response,
+     jira_service: JiraService = Depends(get_jira_service)
+):
+     """
+     Get the issue types available in a project
+     """
+     try:
+          issue_types = await jira_service.metadata.get_issue_types(project_key)
+          return _cached_response(
+               request, response,
+               {"project_key": project_key, "issue_types": issue_types},
+               _metadata_cache_control()
+          )
+     except Exception as e:
+          logger.error(f"Issue type fetch failed: {str(e)}")
+          raise HTTPException(status_code=500, detail="Failed to get issue types")
+
+@router.get("/projects/{project_key}/assignable-users")
+async def get_jira_assignable_users(
+     project_key: str,
+     request: Request,
+     response: Response,
+     jira_service: JiraService = Depends(get_jira_service)
+):
+     """
+     Get the users issues in a project can be assigned to
+     """
+     try:
+          users = await jira_service.metadata.get_assignable_users(project_key)
+          return _cached_response(
+               request, response,
+               {"project_key": project_key, "users": users},
+               _metadata_cache_control()
+          )
+     except Exception as e:
+          logger.error(f"Assignable user fetch failed: {str(e)}")
+          raise HTTPException(status_code=500, detail="Failed to get assignable users")
+
 @router.get("/requiremets/{requirement_id}/create-ticket")
 async def create_single_ticket(
      requirement_id: str,
      project_key: str,
      assignee: Optional[str] = None,
-     db: Session = Depends(get_db)
+     db: AsyncSession = Depends(get_db),
+     jira_service: JiraService = Depends(get_jira_service)
 ):
      try:
-          requirement = db.query(Requirement).filter(
-               Requirement.id == requirement_id
-          ).first()
+          requirement = await db.get(Requirement, requirement_id)
 
           if not requirement:
                raise HTTPException(status_code=404, detail="Requirement not found")
@@ -188,18 +545,13 @@ async def create_single_ticket(
                     status_code=404,
                     detail="Ticket already exists for this requirement"
                )
+
+          try:
+               await jira_service.metadata.validate_project(project_key, DEFAULT_ISSUE_TYPE)
+          except ValueError as e:
+               raise HTTPException(status_code=400, detail=str(e))
           
-          req_obj = RequirementExtracted(
-               text=requirement.text,
-               summary=requirement.summary,
-               description=requirement.description,
-               type=RequirementType(requirement.requirement_type),
-               priority=Priority(requirement.priority),
-               labels=requirement.labels or [],
-               acceptance_criteria=requirement.acceptance_criteria or [],
-               confidence=requirement.confidence,
-               timestamp=requirement.timestamp
-          )
+          req_obj = requirement_to_extracted(requirement)
 
           tickets = await jira_service.create_tickets_from_requirements(
                [req_obj], project_key, assignee
@@ -218,7 +570,8 @@ async def create_single_ticket(
                     status=ticket.status
                )
                db.add(jira_ticket)
-               db.commit()
+               await db.commit()
+               await get_response_cache().invalidate_meeting(requirement.meeting_id)
 
                return {
                     "message": "Ticket created successfully",
@@ -238,128 +591,121 @@ async def create_single_ticket(
           logger.error(f"Ticket creation failed: {str(e)}")
           raise HTTPException(status_code=500, detail="Failed to create ticket")
 
+def _encode_cursor(meeting: Meeting) -> str:
+     raw = json.dumps([meeting.created_at.isoformat(), meeting.id])
+     return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, str]:
+     try:
+          raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+          created_at, meeting_id = json.loads(raw)
+          return datetime.fromisoformat(created_at), str(meeting_id)
+     except Exception:
+          raise HTTPException(status_code=400, detail="Invalid cursor")
+
 @router.get('/meetings')
 async def get_meetings(
-     limit: int = 10,
-     offset: int = 0,
-     db: Session = Depends(get_db)
+     limit: int = Query(10, ge=1, le=100),
+     cursor: Optional[str] = None,
+     processed: Optional[bool] = None,
+     created_after: Optional[datetime] = None,
+     created_before: Optional[datetime] = None,
+     filename_prefix: Optional[str] = None,
+     db: AsyncSession = Depends(get_db)
 ):
+     """
+     List meetings newest first. Pages are keyed on (created_at, id): pass
+     the returned next_cursor to get the following page, so deep pages cost
+     the same as the first one.
+     """
      try:
-          meetings = db.query(Meeting).order_by(
-               Meeting.created_at.desc()
-          ).offset(offset).limit(limit).all()
-
-          return {
-               "meetings": [
-                    {
-                         "id": meeting.id,
-                         "filename": meeting.original_filename,
-                         "duration": meeting.duration,
-                         "processed": meeting.processed,
-                         "created_at": meeting.created_at
-                    }
-                    for meeting in meetings
-               ]
-          }
+          async def load():
+               query = select(Meeting)
+               if cursor:
+                    cursor_created_at, cursor_id = _decode_cursor(cursor)
+                    query = query.where(
+                         tuple_(Meeting.created_at, Meeting.id) < tuple_(cursor_created_at, cursor_id)
+                    )
+               if processed is not None:
+                    query = query.where(Meeting.processed == processed)
+               if created_after:
+                    query = query.where(Meeting.created_at >= created_after)
+               if created_before:
+                    query = query.where(Meeting.created_at < created_before)
+               if filename_prefix:
+                    escaped = filename_prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+                    query = query.where(Meeting.original_filename.like(f"{escaped}%", escape="\\"))
+
+               # One extra row tells whether there is a next page
+               meetings = (await db.scalars(
+                    query.order_by(Meeting.created_at.desc(), Meeting.id.desc()).limit(limit + 1)
+               )).all()
+               has_more = len(meetings) > limit
+               meetings = meetings[:limit]
 
+               return {
+                    "meetings": [
+                         {
+                              "id": meeting.id,
+                              "filename": meeting.original_filename,
+                              "duration": meeting.duration,
+                              "processed": meeting.processed,
+                              "created_at": meeting.created_at
+                         }
+                         for meeting in meetings
+                    ],
+                    "next_cursor": _encode_cursor(meetings[-1]) if has_more else None
+               }, settings.RESPONSE_CACHE_LIST_TTL_SECONDS
+
+          key = "meetings:" + json.dumps(
+               [limit, cursor, processed, created_after, created_before, filename_prefix], default=str
+          )
+          return await get_response_cache().get_or_load("meetings_list", key, [MEETINGS_TAG], load)
+     except HTTPException:
+          raise
      except Exception as e:
           logger.error(f"Meetings fetch failed: {str(e)}")
           raise HTTPException(status_code=500, detail="Failed to get meetings")
 
+@router.get('/health/live')
+async def liveness():
+     """
+     The process is up and serving requests
+     """
+     return {"status": "alive"}
 
-
-
-async def process_meeting_async(
-     meeting_id: str,
-     file_path: str,
-     project_key: str,
-     assignee: Optional[str],
-     db
-):
+@router.get('/health/ready')
+async def readiness(request: Request):
      """
-     Background task to process meeting recording
+     Ready to take traffic: startup warm-up (if enabled) has finished and the
+     database answers. Jira is not checked, an outage there only affects
+     ticket creation.
      """
+     checks = {"warmup": getattr(request.app.state, "ready", True)}
      try:
-          job = ProcessingJob(
-               meeting_id = meeting_id,
-               status="processing",
-               progress=0,
-               message="Starting transcription...."
-          )
-          db.add(job)
-          db.commit()
-
-          logger.info(f"Starting transcription for meeting {meeting_id}")
-          transcription_text, confidence = await transcription_service.transcribe_audio(file_path)
-
-          meeting = db.query(Meeting).filter(Meeting.id == meeting_id).first()
-          meeting.transcription_text = transcription_text
-          meeting.transcription_confidence = confidence
-
-          job.progress = 30
-          job.message = "Transcription complete, Extracting requirements ...."
-          db.commit()
-
-          logger.info(f"Extracting requirements for meeting {meeting_id}")
-          requirements = await extraction_service.extract_requirements(transcription_text)
-
-          for req in requirements:
-               requirement = Requirement(
-                    meeting_id=meeting_id,
-                    text=req.text,
-                    summary=req.summary,
-                    description=req.description,
-                    requirement_type=req.type.value,
-                    # priority=req.priority.value,
-                    labels=req.labels,
-                    acceptance_criteria=req.acceptance_criteria,
-                    timestamp = req.timestamp
-               )
-
-               db.add(requirement)
-          
-          job.progress = 60
-          job.message = "Requirements extracted, Creating Jira Tickets ....."
-          db.commit()
-
-          logger.info(f"Creating Jira tickets for meeting {meeting_id}")
-
-          tickets = await jira_service.create_tickets_from_requirements(requirements, project_key, assignee)
-
-          for i, ticket in enumerate(tickets):
-               if i < len(requirements):
-                    req_in_db = db.query(Requirement).filter(
-                         Requirement.meeting_id == meeting_id
-                    ).offset(i).first()
-
-                    req_in_db.jira_ticket_key = ticket.key
-
-                    jira_ticket = JiraTicket(
-                         requirement_id=req_in_db.id,
-                         ticket_key=ticket.key,
-                         url =  ticket.url,
-                         summary = ticket.summary,
-                         status = ticket.status
-                    )
+          async def ping():
+               async with async_engine.connect() as conn:
+                    await conn.execute(text("SELECT 1"))
+          await asyncio.wait_for(ping(), settings.HEALTH_CHECK_TIMEOUT_SECONDS)
+          checks["database"] = True
+     except Exception as e:
+          logger.warning(f"Readiness check: database unavailable: {str(e)}")
+          checks["database"] = False
 
-                    db.add(jira_ticket)
+     ready = all(checks.values())
+     return JSONResponse(
+          status_code=200 if ready else 503,
+          content={"status": "ready" if ready else "not_ready", "checks": checks}
+     )
 
-          meeting.processed = True
-          job.status = 'completed'
-          job.progress = 100
-          job.message = f"Processing complete. Created {len(tickets)} tickets."
-          job.result = {
-               "transcription_confidence" : confidence,
-               "requirement_count" : len(requirements),
-               "ticket_count" : len(tickets)
-          }
-          db.commit()
-          logger.info(f"Meeting {meeting_id} processed successfully")
-     except Exception as e:
-          logger.error(f"Meeting processing failed: {str(e)}")
-          job.status = "failed"
-          job.message = f"Processing failed: {str(e)}"
-          db.commit()
-          raise e
-     finally:
-          db.close()
\ No newline at end of file
+@router.get('/metrics')
+async def get_metrics():
+     """
+     Counters and timings collected by this process
+     """
+     snapshot = metrics.snapshot()
+     snapshot["ratios"] = {
+          "response_cache_hit_ratio": metrics.ratio("response_cache_hits", "response_cache_misses"),
+          "jira_metadata_hit_ratio": metrics.ratio("jira_metadata_hits", "jira_metadata_misses")
+     }
+     return snapshot
@@ -1,19 +1,77 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+import asyncio
 import uvicorn
 import os
+import time
 from app.config import settings
 from app.utils.logger import logger
+from app.models.database import async_engine
+from app.services.events import bus_reaches_workers, get_event_bus
+from app.services.response_cache import get_response_cache
 from app.api.routes import router
 
+
+async def warm_up(app: FastAPI, in_process_worker: bool):
+     """
+     Preload what the first requests would otherwise wait for. Runs in the
+     background; /health/ready reports not ready until it is done.
+     """
+     from fastapi.concurrency import run_in_threadpool
+     from app.services.jira_service import get_jira_service
+
+     started = time.perf_counter()
+     try:
+          await get_jira_service().get_projects()
+          if in_process_worker:
+               from app.services.extraction import get_extraction_service
+               from app.services.transcription import get_transcription_service
+               get_extraction_service()
+               await run_in_threadpool(get_transcription_service)
+     except Exception as e:
+          logger.error(f"Warm-up failed: {str(e)}")
+     finally:
+          app.state.ready = True
+          logger.info(f"Warm-up finished in {time.perf_counter() - started:.1f}s")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
      logger.info("Starting Meeting-to-Jira System")
      os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
 
+     in_process_worker = settings.JOB_QUEUE_BACKEND.lower() == "memory"
+     if not bus_reaches_workers():
+          logger.warning(
+               f"EVENT_BUS_BACKEND={settings.EVENT_BUS_BACKEND} can't carry progress from separate "
+               f"workers (JOB_QUEUE_BACKEND={settings.JOB_QUEUE_BACKEND}); event streams fall back to "
+               f"re-reading the job every {settings.EVENTS_FALLBACK_POLL_SECONDS:.0f}s. Use the redis event bus."
+          )
+     app.state.ready = not settings.STARTUP_WARMUP
+     warm_up_task = asyncio.create_task(warm_up(app, in_process_worker)) if settings.STARTUP_WARMUP else None
+
+     worker = None
+     worker_task = None
+     if in_process_worker:
+          # No broker to hand jobs to, so process them inside the API process
+          from app.services.job_queue import STAGES, get_job_queue
+          from app.worker import Worker, stage_concurrency
+          worker = Worker(get_job_queue(), stage_concurrency(list(STAGES)))
+          worker_task = asyncio.create_task(worker.run())
+
      yield
 
+     if warm_up_task:
+          warm_up_task.cancel()
+     if worker:
+          worker.stop()
+          await worker_task
+
+     await get_event_bus().close()
+     await get_response_cache().close()
+     await async_engine.dispose()
+
      logger.info("Shutting down Meeting-to-Jira System")
 
 
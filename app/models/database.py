@@ -1,8 +1,11 @@
-from sqlalchemy import String, Float, Text, Boolean, DateTime, JSON, Integer, create_engine
-from sqlalchemy.orm import declarative_base, mapped_column, sessionmaker
+from sqlalchemy import String, Float, Text, Boolean, DateTime, JSON, Integer, Index, ForeignKey, create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base, mapped_column, relationship, sessionmaker
 import uuid
 from datetime import datetime, timezone
 from app.config import settings
+from app.utils.metrics import metrics
 
 Base = declarative_base()
 
@@ -13,6 +16,7 @@ class Meeting(Base):
      filename = mapped_column(String, nullable=False)
      original_filename = mapped_column(String, nullable=False)
      file_path = mapped_column(String, nullable=False)
+     content_hash = mapped_column(String)
      duration = mapped_column(Float)
      transcription_text = mapped_column(Text)
      transcription_confidence = mapped_column(Float)
@@ -20,11 +24,34 @@ class Meeting(Base):
      created_at = mapped_column(DateTime, default=lambda : datetime.now(timezone.utc))
      updated_at = mapped_column(DateTime, default=lambda : datetime.now(timezone.utc), onupdate=lambda : datetime.now(timezone.utc))
 
+     requirements = relationship("Requirement", order_by="Requirement.created_at", passive_deletes=True)
+     job = relationship("ProcessingJob", uselist=False, passive_deletes=True)
+
+     __table_args__ = (
+          # Keyset pagination of GET /meetings
+          Index("ix_meetings_created_at_id", "created_at", "id"),
+     )
+
+class TranscriptSegment(Base):
+     __tablename__ = "transcript_segments"
+
+     id = mapped_column(String, primary_key=True, default=lambda : str(uuid.uuid4()))
+     meeting_id = mapped_column(String, ForeignKey("meetings.id", ondelete="CASCADE"), nullable=False)
+     position = mapped_column(Integer, nullable=False)
+     start = mapped_column(Float, nullable=False)
+     end = mapped_column(Float, nullable=False)
+     text = mapped_column(Text, nullable=False)
+     created_at = mapped_column(DateTime, default=lambda : datetime.now(timezone.utc))
+
+     __table_args__ = (
+          Index("ix_transcript_segments_meeting_id_position", "meeting_id", "position", unique=True),
+     )
+
 class Requirement(Base):
      __tablename__ = "requirements"
 
      id = mapped_column(String, primary_key=True, default=lambda : str(uuid.uuid4()))
-     meeting_id = mapped_column(String, nullable=False)
+     meeting_id = mapped_column(String, ForeignKey("meetings.id", ondelete="CASCADE"), nullable=False, index=True)
      text = mapped_column(Text, nullable=False)
      summary=mapped_column(String, nullable=False)
      description=mapped_column(Text)
@@ -35,13 +62,16 @@ class Requirement(Base):
      confidence=mapped_column(Float)
      timestamp=mapped_column(String)
      jira_ticket_key=mapped_column(String)
+     jira_error=mapped_column(Text)
      created_at=mapped_column(DateTime, default=lambda : datetime.now(timezone.utc))
 
+     tickets = relationship("JiraTicket", passive_deletes=True)
+
 class JiraTicket(Base):
      __tablename__="jira_tickets"
 
      id=mapped_column(String, primary_key=True, default=lambda : str(uuid.uuid4()))
-     requirement_id=mapped_column(String, nullable=False)
+     requirement_id=mapped_column(String, ForeignKey("requirements.id", ondelete="CASCADE"), nullable=False, index=True)
      ticket_key=mapped_column(String, nullable=False)
      url=mapped_column(String, nullable=False)
      summary=mapped_column(String, nullable=False)
@@ -52,21 +82,76 @@ class ProcessingJob(Base):
      __tablename__="processing_jobs"
 
      id=mapped_column(String, primary_key=True, default=lambda : str(uuid.uuid4()))
-     meeting_id=mapped_column(String, nullable=False)
+     meeting_id=mapped_column(String, ForeignKey("meetings.id", ondelete="CASCADE"), nullable=False, index=True)
      status=mapped_column(String, nullable=False)
+     stage=mapped_column(String, default="transcribe", nullable=False)
+     stages=mapped_column(JSON)
      progress=mapped_column(Integer, default=0)
      message=mapped_column(String)
      result=mapped_column(JSON)
+     payload=mapped_column(JSON)
+     attempts=mapped_column(Integer, default=0, nullable=False)
+     max_attempts=mapped_column(Integer, default=3, nullable=False)
+     run_after=mapped_column(DateTime)
+     lease_expires_at=mapped_column(DateTime)
+     worker_id=mapped_column(String)
      created_at=mapped_column(DateTime, default=lambda : datetime.now(timezone.utc))
      updated_at=mapped_column(DateTime, default=lambda : datetime.now(timezone.utc), onupdate=lambda : datetime.now(timezone.utc))
 
-engine = create_engine(settings.DATABASE_URL)
+     __table_args__ = (
+          # Workers look for due jobs at the stages they serve
+          Index("ix_processing_jobs_stage_status", "stage", "status"),
+     )
+
+def _async_url(url: str) -> str:
+     """
+     Async driver for DATABASE_URL: asyncpg for Postgres, aiosqlite for SQLite
+     """
+     parsed = make_url(url)
+     if parsed.get_backend_name() == "postgresql":
+          return parsed.set(drivername="postgresql+asyncpg").render_as_string(hide_password=False)
+     if parsed.get_backend_name() == "sqlite":
+          return parsed.set(drivername="sqlite+aiosqlite").render_as_string(hide_password=False)
+     return url
+
+
+def _engine_options(url: str) -> dict:
+     options = {
+          "pool_pre_ping": settings.DB_POOL_PRE_PING,
+          "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS
+     }
+     # SQLite gets a single-connection pool from SQLAlchemy, sizing doesn't apply
+     if make_url(url).get_backend_name() != "sqlite":
+          options.update(
+               pool_size=settings.DB_POOL_SIZE,
+               max_overflow=settings.DB_MAX_OVERFLOW,
+               pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS
+          )
+     return options
+
+
+# Sync engine for the worker, job queue and migrations
+engine = create_engine(settings.DATABASE_URL, **_engine_options(settings.DATABASE_URL))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine for the API, so DB round trips don't block the event loop
+async_engine = create_async_engine(
+     _async_url(settings.DATABASE_URL), **_engine_options(settings.DATABASE_URL)
+)
+AsyncSessionLocal = async_sessionmaker(
+     async_engine, autoflush=False, expire_on_commit=False, class_=AsyncSession
+)
+
+
+def _count_query(*args):
+     metrics.increment("db_queries")
+
+
+# Statement counts for /metrics, e.g. to see what the response cache saves
+event.listen(engine, "before_cursor_execute", _count_query)
+event.listen(async_engine.sync_engine, "before_cursor_execute", _count_query)
+
 
-def get_db():
-     db = SessionLocal()
-     try:
-          yield db
-     finally:
-          db.close()
\ No newline at end of file
+async def get_db():
+     async with AsyncSessionLocal() as db:
+          yield db
\ No newline at end of file
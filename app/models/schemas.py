@@ -55,6 +55,10 @@ class JiraTicketResponse(BaseModel):
      status: str
      created_at: datetime
 
+class JiraTicketResult(BaseModel):
+     ticket: Optional[JiraTicketResponse] = None
+     error: Optional[str] = None
+
 class ProcessingJob(BaseModel):
      id: str
      status: str
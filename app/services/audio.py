@@ -0,0 +1,57 @@
+import subprocess
+from typing import List
+import numpy as np
+from app.config import settings
+
+# Whisper works on 16 kHz mono audio
+SAMPLE_RATE = 16000
+
+# Bit rate for uploads to hosted transcription; keeps an hour of speech
+# well under OpenAI's 25 MB limit
+UPLOAD_BITRATE = "64k"
+
+
+def _run_ffmpeg(file_path: str, output_args: List[str], sampling_rate: int) -> bytes:
+     """
+     Run ffmpeg on the first audio stream of file_path, downmixed to mono at
+     sampling_rate, and return what it writes to stdout. Video, subtitle and
+     data streams are skipped instead of being demuxed and decoded.
+     """
+     command = [
+          settings.FFMPEG_BINARY, "-nostdin", "-hide_banner", "-loglevel", "error",
+          "-i", file_path,
+          "-vn", "-sn", "-dn", "-map", "0:a:0",
+          "-ac", "1", "-ar", str(sampling_rate),
+          *output_args, "pipe:1"
+     ]
+     try:
+          process = subprocess.run(command, capture_output=True, check=True)
+     except FileNotFoundError:
+          raise Exception(f"ffmpeg not found: {settings.FFMPEG_BINARY}")
+     except subprocess.CalledProcessError as e:
+          raise Exception(f"Audio decoding failed: {e.stderr.decode(errors='replace').strip()}")
+
+     if not process.stdout:
+          raise Exception(f"No audio decoded from {file_path}")
+     return process.stdout
+
+
+def decode_audio(file_path: str, sampling_rate: int = SAMPLE_RATE) -> np.ndarray:
+     """
+     Decode any supported recording to mono float32 PCM in a single ffmpeg
+     pass. The samples come back over a pipe, nothing is written to disk.
+     """
+     return np.frombuffer(
+          _run_ffmpeg(file_path, ["-f", "f32le", "-acodec", "pcm_f32le"], sampling_rate),
+          dtype=np.float32
+     )
+
+
+def encode_for_upload(file_path: str, sampling_rate: int = SAMPLE_RATE) -> bytes:
+     """
+     16 kHz mono MP3 of a recording for hosted transcription, encoded in the
+     same single pass and returned in memory. Blocking: run it in a thread.
+     """
+     return _run_ffmpeg(
+          file_path, ["-f", "mp3", "-acodec", "libmp3lame", "-b:a", UPLOAD_BITRATE], sampling_rate
+     )
@@ -0,0 +1,163 @@
+import asyncio
+import json
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import AsyncIterator, Dict, Optional, Set
+from app.config import settings
+from app.models.database import ProcessingJob
+from app.utils.logger import logger
+
+# Slow subscribers only need the latest progress, older events are dropped
+SUBSCRIBER_BUFFER = 32
+
+
+def job_event(job: ProcessingJob) -> dict:
+     return {
+          "meeting_id": job.meeting_id,
+          "job_id": job.id,
+          "status": job.status,
+          "stage": job.stage,
+          "progress": job.progress,
+          "message": job.message
+     }
+
+
+class Subscription:
+     def __init__(self):
+          self.queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_BUFFER)
+
+     def put(self, event: dict):
+          if self.queue.full():
+               self.queue.get_nowait()
+          self.queue.put_nowait(event)
+
+     async def next(self, timeout: float) -> Optional[dict]:
+          """
+          Next event, or None if nothing arrived within timeout
+          """
+          try:
+               return await asyncio.wait_for(self.queue.get(), timeout)
+          except asyncio.TimeoutError:
+               return None
+
+
+class EventBus:
+     """
+     Fans job progress out to the clients watching a meeting. In-process by
+     default; the Redis backend carries events from separate worker
+     processes. Delivery is best effort, the processing_jobs row stays the
+     source of truth.
+     """
+
+     def __init__(self):
+          self._subscriptions: Dict[str, Set[Subscription]] = defaultdict(set)
+
+     async def publish(self, meeting_id: str, event: dict) -> None:
+          self._dispatch(meeting_id, event)
+
+     def _dispatch(self, meeting_id: str, event: dict):
+          for subscription in list(self._subscriptions.get(meeting_id, ())):
+               subscription.put(event)
+
+     @asynccontextmanager
+     async def subscribe(self, meeting_id: str) -> AsyncIterator[Subscription]:
+          subscription = Subscription()
+          self._subscriptions[meeting_id].add(subscription)
+          try:
+               yield subscription
+          finally:
+               subscribers = self._subscriptions.get(meeting_id)
+               if subscribers is not None:
+                    subscribers.discard(subscription)
+                    if not subscribers:
+                         del self._subscriptions[meeting_id]
+
+     async def close(self) -> None:
+          pass
+
+
+class RedisEventBus(EventBus):
+     """
+     Publishes to a Redis channel per meeting. Each process keeps a single
+     pattern subscription and fans events out to its local subscribers, so
+     open streams don't each hold a Redis connection.
+     """
+
+     def __init__(self, url: str, prefix: str):
+          super().__init__()
+          import redis.asyncio as redis
+          self.redis = redis.from_url(url, decode_responses=True)
+          self.prefix = prefix
+          self._listener: Optional[asyncio.Task] = None
+
+     async def publish(self, meeting_id: str, event: dict) -> None:
+          await self.redis.publish(f"{self.prefix}:{meeting_id}", json.dumps(event))
+
+     @asynccontextmanager
+     async def subscribe(self, meeting_id: str) -> AsyncIterator[Subscription]:
+          if self._listener is None or self._listener.done():
+               self._listener = asyncio.create_task(self._listen())
+          async with super().subscribe(meeting_id) as subscription:
+               yield subscription
+
+     async def _listen(self):
+          while True:
+               pubsub = self.redis.pubsub()
+               try:
+                    await pubsub.psubscribe(f"{self.prefix}:*")
+                    async for message in pubsub.listen():
+                         if message["type"] != "pmessage":
+                              continue
+                         meeting_id = message["channel"][len(self.prefix) + 1:]
+                         self._dispatch(meeting_id, json.loads(message["data"]))
+               except asyncio.CancelledError:
+                    raise
+               except Exception as e:
+                    logger.error(f"Event bus subscription failed, reconnecting: {str(e)}")
+                    await asyncio.sleep(1)
+               finally:
+                    await pubsub.aclose()
+
+     async def close(self) -> None:
+          if self._listener:
+               self._listener.cancel()
+          await self.redis.aclose()
+
+
+@lru_cache
+def get_event_bus() -> EventBus:
+     if settings.EVENT_BUS_BACKEND.lower() == "redis":
+          logger.info("Using Redis event bus")
+          return RedisEventBus(settings.REDIS_URL, settings.EVENTS_CHANNEL_PREFIX)
+     return EventBus()
+
+
+def bus_reaches_workers() -> bool:
+     """
+     Whether worker progress arrives on this process's bus: always with
+     Redis, and with the in-process bus only when jobs run in-process too
+     """
+     return (
+          settings.EVENT_BUS_BACKEND.lower() == "redis"
+          or settings.JOB_QUEUE_BACKEND.lower() == "memory"
+     )
+
+
+def stream_check_interval() -> float:
+     """
+     How long an event stream waits for an event before re-reading the job row
+     """
+     if bus_reaches_workers():
+          return settings.EVENTS_KEEPALIVE_SECONDS
+     return min(settings.EVENTS_FALLBACK_POLL_SECONDS, settings.EVENTS_KEEPALIVE_SECONDS)
+
+
+async def publish_job(job: ProcessingJob) -> None:
+     """
+     Push the job's current progress to watchers of its meeting
+     """
+     try:
+          await get_event_bus().publish(job.meeting_id, job_event(job))
+     except Exception as e:
+          logger.warning(f"Failed to publish progress for job {job.id}: {str(e)}")
@@ -1,31 +1,213 @@
 from google import genai
 from google.genai import types
+from cachetools import TTLCache
+import asyncio
+import hashlib
 import json
 import re
-from typing import List
+from difflib import SequenceMatcher
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from app.config import settings
 from app.models.schemas import RequirementExtracted, RequirementType, Priority
 from app.utils.logger import logger
+from app.utils.metrics import metrics
+
+# Bump whenever _build_extraction_prompt changes so cached results are not reused
+PROMPT_VERSION = "2"
+EXTRACTION_MODEL = "gemini-2.5-flash"
+EXTRACTION_TEMPERATURE = 0.2
 
 
 class RequirementExtractionService:
      def __init__(self):
           self.client = genai.Client(api_key=settings.GEMINI_API_KEY)
+          self.cache = TTLCache(
+               maxsize=settings.EXTRACTION_CACHE_MAX_ENTRIES,
+               ttl=settings.EXTRACTION_CACHE_TTL_SECONDS
+          )
+          self._in_flight: Dict[str, asyncio.Future] = {}
+          self._semaphore = asyncio.Semaphore(settings.EXTRACTION_MAX_CONCURRENCY)
+
+     def _cache_key(self, transcription: str) -> str:
+          parts = [
+               self._clean_transcripton(transcription),
+               PROMPT_VERSION,
+               EXTRACTION_MODEL,
+               str(EXTRACTION_TEMPERATURE)
+          ]
+          return hashlib.sha256("\x00".join(parts).encode()).hexdigest()
 
      async def extract_requirements(self, transcription: str) -> List[RequirementExtracted]:
           """
-          Extract the requirements from meeting transcription
+          Extract the requirements from meeting transcription. Results are
+          cached per cleaned transcript, and concurrent calls for the same
+          transcript share a single Gemini request. Raises if Gemini failed
+          for any part of the transcript, so a partial list is never taken
+          for the meeting's requirements.
           """
+          key = self._cache_key(transcription)
+          while True:
+               cached = self.cache.get(key)
+               if cached is not None:
+                    metrics.increment("extraction_cache_hits")
+                    return [req.model_copy(deep=True) for req in cached]
+
+               in_flight = self._in_flight.get(key)
+               if in_flight is None:
+                    break
+
+               metrics.increment("extraction_coalesced")
+               try:
+                    requirements = await asyncio.shield(in_flight)
+                    return [req.model_copy(deep=True) for req in requirements]
+               except asyncio.CancelledError:
+                    if not in_flight.cancelled():
+                         raise
+                    # The caller that owned the request was cancelled; take over
+
+          metrics.increment("extraction_cache_misses")
+          future = asyncio.get_running_loop().create_future()
+          self._in_flight[key] = future
           try:
-               prompt = self._build_extraction_prompt(transcription)
-               response = self.client.models.generate_content(
-                    model="gemini-2.5-flash",
-                    contents=prompt,
-                    config=types.GenerateContentConfig(
-                         temperature=0.2,
-                         response_mime_type="application/json",
-                    )
+               requirements, ok = await self._extract(transcription)
+               if not ok:
+                    raise Exception("Requirement extraction with Gemini failed")
+               self.cache[key] = requirements
+               future.set_result(requirements)
+               return [req.model_copy(deep=True) for req in requirements]
+          except BaseException:
+               future.cancel()
+               raise
+          finally:
+               self._in_flight.pop(key, None)
+
+     async def _extract(self, transcription: str) -> Tuple[List[RequirementExtracted], bool]:
+          """
+          Returns (requirements, ok); ok is False when Gemini failed for the
+          transcript or any chunk of it. Long transcripts are split into
+          overlapping chunks that are extracted concurrently (map) and then
+          merged with near-duplicates collapsed (reduce).
+          """
+          chunks = self._split_transcript(transcription)
+          if len(chunks) == 1:
+               return await self._extract_chunk(transcription)
+
+          logger.info(f"Extracting requirements from {len(chunks)} transcript chunks")
+          results = await asyncio.gather(*(
+               self._extract_chunk(chunk, part=(i, len(chunks)))
+               for i, chunk in enumerate(chunks, 1)
+          ))
+
+          requirements = [req for chunk_requirements, _ in results for req in chunk_requirements]
+          ok = all(chunk_ok for _, chunk_ok in results)
+          return self._deduplicate(requirements), ok
+
+     def _split_transcript(self, transcription: str) -> List[str]:
+          """
+          Split on segment lines (timestamped transcripts) or sentences into
+          chunks of about EXTRACTION_CHUNK_CHARS, each starting with the last
+          EXTRACTION_CHUNK_OVERLAP_CHARS of the previous one
+          """
+          if len(transcription) <= settings.EXTRACTION_CHUNK_CHARS:
+               return [transcription]
+
+          if "\n" in transcription.strip():
+               units = [line for line in transcription.splitlines() if line.strip()]
+          else:
+               units = re.split(r'(?<=[.!?])\s+', transcription)
+
+          chunks = []
+          current: List[str] = []
+          size = 0
+          for unit in units:
+               if current and size + len(unit) > settings.EXTRACTION_CHUNK_CHARS:
+                    chunks.append("\n".join(current))
+
+                    overlap: List[str] = []
+                    overlap_size = 0
+                    for previous in reversed(current):
+                         if overlap_size >= settings.EXTRACTION_CHUNK_OVERLAP_CHARS:
+                              break
+                         overlap.insert(0, previous)
+                         overlap_size += len(previous) + 1
+                    current, size = overlap, overlap_size
+
+               current.append(unit)
+               size += len(unit) + 1
+
+          if current:
+               chunks.append("\n".join(current))
+          return chunks
+
+     def _deduplicate(self, requirements: List[RequirementExtracted]) -> List[RequirementExtracted]:
+          """
+          Collapse requirements picked up from more than one chunk, keeping
+          the most confident one and merging labels and acceptance criteria
+          """
+          merged: List[RequirementExtracted] = []
+          for req in requirements:
+               duplicate = next(
+                    (kept for kept in merged
+                     if self._similarity(kept, req) >= settings.EXTRACTION_DEDUP_THRESHOLD),
+                    None
                )
+               if duplicate is None:
+                    merged.append(req)
+                    continue
+
+               best = req if req.confidence > duplicate.confidence else duplicate
+               other = duplicate if best is req else req
+               best = best.model_copy(update={
+                    "labels": list(dict.fromkeys(best.labels + other.labels)),
+                    "acceptance_criteria": list(dict.fromkeys(best.acceptance_criteria + other.acceptance_criteria)),
+                    "timestamp": min(filter(None, [best.timestamp, other.timestamp]), default=None)
+               })
+               merged[merged.index(duplicate)] = best
+
+          if len(merged) < len(requirements):
+               logger.info(f"Merged {len(requirements) - len(merged)} duplicate requirements across chunks")
+          return merged
+
+     def _similarity(self, a: RequirementExtracted, b: RequirementExtracted) -> float:
+          """
+          Fuzzy match on the summaries (edit ratio) and on the quoted
+          transcript text (token overlap), whichever is stronger
+          """
+          def normalize(text: str) -> str:
+               return re.sub(r'[^a-z0-9 ]', '', (text or '').lower()).strip()
+
+          def tokens(text: str) -> set:
+               return set(normalize(text).split())
+
+          summary_ratio = SequenceMatcher(None, normalize(a.summary), normalize(b.summary)).ratio()
+
+          a_tokens, b_tokens = tokens(a.text), tokens(b.text)
+          text_overlap = (
+               len(a_tokens & b_tokens) / len(a_tokens | b_tokens)
+               if a_tokens and b_tokens else 0.0
+          )
+          return max(summary_ratio, text_overlap)
+
+     async def _extract_chunk(
+          self,
+          transcription: str,
+          part: Optional[Tuple[int, int]] = None
+     ) -> Tuple[List[RequirementExtracted], bool]:
+          try:
+               prompt = self._build_extraction_prompt(transcription, part)
+               async with self._semaphore:
+                    response = await asyncio.wait_for(
+                         self.client.aio.models.generate_content(
+                              model=EXTRACTION_MODEL,
+                              contents=prompt,
+                              config=types.GenerateContentConfig(
+                                   temperature=EXTRACTION_TEMPERATURE,
+                                   response_mime_type="application/json",
+                              )
+                         ),
+                         timeout=settings.EXTRACTION_TIMEOUT_SECONDS
+                    )
 
                content = response.text
                requirement_data = json.loads(content)
@@ -48,13 +230,22 @@ class RequirementExtractionService:
                     except Exception as e:
                          logger.warning(f"Failed to parse single requirement: {req_data}. Error: {e}")
                     
-               return requirements
+               return requirements, True
+          except asyncio.TimeoutError:
+               logger.error(f"Requirement extraction with Gemini timed out after {settings.EXTRACTION_TIMEOUT_SECONDS}s")
+               metrics.increment("extraction_timeouts")
+               return [], False
           except Exception as e:
                logger.error(f"Requirement extraction with Gemini failed: {str(e)}")
-               return []
+               return [], False
      
-     def _build_extraction_prompt(self, transcription: str) -> str:
+     def _build_extraction_prompt(self, transcription: str, part: Optional[Tuple[int, int]] = None) -> str:
           cleaned_text = self._clean_transcripton(transcription)
+          part_note = (
+               f"\nThis is part {part[0]} of {part[1]} of a longer meeting; the start may repeat the end of the previous part. "
+               "Only extract requirements discussed in this part.\n"
+               if part else ""
+          )
           return f"""
 You are an expert business analyst AI specialized in extracting software requirements from meeting transcriptions. 
 Your task is to analyze the following transcription and identify all actionable software requirements.
@@ -85,7 +276,7 @@ Here is the JSON structure for each requirement:
 }}
 
 Here is the meeting transcription to analyze:
-
+{part_note}
 --- TRANSCRIPT ---
 {cleaned_text}
 --- END TRANSCRIPT ---
@@ -104,4 +295,9 @@ Now, provide the JSON object.
                'gotta': 'got to'
           } [m.group().lower()], text, flags=re.IGNORECASE)
 
-          return text.strip()
\ No newline at end of file
+          return text.strip()
+
+
+@lru_cache
+def get_extraction_service() -> RequirementExtractionService:
+     return RequirementExtractionService()
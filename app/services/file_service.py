@@ -1,6 +1,8 @@
 import os
 import aiofiles
+import hashlib
 import uuid
+from functools import lru_cache
 from fastapi import UploadFile
 from app.config  import settings
 from app.utils.logger import logger
@@ -13,22 +15,37 @@ class FileService:
 
      async def save_uploaded_file(self, file: UploadFile):
           """
-          Save uploaded file and return (file_path, unique_filename)
+          Stream uploaded file to disk in fixed-size chunks and return
+          (file_path, unique_filename, content_hash)
           """
-          try:
-               # Generate unique filename
-               file_ext = os.path.splitext(file.filename)[1].lower()
-               unique_filename = f"{uuid.uuid4()}{file_ext}"
-               file_path = os.path.join(self.upload_dir, unique_filename)
+          # Generate unique filename
+          file_ext = os.path.splitext(file.filename)[1].lower()
+          unique_filename = f"{uuid.uuid4()}{file_ext}"
+          file_path = os.path.join(self.upload_dir, unique_filename)
 
-               # Save file
+          hasher = hashlib.sha256()
+          total_size = 0
+          try:
                async with aiofiles.open(file_path, 'wb') as f:
-                    content = await file.read()
-                    await f.write(content)
+                    while True:
+                         chunk = await file.read(settings.UPLOAD_CHUNK_SIZE)
+                         if not chunk:
+                              break
+
+                         total_size += len(chunk)
+                         if total_size > settings.MAX_FILE_SIZE:
+                              raise ValueError(
+                                   f"File too large: exceeds {settings.MAX_FILE_SIZE} bytes"
+                              )
 
-               logger.info(f"File saved: {file_path}")
-               return file_path, unique_filename
+                         hasher.update(chunk)
+                         await f.write(chunk)
+
+               content_hash = hasher.hexdigest()
+               logger.info(f"File saved: {file_path} ({total_size} bytes, sha256={content_hash})")
+               return file_path, unique_filename, content_hash
           except Exception as e:
+               await self.delete_file(file_path)
                logger.error(f"Failed to save file: {str(e)}")
                raise Exception(f"Failed to save file: {str(e)}")
      
@@ -75,5 +92,6 @@ class FileService:
                return {'exits' : False}
 
 
-
-
+@lru_cache
+def get_file_service() -> FileService:
+     return FileService()
@@ -0,0 +1,165 @@
+import asyncio
+import time
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from fastapi.concurrency import run_in_threadpool
+from app.config import settings
+from app.services.jira_transport import get_jira_transport
+from app.utils.logger import logger
+from app.utils.metrics import metrics
+
+
+class MetadataCache:
+     """
+     TTL cache with stale-while-revalidate: fresh entries are served as is,
+     entries up to stale_seconds past their TTL are served immediately while a
+     single background task refreshes them, anything older is reloaded inline.
+     Concurrent loads of the same key share one request. A failed load is
+     remembered for failure_seconds, during which the key fails right away
+     (or keeps serving its stale value) instead of asking Jira again.
+     """
+
+     def __init__(self, ttl_seconds: float, stale_seconds: float, failure_seconds: float = 0.0):
+          self.ttl_seconds = ttl_seconds
+          self.stale_seconds = stale_seconds
+          self.failure_seconds = failure_seconds
+          self._entries: Dict[str, Tuple[Any, float]] = {}
+          self._failures: Dict[str, Tuple[Exception, float]] = {}
+          self._loading: Dict[str, asyncio.Task] = {}
+
+     async def get(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+          failure = self._failures.get(key)
+          if failure and time.monotonic() - failure[1] >= self.failure_seconds:
+               failure = None
+
+          entry = self._entries.get(key)
+          if entry:
+               value, fetched_at = entry
+               age = time.monotonic() - fetched_at
+               if age < self.ttl_seconds:
+                    metrics.increment("jira_metadata_hits")
+                    return value
+               if age < self.ttl_seconds + self.stale_seconds:
+                    metrics.increment("jira_metadata_stale_hits")
+                    if not failure:
+                         self._load(key, loader)
+                    return value
+
+          if failure:
+               metrics.increment("jira_metadata_failure_hits")
+               raise failure[0]
+
+          metrics.increment("jira_metadata_misses")
+          return await asyncio.shield(self._load(key, loader))
+
+     def _load(self, key: str, loader: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+          task = self._loading.get(key)
+          if task is None:
+               task = asyncio.create_task(self._refresh(key, loader))
+               # Background refreshes have no awaiter; the failure is already logged
+               task.add_done_callback(lambda t: t.cancelled() or t.exception())
+               self._loading[key] = task
+          return task
+
+     async def _refresh(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+          try:
+               value = await loader()
+               self._entries[key] = (value, time.monotonic())
+               self._failures.pop(key, None)
+               return value
+          except Exception as e:
+               logger.error(f"Failed to refresh Jira metadata '{key}': {str(e)}")
+               self._failures[key] = (e, time.monotonic())
+               raise
+          finally:
+               self._loading.pop(key, None)
+
+     def age(self, key: str) -> Optional[float]:
+          entry = self._entries.get(key)
+          return time.monotonic() - entry[1] if entry else None
+
+
+class JiraMetadataService:
+     """
+     Cached projects, issue types and assignable users, so the /projects
+     endpoint and upload-time validation don't hit Jira on every request
+     """
+
+     def __init__(self):
+          self.transport = get_jira_transport()
+          self.cache = MetadataCache(
+               settings.JIRA_METADATA_TTL_SECONDS,
+               settings.JIRA_METADATA_STALE_SECONDS,
+               settings.JIRA_METADATA_FAILURE_TTL_SECONDS
+          )
+
+     async def _call(self, fn: Callable[[], Any]) -> Any:
+          # Requests wait on these, so give up quickly instead of backing off
+          # for as long as ticket creation would
+          deadline = time.monotonic() + settings.JIRA_METADATA_TIMEOUT_SECONDS
+          return await run_in_threadpool(self.transport.call, fn, deadline=deadline)
+
+     async def get_projects(self) -> List[dict]:
+          async def load():
+               projects = await self._call(lambda: self.transport.client.projects())
+               return [{'key': p.key, 'name': p.name} for p in projects]
+
+          return await self.cache.get("projects", load)
+
+     async def get_issue_types(self, project_key: str) -> List[str]:
+          async def load():
+               project = await self._call(lambda: self.transport.client.project(project_key))
+               return [issue_type.name for issue_type in getattr(project, 'issueTypes', [])]
+
+          return await self.cache.get(f"issue_types:{project_key}", load)
+
+     async def get_assignable_users(self, project_key: str) -> List[dict]:
+          async def load():
+               users = await self._call(lambda: self.transport.client._get_json(
+                    'user/assignable/search', params={'project': project_key, 'maxResults': 1000}
+               ))
+               return [
+                    {
+                         'name': user.get('name') or user.get('accountId'),
+                         'display_name': user.get('displayName'),
+                         'account_id': user.get('accountId')
+                    }
+                    for user in users
+               ]
+
+          return await self.cache.get(f"assignable_users:{project_key}", load)
+
+     async def validate_project(self, project_key: str, issue_type: Optional[str] = None):
+          """
+          Raise ValueError if the project (or the issue type in it) doesn't
+          exist. If Jira can't be reached the check is skipped; ticket
+          creation retries and reports failures on its own.
+          """
+          try:
+               projects = await self.get_projects()
+          except Exception as e:
+               logger.warning(f"Skipping Jira project validation, Jira unavailable: {str(e)}")
+               return
+
+          if project_key not in {p['key'] for p in projects}:
+               raise ValueError(f"Unknown Jira project: {project_key}")
+
+          if issue_type:
+               issue_types = await self.get_available_issue_types(project_key)
+               if issue_types is not None and issue_type not in issue_types:
+                    raise ValueError(f"Issue type '{issue_type}' is not available in project {project_key}")
+
+     async def get_available_issue_types(self, project_key: str) -> Optional[List[str]]:
+          """
+          Issue types of the project, or None if they can't be fetched
+          """
+          try:
+               return await self.get_issue_types(project_key)
+          except Exception as e:
+               logger.warning(f"Could not fetch issue types for {project_key}: {str(e)}")
+               return None
+
+
+@lru_cache
+def get_jira_metadata() -> JiraMetadataService:
+     return JiraMetadataService()
@@ -1,47 +1,120 @@
-from jira import JIRA
+from jira import JIRA, JIRAError
+from fastapi.concurrency import run_in_threadpool
+from requests.exceptions import Timeout
 import asyncio
 import datetime
-from typing import List, Optional
+import json
+import time
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from app.config import settings
+from app.services.jira_metadata import get_jira_metadata
+from app.services.jira_transport import get_jira_transport
 from app.utils.logger import logger
-from app.models.schemas import JiraTicketCreate, JiraTicketResponse, RequirementExtracted
+from app.models.schemas import JiraTicketCreate, JiraTicketResponse, JiraTicketResult, RequirementExtracted, RequirementType
+
+DEFAULT_ISSUE_TYPE = 'Task'
+
+
+def requirement_to_extracted(requirement) -> RequirementExtracted:
+     """
+     Rebuild the extraction result from a stored Requirement row
+     """
+     return RequirementExtracted(
+          text=requirement.text,
+          summary=requirement.summary,
+          description=requirement.description or "",
+          type=RequirementType(requirement.requirement_type),
+          priority=requirement.priority,
+          labels=requirement.labels or [],
+          acceptance_criteria=requirement.acceptance_criteria or [],
+          confidence=requirement.confidence or 0.0,
+          timestamp=requirement.timestamp
+     )
 
 class JiraService:
      def __init__(self):
-          self.jira = JIRA(
-               server= settings.JIRA_SERVER,
-               basic_auth=(settings.JIRA_EMAIL, settings.JIRA_API_TOKEN)
-          )
+          self.transport = get_jira_transport()
+          self.metadata = get_jira_metadata()
+          self._semaphore = asyncio.Semaphore(settings.JIRA_MAX_CONCURRENCY)
+
+     @property
+     def jira(self) -> JIRA:
+          """
+          Shared, lazily connected client. Only touch it from the threadpool.
+          """
+          return self.transport.client
 
      async def create_ticket(self, ticket_data: JiraTicketCreate) -> JiraTicketResponse:
           """
-          Create a single Jira ticket
+          Create a single Jira ticket. The blocking Jira client call runs in
+          the threadpool; no attempt starts after JIRA_TICKET_TIMEOUT_SECONDS
+          and each request is bounded by the session's HTTP timeout. The
+          thread is never abandoned, so the caller's concurrency slot is held
+          until the request really ends.
           """
           try:
-               issue_dict = {
-                    'project': {'key': ticket_data.project_key},
-                    'summary': ticket_data.summary,
-                    'description': ticket_data.description,
-                    'issuetype': {'name': ticket_data.issue_type},
-                    #  'priority': {'name': ticket_data.priority},
-                    'labels': ticket_data.labels
-               }
-
-               if ticket_data.assignee:
-                    issue_dict['assignee'] = {'name': ticket_data.assignee}
-
-               new_issue = self.jira.create_issue(fields=issue_dict)
+               issue_dict = self._build_issue_fields(ticket_data)
+
+               # Just the POST: with prefetch the client also GETs the issue, and
+               # a 429 on that GET would make the transport create it again
+               new_issue = await run_in_threadpool(
+                    self.transport.call,
+                    lambda: self.jira.create_issue(fields=issue_dict, prefetch=False),
+                    deadline=self._deadline(),
+                    idempotent=False
+               )
+               statuses = await run_in_threadpool(self._fetch_statuses, [new_issue.key])
                return JiraTicketResponse(
                     key=new_issue.key,
                     url=f"{settings.JIRA_SERVER}/browse/{new_issue.key}",
                     summary=ticket_data.summary,
-                    status=str(new_issue.fields.status),
+                    status=statuses.get(new_issue.key, 'Created'),
                     created_at=datetime.datetime.now()
                )
+          except Timeout as e:
+               logger.error(f"Jira ticket creation timed out: {str(e)}")
+               raise Exception(f"Failed to create Jira ticket: timed out ({str(e)})")
           except Exception as e:
                logger.error(f"Failed to create Jira ticket: {str(e)}")
                raise Exception(f"Failed to create Jira ticket: {str(e)}")
-     
+
+     def _deadline(self) -> float:
+          # Stop scheduling retries once the per-call timeout would be blown
+          return time.monotonic() + settings.JIRA_TICKET_TIMEOUT_SECONDS
+
+     def _build_issue_fields(self, ticket_data: JiraTicketCreate) -> dict:
+          issue_dict = {
+               'project': {'key': ticket_data.project_key},
+               'summary': ticket_data.summary,
+               'description': ticket_data.description,
+               'issuetype': {'name': ticket_data.issue_type},
+               #  'priority': {'name': ticket_data.priority},
+               'labels': ticket_data.labels
+          }
+
+          if ticket_data.assignee:
+               issue_dict['assignee'] = {'name': ticket_data.assignee}
+
+          return issue_dict
+
+     def _build_ticket_data(
+          self,
+          req: RequirementExtracted,
+          project_key: str,
+          assignee: Optional[str],
+          issue_types: Optional[List[str]] = None
+     ) -> JiraTicketCreate:
+          return JiraTicketCreate(
+               project_key=project_key,
+               summary=req.summary,
+               description=self._build_description(req),
+               issue_type=self._map_requirement_type(req.type, issue_types),
+               # priority=req.priority.value
+               labels=req.labels + ['meeting_derived', 'auto-generated'],
+               assignee=assignee
+          )
+
      async def create_tickets_from_requirements(
           self,
           requirements: List[RequirementExtracted],
@@ -51,33 +124,170 @@ class JiraService:
           """
           Create multiple Jira tickets from extracted requirements
           """
-          tickets = []
-          for req in requirements:
+          results = await self.create_tickets_for_requirements(requirements, project_key, assignee)
+          return [result.ticket for result in results if result.ticket]
+
+     async def create_tickets_for_requirements(
+          self,
+          requirements: List[RequirementExtracted],
+          project_key: str,
+          assignee: Optional[str] = None
+     ) -> List[JiraTicketResult]:
+          """
+          Create tickets for requirements, through the bulk endpoint when
+          JIRA_BULK_CREATE is on. The result lines up with requirements and
+          carries the error for every requirement that got no ticket.
+          """
+          issue_types = await self.metadata.get_available_issue_types(project_key)
+          tickets_data = [
+               self._build_ticket_data(req, project_key, assignee, issue_types) for req in requirements
+          ]
+          if settings.JIRA_BULK_CREATE:
+               return await self._create_tickets_bulk(tickets_data)
+          return await self._create_tickets_concurrently(tickets_data)
+
+     async def _create_tickets_concurrently(self, tickets_data: List[JiraTicketCreate]) -> List[JiraTicketResult]:
+          """
+          One request per ticket, at most JIRA_MAX_CONCURRENCY at a time
+          """
+          async def create(ticket_data: JiraTicketCreate) -> JiraTicketResult:
+               async with self._semaphore:
+                    try:
+                         ticket = await self.create_ticket(ticket_data)
+                         logger.info(f"Created Jira ticket: {ticket.key}")
+                         return JiraTicketResult(ticket=ticket)
+                    except Exception as e:
+                         logger.error(f"Failed to create ticket for requirement: {str(e)}")
+                         return JiraTicketResult(error=str(e))
+
+          return list(await asyncio.gather(*(create(data) for data in tickets_data)))
+
+     async def _create_tickets_bulk(self, tickets_data: List[JiraTicketCreate]) -> List[JiraTicketResult]:
+          """
+          Batches of up to JIRA_BULK_BATCH_SIZE issues per request. Items that
+          fail for a transient reason are resubmitted, on their own, up to
+          JIRA_BULK_MAX_RETRIES times; validation errors are not retried.
+          """
+          results: List[JiraTicketResult] = [JiraTicketResult() for _ in tickets_data]
+          pending = list(range(len(tickets_data)))
+
+          for attempt in range(settings.JIRA_BULK_MAX_RETRIES + 1):
+               if not pending:
+                    break
+               if attempt:
+                    logger.info(f"Retrying {len(pending)} failed Jira issues (attempt {attempt + 1})")
+                    await asyncio.sleep(min(2 ** attempt, 30))
+
+               batch_size = settings.JIRA_BULK_BATCH_SIZE
+               batches = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+               outcomes = await asyncio.gather(*(
+                    self._submit_bulk_batch([tickets_data[i] for i in batch]) for batch in batches
+               ))
+
+               pending = []
+               for batch, outcome in zip(batches, outcomes):
+                    for index, (ticket, error, retryable) in zip(batch, outcome):
+                         results[index] = JiraTicketResult(ticket=ticket, error=error)
+                         if error and retryable:
+                              pending.append(index)
+
+          created = sum(1 for result in results if result.ticket)
+          logger.info(f"Bulk created {created} of {len(tickets_data)} Jira tickets")
+          return results
+
+     async def _submit_bulk_batch(
+          self,
+          batch: List[JiraTicketCreate]
+     ) -> List[Tuple[Optional[JiraTicketResponse], Optional[str], bool]]:
+          """
+          One bulk-create call. Returns (ticket, error, retryable) per item,
+          in the order of batch.
+          """
+          async with self._semaphore:
                try:
-                    issue_type = self._map_requirement_type(req.type)
-                    description = self._build_description(req)
-
-                    ticket_data = JiraTicketCreate(
-                         project_key=project_key,
-                         summary=req.summary,
-                         description=description,
-                         issue_type=issue_type,
-                         # priority=req.priority.value
-                         labels=req.labels + ['meeting_derived', 'auto-generated'],
-                         assignee=assignee
+                    created, failed = await run_in_threadpool(
+                         self._post_bulk, [self._build_issue_fields(d) for d in batch]
                     )
-
-                    ticket = await self.create_ticket(ticket_data)
-                    tickets.append(ticket)
-                    logger.info(f"Created Jira ticket: {ticket.key}")
                except Exception as e:
-                    logger.error(f"Failed to create ticket for requirement: {str(e)}")
+                    # After a timeout, dropped connection or 5xx some issues may exist
+                    # already, so the batch is only resent if Jira never acted on it
+                    retryable = self.transport.safe_to_resend(e)
+                    logger.error(f"Jira bulk create of {len(batch)} issues failed: {str(e)}")
+                    return [(None, f"Failed to create Jira ticket: {str(e)}", retryable)] * len(batch)
+
+               # The issues exist now; a failed status lookup only costs their status
+               statuses = await run_in_threadpool(self._fetch_statuses, [issue['key'] for issue in created])
+
+          outcome = []
+          created_issues = iter(created)
+          for position, ticket_data in enumerate(batch):
+               if position in failed:
+                    message, retryable = failed[position]
+                    logger.error(f"Failed to create ticket for requirement: {message}")
+                    outcome.append((None, f"Failed to create Jira ticket: {message}", retryable))
                     continue
-          return tickets
 
-     def _map_requirement_type(self, req_type: str) -> str:
+               # Jira lists created issues in request order, skipping failed elements
+               issue = next(created_issues)
+               outcome.append((JiraTicketResponse(
+                    key=issue['key'],
+                    url=f"{settings.JIRA_SERVER}/browse/{issue['key']}",
+                    summary=ticket_data.summary,
+                    status=statuses.get(issue['key'], 'Created'),
+                    created_at=datetime.datetime.now()
+               ), None, False))
+          return outcome
+
+     def _post_bulk(self, field_list: List[dict]) -> Tuple[List[dict], Dict[int, Tuple[str, bool]]]:
           """
-          Map internal requirement types to Jira issue types
+          POST /rest/api/2/issue/bulk. Returns the created issues and the
+          failed element positions mapped to (message, retryable).
+          """
+          url = self.jira._get_url('issue/bulk')
+          payload = json.dumps({'issueUpdates': [{'fields': fields} for fields in field_list]})
+          try:
+               data = self.transport.call(
+                    lambda: self.jira._session.post(url, data=payload),
+                    deadline=self._deadline(),
+                    idempotent=False
+               ).json()
+          except JIRAError as e:
+               # Every element failed; the body still has the per-element errors
+               if e.response is None or not e.status_code or e.status_code == 429 or e.status_code >= 500:
+                    raise
+               data = e.response.json()
+
+          failed = {}
+          for error in data.get('errors', []):
+               element_errors = error.get('elementErrors', {})
+               messages = element_errors.get('errorMessages', []) + [
+                    f"{field}: {message}" for field, message in element_errors.get('errors', {}).items()
+               ]
+               status = error.get('status', 400)
+               failed[error.get('failedElementNumber')] = (
+                    "; ".join(messages) or f"HTTP {status}",
+                    status == 429 or status >= 500
+               )
+          return data.get('issues', []), failed
+
+     def _fetch_statuses(self, keys: List[str]) -> Dict[str, str]:
+          if not keys:
+               return {}
+          try:
+               issues = self.transport.call(
+                    self.jira.search_issues,
+                    f"key in ({','.join(keys)})", fields='status', maxResults=len(keys),
+                    deadline=self._deadline()
+               )
+               return {issue.key: str(issue.fields.status) for issue in issues}
+          except Exception as e:
+               logger.warning(f"Could not fetch status of created issues: {str(e)}")
+               return {}
+
+     def _map_requirement_type(self, req_type: str, issue_types: Optional[List[str]] = None) -> str:
+          """
+          Map internal requirement types to Jira issue types, falling back to
+          DEFAULT_ISSUE_TYPE when the project doesn't have the mapped one
           """
           mapping = {
                'feature': 'Story',
@@ -86,7 +296,10 @@ class JiraService:
                'story': 'Story',
                'epic': 'Epic'
           }
-          return mapping.get(req_type.lower(), 'Task')
+          issue_type = mapping.get(req_type.lower(), DEFAULT_ISSUE_TYPE)
+          if issue_types is not None and issue_type not in issue_types:
+               return DEFAULT_ISSUE_TYPE
+          return issue_type
 
      def _build_description(self, req: RequirementExtracted) -> str:
           """
@@ -112,11 +325,15 @@ class JiraService:
      
      async def get_projects(self) -> List[dict]:
           """
-          Get avialable Jira projects
+          Get avialable Jira projects, served from the metadata cache
           """
           try:
-               projects = self.jira.projects()
-               return [{'key': p.key, 'name': p.name} for p in projects]
+               return await self.metadata.get_projects()
           except Exception as e:
                logger.error(f"Failed to get the Jira projects: {str(e)}")
-               return []
\ No newline at end of file
+               return []
+
+
+@lru_cache
+def get_jira_service() -> JiraService:
+     return JiraService()
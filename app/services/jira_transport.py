@@ -0,0 +1,240 @@
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Callable, Optional
+from jira import JIRA, JIRAError
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError, ConnectTimeout, Timeout
+from urllib3.exceptions import NewConnectionError
+from app.config import settings
+from app.utils.logger import logger
+from app.utils.metrics import metrics
+
+# Atomic refill-and-take on a Redis hash so every worker draws from the same
+# bucket. Uses the Redis clock to stay immune to skew between hosts. Returns
+# "0" when a token was taken, otherwise the seconds to wait for the next one.
+_TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local data = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(data[1]) or capacity
+local ts = tonumber(data[2]) or now
+tokens = math.min(capacity, tokens + math.max(now - ts, 0) * rate)
+local wait = 0
+if tokens >= 1 then
+     tokens = tokens - 1
+else
+     wait = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return tostring(wait)
+"""
+
+
+class TokenBucket:
+     """
+     Thread-safe token bucket for the calls made by this process
+     """
+
+     def __init__(self, rate: float, capacity: int):
+          self.rate = rate
+          self.capacity = capacity
+          self.tokens = float(capacity)
+          self.updated = time.monotonic()
+          self._lock = threading.Lock()
+
+     def _take(self) -> float:
+          with self._lock:
+               now = time.monotonic()
+               self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+               self.updated = now
+               if self.tokens >= 1:
+                    self.tokens -= 1
+                    return 0.0
+               return (1 - self.tokens) / self.rate
+
+     def acquire(self):
+          while True:
+               wait = self._take()
+               if not wait:
+                    return
+               metrics.observe("jira_rate_limit_wait_seconds", wait)
+               time.sleep(wait)
+
+
+class RedisTokenBucket(TokenBucket):
+     """
+     Token bucket kept in Redis and shared by every API and worker process.
+     Falls back to a local bucket if Redis is unreachable.
+     """
+
+     def __init__(self, url: str, key: str, rate: float, capacity: int):
+          super().__init__(rate, capacity)
+          import redis
+          self.redis = redis.Redis.from_url(url)
+          self.key = key
+          self.script = self.redis.register_script(_TOKEN_BUCKET_SCRIPT)
+
+     def _take(self) -> float:
+          try:
+               return float(self.script(keys=[self.key], args=[self.rate, self.capacity]))
+          except Exception as e:
+               logger.warning(f"Shared Jira rate limiter unavailable, using local bucket: {str(e)}")
+               return super()._take()
+
+
+class JiraTransport:
+     """
+     Shared Jira client: one pooled HTTP session, a token-bucket limiter in
+     front of every call, and Retry-After aware exponential backoff on 429,
+     5xx and connection errors. Calls that create something only retry when
+     Jira can't have acted on the request. The client connects lazily on
+     first use.
+     """
+
+     RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+     def __init__(self):
+          self._client: Optional[JIRA] = None
+          self._lock = threading.Lock()
+          # Per request, so a single attempt can't outlive a ticket's budget
+          self.http_timeout = min(settings.JIRA_HTTP_TIMEOUT_SECONDS, settings.JIRA_TICKET_TIMEOUT_SECONDS)
+          if settings.JIRA_RATE_LIMITER.lower() == "redis":
+               self.limiter = RedisTokenBucket(
+                    settings.REDIS_URL, "jira:rate_limit",
+                    settings.JIRA_RATE_LIMIT_PER_SECOND, settings.JIRA_RATE_LIMIT_BURST
+               )
+          else:
+               self.limiter = TokenBucket(settings.JIRA_RATE_LIMIT_PER_SECOND, settings.JIRA_RATE_LIMIT_BURST)
+
+     @property
+     def client(self) -> JIRA:
+          if self._client is None:
+               with self._lock:
+                    if self._client is None:
+                         self._client = self._connect()
+          return self._client
+
+     def _connect(self) -> JIRA:
+          self.limiter.acquire()
+          client = JIRA(
+               server=settings.JIRA_SERVER,
+               basic_auth=(settings.JIRA_EMAIL, settings.JIRA_API_TOKEN),
+               # Retries are ours, so throttling is counted and shares the limiter
+               max_retries=0,
+               timeout=self.http_timeout
+          )
+          adapter = HTTPAdapter(
+               pool_connections=settings.JIRA_POOL_MAXSIZE,
+               pool_maxsize=settings.JIRA_POOL_MAXSIZE
+          )
+          client._session.mount("https://", adapter)
+          client._session.mount("http://", adapter)
+          self._limit_requests(client._session)
+          logger.info(f"Connected to Jira at {settings.JIRA_SERVER}")
+          return client
+
+     def _limit_requests(self, session):
+          """
+          Take a token for every HTTP request the session sends, so client
+          calls that make several requests are paced like single ones
+          """
+          send = session.request
+
+          def request(*args, **kwargs):
+               self.limiter.acquire()
+               metrics.increment("jira_requests")
+               return send(*args, **kwargs)
+
+          session.request = request
+
+     def call(
+          self,
+          fn: Callable,
+          *args,
+          deadline: Optional[float] = None,
+          idempotent: bool = True,
+          **kwargs
+     ):
+          """
+          Run a blocking Jira client call with rate limiting and retries.
+          No retry is scheduled past `deadline` (a time.monotonic() value).
+
+          With idempotent=False (issue creation) a read timeout or a 5xx may
+          come after Jira created the issue, so only 429s and errors raised
+          before the request went out are retried. fn must then make a single
+          request, or a 429 on a later one would repeat the first.
+          """
+          attempt = 0
+          while True:
+               if deadline is not None and time.monotonic() > deadline:
+                    # Nothing was sent, which callers can tell from a connect timeout
+                    raise ConnectTimeout("Jira call deadline passed before the request was sent")
+               try:
+                    return fn(*args, **kwargs)
+               except JIRAError as e:
+                    if e.status_code not in self.RETRYABLE_STATUS or not (idempotent or self.safe_to_resend(e)):
+                         raise
+                    if e.status_code == 429:
+                         metrics.increment("jira_throttled")
+                    delay = self._retry_after(e) or self._backoff(attempt)
+                    error = e
+               except (ConnectionError, Timeout) as e:
+                    if not (idempotent or self.safe_to_resend(e)):
+                         raise
+                    delay = self._backoff(attempt)
+                    error = e
+
+               attempt += 1
+               if attempt > settings.JIRA_MAX_RETRIES or (
+                    deadline is not None and time.monotonic() + delay > deadline
+               ):
+                    raise error
+
+               metrics.increment("jira_retries")
+               logger.warning(f"Jira call failed ({str(error)[:200]}), retry {attempt} in {delay:.1f}s")
+               time.sleep(delay)
+
+     def safe_to_resend(self, error: Exception) -> bool:
+          """
+          Whether a failed create can be sent again without risking a
+          duplicate: Jira throttled it, or it failed while connecting
+          """
+          if isinstance(error, JIRAError):
+               return error.status_code == 429
+          if isinstance(error, ConnectTimeout):
+               return True
+          if isinstance(error, Timeout) or not isinstance(error, ConnectionError):
+               return False
+          # requests wraps urllib3's MaxRetryError, whose reason is the cause
+          reason = error.args[0] if error.args else None
+          return isinstance(getattr(reason, "reason", reason), NewConnectionError)
+
+     def _backoff(self, attempt: int) -> float:
+          delay = min(settings.JIRA_BACKOFF_BASE_SECONDS * (2 ** attempt), settings.JIRA_BACKOFF_MAX_SECONDS)
+          return delay + random.uniform(0, delay * 0.1)
+
+     def _retry_after(self, error: JIRAError) -> Optional[float]:
+          response = getattr(error, "response", None)
+          value = response.headers.get("Retry-After") if response is not None else None
+          if not value:
+               return None
+          try:
+               return min(float(value), settings.JIRA_BACKOFF_MAX_SECONDS)
+          except ValueError:
+               pass
+          try:
+               seconds = parsedate_to_datetime(value).timestamp() - time.time()
+               return min(max(seconds, 0.0), settings.JIRA_BACKOFF_MAX_SECONDS)
+          except Exception:
+               return None
+
+
+@lru_cache
+def get_jira_transport() -> JiraTransport:
+     return JiraTransport()
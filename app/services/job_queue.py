@@ -0,0 +1,387 @@
+import asyncio
+import random
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from fastapi.concurrency import run_in_threadpool
+from typing import Dict, List, Optional, Sequence, Tuple
+from sqlalchemy import and_, func, or_, update
+from sqlalchemy.orm import Session
+from app.config import settings
+from app.models.database import ProcessingJob, SessionLocal
+from app.utils.logger import logger
+
+
+# Pipeline stages in order. Each runs as its own job step so every stage can
+# be served by a separately scaled worker role.
+STAGES = ("transcribe", "extract", "ticket")
+
+
+def next_stage(stage: str) -> Optional[str]:
+     index = STAGES.index(stage)
+     return STAGES[index + 1] if index + 1 < len(STAGES) else None
+
+
+def _now() -> datetime:
+     return datetime.now(timezone.utc)
+
+
+def mark_stage(job: ProcessingJob, stage: str, status: str, **fields):
+     """
+     Record the status of one stage in job.stages, alongside the attempt it
+     is on. The caller commits.
+     """
+     stages = dict(job.stages or {})
+     entry = dict(stages.get(stage) or {})
+     entry.update(status=status, attempts=job.attempts, updated_at=_now().isoformat(), **fields)
+     stages[stage] = entry
+     # Reassigned rather than mutated so the JSON column is flagged as changed
+     job.stages = stages
+
+
+def stage_statuses(job: ProcessingJob) -> Dict[str, dict]:
+     """
+     Status of every stage, in order. Stages with nothing recorded (jobs from
+     before per-stage tracking) are derived from the job's current stage.
+     """
+     current = STAGES.index(job.stage) if job.stage in STAGES else 0
+     statuses = {}
+     for index, stage in enumerate(STAGES):
+          if index < current:
+               default = "completed"
+          elif index == current:
+               default = job.status
+          else:
+               default = "pending"
+          statuses[stage] = {"status": default, **(job.stages or {}).get(stage, {})}
+     return statuses
+
+
+def _claimable(now: datetime, stages: Optional[Sequence[str]] = None):
+     """
+     Jobs that are due (queued and past their backoff), optionally only at
+     given stages
+     """
+     condition = and_(
+          ProcessingJob.status == "queued",
+          or_(ProcessingJob.run_after.is_(None), ProcessingJob.run_after <= now)
+     )
+     if stages:
+          condition = and_(condition, ProcessingJob.stage.in_(stages))
+     return condition
+
+
+def _lease_expired(now: datetime, stages: Optional[Sequence[str]] = None):
+     """
+     Jobs whose lease ran out because the worker holding them died
+     """
+     condition = and_(
+          ProcessingJob.status == "processing",
+          ProcessingJob.lease_expires_at.is_not(None),
+          ProcessingJob.lease_expires_at < now
+     )
+     if stages:
+          condition = and_(condition, ProcessingJob.stage.in_(stages))
+     return condition
+
+
+def claim_job(db: Session, job_id: str, worker_id: str, stages: Optional[Sequence[str]] = None) -> bool:
+     """
+     Atomically take the lease on a job. Returns False if another worker won
+     the race, the job moved on to a stage this worker doesn't serve, or it
+     is not claimable any more.
+     """
+     now = _now()
+     result = db.execute(
+          update(ProcessingJob)
+          .where(ProcessingJob.id == job_id, _claimable(now, stages))
+          .values(
+               status="processing",
+               worker_id=worker_id,
+               lease_expires_at=now + timedelta(seconds=settings.JOB_LEASE_SECONDS),
+               attempts=ProcessingJob.attempts + 1,
+               updated_at=now
+          )
+          .execution_options(synchronize_session=False)
+     )
+     db.commit()
+     return result.rowcount == 1
+
+
+def renew_lease(db: Session, job_id: str, worker_id: str) -> bool:
+     """
+     Extend the lease held by this worker
+     """
+     result = db.execute(
+          update(ProcessingJob)
+          .where(ProcessingJob.id == job_id, ProcessingJob.worker_id == worker_id)
+          .values(lease_expires_at=_now() + timedelta(seconds=settings.JOB_LEASE_SECONDS))
+          .execution_options(synchronize_session=False)
+     )
+     db.commit()
+     return result.rowcount == 1
+
+
+def retry_delay(attempts: int) -> float:
+     """
+     Exponential backoff with a little jitter
+     """
+     delay = min(
+          settings.JOB_RETRY_BACKOFF_SECONDS * (2 ** max(attempts - 1, 0)),
+          settings.JOB_RETRY_BACKOFF_MAX_SECONDS
+     )
+     return delay + random.uniform(0, delay * 0.1)
+
+
+def release_job(db: Session, job_id: str, error: str) -> Optional[float]:
+     """
+     Hand a failed job back to the queue with backoff, or mark it failed once
+     its attempts are used up. Returns the retry delay, or None if it failed.
+     """
+     job = db.query(ProcessingJob).filter(ProcessingJob.id == job_id).first()
+     if not job:
+          return None
+
+     job.worker_id = None
+     job.lease_expires_at = None
+
+     if job.attempts < job.max_attempts:
+          delay = retry_delay(job.attempts)
+          job.status = "queued"
+          job.run_after = _now() + timedelta(seconds=delay)
+          job.message = f"Attempt {job.attempts} failed: {error}. Retrying in {delay:.0f}s"
+          mark_stage(job, job.stage, "queued", error=error)
+          db.commit()
+          return delay
+
+     job.status = "failed"
+     job.message = f"Processing failed: {error}"
+     mark_stage(job, job.stage, "failed", error=error)
+     db.commit()
+     return None
+
+
+def release_expired_leases(
+     db: Session,
+     limit: int,
+     stages: Optional[Sequence[str]] = None
+) -> List[str]:
+     """
+     Treat a lease that ran out as a failed attempt: the job goes back to
+     the queue with backoff, or is marked failed once its attempts are used
+     up, so a recording that crashes its worker can't retry forever.
+     Returns the ids of the released jobs.
+     """
+     now = _now()
+     rows = db.query(ProcessingJob.id).filter(_lease_expired(now, stages)).limit(limit).all()
+     released = []
+     for (job_id,) in rows:
+          # Clear the lease first so only one scanning worker releases the job;
+          # release_job commits both together
+          result = db.execute(
+               update(ProcessingJob)
+               .where(ProcessingJob.id == job_id, _lease_expired(now))
+               .values(worker_id=None, lease_expires_at=None)
+               .execution_options(synchronize_session=False)
+          )
+          if result.rowcount != 1:
+               db.rollback()
+               continue
+          release_job(db, job_id, "Worker stopped while processing (lease expired)")
+          released.append(job_id)
+     return released
+
+
+def advance_job(job: ProcessingJob, stage: str):
+     """
+     Hand a job whose current stage finished over to the next stage. The
+     caller commits, together with the stage's outputs.
+     """
+     job.stage = stage
+     job.status = "queued"
+     job.attempts = 0
+     job.worker_id = None
+     job.lease_expires_at = None
+     job.run_after = None
+     mark_stage(job, stage, "queued", error=None)
+
+
+def resume_job(job: ProcessingJob) -> str:
+     """
+     Queue a finished job again at the stage that needs re-running: the
+     stage it failed at, or ticket creation if some tickets could not be
+     created. Earlier stages keep their checkpointed output. Returns the
+     stage, raises ValueError if there is nothing to resume. The caller
+     commits and dispatches.
+     """
+     if job.status == "failed":
+          stage = job.stage
+     elif job.status == "completed" and (job.result or {}).get("failed_ticket_count"):
+          stage = STAGES[-1]
+     else:
+          raise ValueError(f"Job is {job.status}, nothing to resume")
+
+     advance_job(job, stage)
+     job.message = f"Queued to resume at the {stage} stage...."
+     return stage
+
+
+def find_claimable_jobs(
+     db: Session,
+     limit: int,
+     stages: Optional[Sequence[str]] = None
+) -> List[Tuple[str, str]]:
+     """
+     (id, stage) of jobs that are due, oldest first
+     """
+     rows = db.query(ProcessingJob.id, ProcessingJob.stage).filter(
+          _claimable(_now(), stages)
+     ).order_by(
+          ProcessingJob.created_at
+     ).limit(limit).all()
+     return [(row.id, row.stage) for row in rows]
+
+
+def count_waiting(db: Session, stage: str) -> int:
+     """
+     Jobs ready to run at a stage that no worker has picked up yet. Jobs
+     still backing off after a failure are not counted.
+     """
+     return db.query(func.count(ProcessingJob.id)).filter(
+          ProcessingJob.stage == stage,
+          ProcessingJob.status == "queued",
+          or_(ProcessingJob.run_after.is_(None), ProcessingJob.run_after <= _now())
+     ).scalar()
+
+
+class JobQueue(ABC):
+     """
+     Dispatch channel for processing jobs, one lane per stage. The
+     processing_jobs table is always the source of truth for job state;
+     backends only wake workers up, so a duplicate or lost message is harmless.
+     """
+
+     @abstractmethod
+     async def enqueue(self, job_id: str, stage: str = STAGES[0]) -> None:
+          ...
+
+     @abstractmethod
+     async def dequeue(self, stage: str, timeout: float) -> Optional[str]:
+          ...
+
+     async def enqueue_later(self, job_id: str, stage: str, delay: float) -> None:
+          """
+          Best-effort delayed dispatch for retries. If this process dies first
+          the recovery scan picks the job up once its run_after has passed.
+          """
+          loop = asyncio.get_running_loop()
+          loop.call_later(delay, lambda: asyncio.ensure_future(self.enqueue(job_id, stage)))
+
+     async def requeue(self, jobs: List[Tuple[str, str]]) -> None:
+          """
+          Re-dispatch (job id, stage) pairs found due by the recovery scan
+          """
+          for job_id, stage in jobs:
+               await self.enqueue(job_id, stage)
+
+     async def close(self) -> None:
+          pass
+
+
+class DatabaseJobQueue(JobQueue):
+     """
+     Polls processing_jobs directly. Needs nothing besides the database;
+     concurrent pollers are sorted out by the conditional UPDATE in claim_job.
+     """
+
+     def __init__(self):
+          self._wakeups = {stage: asyncio.Event() for stage in STAGES}
+
+     async def enqueue(self, job_id: str, stage: str = STAGES[0]) -> None:
+          # The row is the message; just wake up a local poller if there is one
+          self._wakeups[stage].set()
+
+     def _poll(self, stage: str) -> List[Tuple[str, str]]:
+          db = SessionLocal()
+          try:
+               return find_claimable_jobs(db, limit=settings.WORKER_CONCURRENCY, stages=[stage])
+          finally:
+               db.close()
+
+     async def dequeue(self, stage: str, timeout: float) -> Optional[str]:
+          jobs = await run_in_threadpool(self._poll, stage)
+          if jobs:
+               # Spread pollers across the oldest due jobs instead of all racing for one
+               return random.choice(jobs)[0]
+
+          wakeup = self._wakeups[stage]
+          try:
+               await asyncio.wait_for(wakeup.wait(), timeout)
+          except asyncio.TimeoutError:
+               pass
+          wakeup.clear()
+          return None
+
+     async def requeue(self, jobs: List[Tuple[str, str]]) -> None:
+          # Claimable rows are picked up by dequeue() on its own
+          pass
+
+
+class RedisJobQueue(JobQueue):
+     """
+     Redis lists, one per stage, used as wakeup channels between API and
+     worker processes
+     """
+
+     def __init__(self, url: str, name: str):
+          import redis.asyncio as redis
+          self.redis = redis.from_url(url, decode_responses=True)
+          self.name = name
+
+     def _list(self, stage: str) -> str:
+          return f"{self.name}:{stage}"
+
+     async def enqueue(self, job_id: str, stage: str = STAGES[0]) -> None:
+          await self.redis.lpush(self._list(stage), job_id)
+
+     async def dequeue(self, stage: str, timeout: float) -> Optional[str]:
+          item = await self.redis.brpop(self._list(stage), timeout=max(int(timeout), 1))
+          return item[1] if item else None
+
+     async def close(self) -> None:
+          await self.redis.aclose()
+
+
+class MemoryJobQueue(JobQueue):
+     """
+     In-process stand-in for local development. Workers run inside the API
+     process (see app.main lifespan), but job state is still durable in the
+     database and is recovered on restart.
+     """
+
+     def __init__(self):
+          self._queues = {stage: asyncio.Queue() for stage in STAGES}
+
+     async def enqueue(self, job_id: str, stage: str = STAGES[0]) -> None:
+          await self._queues[stage].put(job_id)
+
+     async def dequeue(self, stage: str, timeout: float) -> Optional[str]:
+          try:
+               return await asyncio.wait_for(self._queues[stage].get(), timeout)
+          except asyncio.TimeoutError:
+               return None
+
+
+@lru_cache
+def get_job_queue() -> JobQueue:
+     backend = settings.JOB_QUEUE_BACKEND.lower()
+     if backend == "redis":
+          logger.info(f"Using Redis job queue '{settings.JOB_QUEUE_NAME}'")
+          return RedisJobQueue(settings.REDIS_URL, settings.JOB_QUEUE_NAME)
+     if backend == "memory":
+          logger.info("Using in-process job queue")
+          return MemoryJobQueue()
+     if backend == "database":
+          logger.info("Using database job queue")
+          return DatabaseJobQueue()
+     raise ValueError(f"Unknown JOB_QUEUE_BACKEND: {settings.JOB_QUEUE_BACKEND}")
@@ -0,0 +1,310 @@
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Optional
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import func, insert, update
+from sqlalchemy.orm import Session
+from app.config import settings
+from app.models.database import ProcessingJob, Meeting, Requirement, JiraTicket, TranscriptSegment, SessionLocal
+from app.services.events import publish_job
+from app.services.jira_service import get_jira_service, requirement_to_extracted
+from app.services.job_queue import advance_job, mark_stage, next_stage
+from app.services.response_cache import get_response_cache
+from app.services.extraction import get_extraction_service
+from app.utils.logger import logger
+from app.utils.metrics import metrics
+
+if TYPE_CHECKING:
+     from app.services.transcription import TranscribedSegment
+
+# Share of job progress covered by transcription
+TRANSCRIPTION_PROGRESS = 30
+
+
+def _format_position(seconds: float) -> str:
+     minutes, seconds = divmod(int(seconds), 60)
+     hours, minutes = divmod(minutes, 60)
+     return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+
+
+def _timestamped_transcript(db: Session, meeting_id: str, fallback: str) -> str:
+     """
+     One "[HH:MM:SS] text" line per segment, so extraction can report when a
+     requirement came up and split long meetings on segment boundaries
+     """
+     segments = db.query(TranscriptSegment).filter(
+          TranscriptSegment.meeting_id == meeting_id
+     ).order_by(TranscriptSegment.position).all()
+     if not segments:
+          return fallback
+     return "\n".join(f"[{_format_position(s.start)}] {s.text.strip()}" for s in segments)
+
+
+class TranscriptRecorder:
+     """
+     Persists transcript segments while Whisper is still running and moves
+     job progress with the audio position. Writes are batched every
+     TRANSCRIPT_FLUSH_INTERVAL_SECONDS.
+     """
+
+     def __init__(self, db: Session, job: ProcessingJob, meeting: Meeting):
+          self.db = db
+          self.job = job
+          self.meeting = meeting
+          self.pending = []
+          self.position = 0
+          self.audio_position = 0.0
+          self.duration = 0.0
+          self.last_flush = time.monotonic()
+
+     async def __call__(self, segment: "TranscribedSegment", duration: float):
+          self.pending.append({
+               "meeting_id": self.meeting.id,
+               "position": self.position,
+               "start": segment.start,
+               "end": segment.end,
+               "text": segment.text
+          })
+          self.position += 1
+          self.audio_position = segment.end
+          self.duration = duration
+
+          if time.monotonic() - self.last_flush >= settings.TRANSCRIPT_FLUSH_INTERVAL_SECONDS:
+               await self.flush()
+
+     async def flush(self):
+          await run_in_threadpool(self._write)
+          self.last_flush = time.monotonic()
+          await publish_job(self.job)
+
+     def _write(self):
+          if self.pending:
+               self.db.execute(insert(TranscriptSegment), self.pending)
+               self.pending = []
+
+          if self.duration:
+               self.meeting.duration = self.duration
+               self.job.progress = int(TRANSCRIPTION_PROGRESS * min(self.audio_position / self.duration, 1.0))
+               self.job.message = (
+                    f"Transcribing .... {_format_position(self.audio_position)}"
+                    f" of {_format_position(self.duration)}"
+               )
+          self.db.commit()
+
+
+def _clear_segments(db: Session, meeting_id: str):
+     db.query(TranscriptSegment).filter(
+          TranscriptSegment.meeting_id == meeting_id
+     ).delete(synchronize_session=False)
+     db.commit()
+
+
+async def _transcribe(db: Session, job: ProcessingJob, meeting: Meeting):
+     job.progress = 0
+     job.message = "Starting transcription...."
+     await run_in_threadpool(db.commit)
+     await publish_job(job)
+
+     if meeting.transcription_text is not None:
+          # Transcript survived an earlier attempt, don't pay for Whisper again
+          logger.info(f"Reusing transcription from previous attempt for meeting {meeting.id}")
+     else:
+          # Imported here so extract and ticket workers never load Whisper
+          from app.services.transcription import get_transcription_service
+
+          logger.info(f"Starting transcription for meeting {meeting.id}")
+          # Partial segments from an interrupted attempt are redone from scratch
+          await run_in_threadpool(_clear_segments, db, meeting.id)
+
+          recorder = TranscriptRecorder(db, job, meeting)
+          transcription_service = await run_in_threadpool(get_transcription_service)
+          transcription_text, confidence = await transcription_service.transcribe_audio(
+               meeting.file_path, on_segment=recorder, content_hash=meeting.content_hash
+          )
+          await recorder.flush()
+          meeting.transcription_text = transcription_text
+          meeting.transcription_confidence = confidence
+
+     job.progress = TRANSCRIPTION_PROGRESS
+     job.message = "Transcription complete, waiting for extraction ...."
+
+
+def _save_requirements(db: Session, meeting_id: str, requirements: list):
+     # Only now that extraction succeeded, drop requirements left behind by an
+     # attempt that died before creating tickets
+     db.query(Requirement).filter(
+          Requirement.meeting_id == meeting_id,
+          Requirement.jira_ticket_key.is_(None)
+     ).delete(synchronize_session=False)
+
+     if requirements:
+          db.execute(insert(Requirement), [
+               {
+                    "id": str(uuid.uuid4()),
+                    "meeting_id": meeting_id,
+                    "text": req.text,
+                    "summary": req.summary,
+                    "description": req.description,
+                    "requirement_type": req.type.value,
+                    # "priority": req.priority.value,
+                    "labels": req.labels,
+                    "acceptance_criteria": req.acceptance_criteria,
+                    "timestamp": req.timestamp,
+                    "confidence": req.confidence
+               }
+               for req in requirements
+          ])
+
+
+async def _extract(db: Session, job: ProcessingJob, meeting: Meeting):
+     job.message = "Extracting requirements ...."
+     await run_in_threadpool(db.commit)
+     await publish_job(job)
+
+     logger.info(f"Extracting requirements for meeting {meeting.id}")
+     transcript = await run_in_threadpool(_timestamped_transcript, db, meeting.id, meeting.transcription_text)
+     try:
+          requirements = await get_extraction_service().extract_requirements(transcript)
+     except Exception as e:
+          # Fail the stage so it is retried, and can be resumed, from here
+          raise Exception(f"Requirement extraction failed: {str(e)}")
+
+     await run_in_threadpool(_save_requirements, db, meeting.id, requirements)
+
+     job.progress = 60
+     job.message = f"Extracted {len(requirements)} requirements, waiting for ticket creation ....."
+
+
+def _pending_requirements(db: Session, meeting_id: str) -> list:
+     # Only requirements without a ticket, so a retried stage never files duplicates
+     return db.query(Requirement).filter(
+          Requirement.meeting_id == meeting_id,
+          Requirement.jira_ticket_key.is_(None)
+     ).order_by(Requirement.created_at, Requirement.id).all()
+
+
+def _save_tickets(db: Session, meeting_id: str, requirement_ids: list, results: list) -> tuple:
+     """
+     Link requirements to their tickets. Returns (requirement, ticket) counts
+     for the meeting, tickets created by earlier attempts included.
+     """
+     # Results line up with requirements, so link by identity and write in bulk
+     if results:
+          db.execute(update(Requirement), [
+               {
+                    "id": requirement_id,
+                    "jira_ticket_key": result.ticket.key if result.ticket else None,
+                    "jira_error": None if result.ticket else result.error
+               }
+               for requirement_id, result in zip(requirement_ids, results)
+          ])
+     if any(result.ticket for result in results):
+          db.execute(insert(JiraTicket), [
+               {
+                    "requirement_id": requirement_id,
+                    "ticket_key": result.ticket.key,
+                    "url": result.ticket.url,
+                    "summary": result.ticket.summary,
+                    "status": result.ticket.status
+               }
+               for requirement_id, result in zip(requirement_ids, results)
+               if result.ticket
+          ])
+
+     return db.query(
+          func.count(Requirement.id), func.count(Requirement.jira_ticket_key)
+     ).filter(Requirement.meeting_id == meeting_id).one()
+
+
+async def _ticket(db: Session, job: ProcessingJob, meeting: Meeting):
+     job.message = "Creating Jira Tickets ....."
+     await run_in_threadpool(db.commit)
+     await publish_job(job)
+
+     pending = await run_in_threadpool(_pending_requirements, db, meeting.id)
+     requirement_ids = [requirement.id for requirement in pending]
+
+     logger.info(f"Creating {len(pending)} Jira tickets for meeting {meeting.id}")
+     results = await get_jira_service().create_tickets_for_requirements(
+          [requirement_to_extracted(requirement) for requirement in pending],
+          job.payload.get("project_key"),
+          job.payload.get("assignee")
+     )
+
+     requirement_count, ticket_count = await run_in_threadpool(
+          _save_tickets, db, meeting.id, requirement_ids, results
+     )
+
+     meeting.processed = True
+     job.status = 'completed'
+     job.progress = 100
+     job.message = f"Processing complete. Created {ticket_count} tickets."
+     if ticket_count < requirement_count:
+          job.message += f" {requirement_count - ticket_count} could not be created."
+     job.worker_id = None
+     job.lease_expires_at = None
+     job.result = {
+          "transcription_confidence" : meeting.transcription_confidence,
+          "requirement_count" : requirement_count,
+          "ticket_count" : ticket_count,
+          "failed_ticket_count" : requirement_count - ticket_count
+     }
+
+
+STAGE_HANDLERS = {
+     "transcribe": _transcribe,
+     "extract": _extract,
+     "ticket": _ticket,
+}
+
+
+def _load(db: Session, job_id: str) -> tuple:
+     job = db.query(ProcessingJob).filter(ProcessingJob.id == job_id).first()
+     if not job:
+          raise Exception(f"Processing job {job_id} not found")
+
+     meeting = db.query(Meeting).filter(Meeting.id == job.meeting_id).first()
+     if not meeting:
+          raise Exception(f"Meeting {job.meeting_id} not found")
+     return job, meeting
+
+
+async def run_stage(job_id: str, stage: str) -> Optional[str]:
+     """
+     Run one stage of a claimed job and commit its output together with the
+     hand-over to the next stage, so a retry or resume starts from there.
+     Returns that next stage, or None once the job is complete. Retries and
+     failure status are handled by the worker.
+
+     Database work runs in the threadpool so a stage never blocks the event
+     loop other slots share.
+     """
+     started = time.perf_counter()
+     # The lease makes this worker the job's only writer, so objects stay
+     # valid across commits and publishing them needs no reload
+     db = SessionLocal(expire_on_commit=False)
+     try:
+          job, meeting = await run_in_threadpool(_load, db, job_id)
+
+          mark_stage(job, stage, "processing", started_at=datetime.now(timezone.utc).isoformat(), error=None)
+          await STAGE_HANDLERS[stage](db, job, meeting)
+
+          elapsed = time.perf_counter() - started
+          mark_stage(job, stage, "completed", seconds=round(elapsed, 3))
+          metrics.observe(f"pipeline_{stage}_seconds", elapsed)
+          following = next_stage(stage)
+          if following:
+               advance_job(job, following)
+          await run_in_threadpool(db.commit)
+          if not following:
+               await get_response_cache().invalidate_meeting(meeting.id)
+               logger.info(f"Meeting {meeting.id} processed successfully")
+          await publish_job(job)
+          return following
+     except Exception as e:
+          logger.error(f"Stage {stage} of job {job_id} failed: {str(e)}")
+          await run_in_threadpool(db.rollback)
+          raise e
+     finally:
+          await run_in_threadpool(db.close)
@@ -0,0 +1,193 @@
+import json
+import threading
+import time
+from collections import defaultdict
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Set, Tuple
+from cachetools import LRUCache
+from fastapi.encoders import jsonable_encoder
+from app.config import settings
+from app.utils.logger import logger
+from app.utils.metrics import metrics
+
+# A loader returns the payload and how long it may be cached (None: don't cache)
+Loader = Callable[[], Awaitable[Tuple[Any, Optional[float]]]]
+
+
+def meeting_tag(meeting_id: str) -> str:
+     return f"meeting:{meeting_id}"
+
+
+# Every cached page of GET /meetings carries this tag
+MEETINGS_TAG = "meetings"
+
+
+class ResponseCache:
+     """
+     Cache for JSON-ready read responses. Entries are tagged (per meeting,
+     plus one tag for the meeting list) so writers can drop everything that
+     depends on what they changed. The base class caches nothing.
+     """
+
+     async def get(self, key: str) -> Optional[Any]:
+          return None
+
+     async def set(self, key: str, value: Any, ttl: float, tags: Iterable[str]) -> None:
+          pass
+
+     async def invalidate(self, *tags: str) -> None:
+          pass
+
+     async def close(self) -> None:
+          pass
+
+     async def invalidate_meeting(self, meeting_id: Optional[str] = None) -> None:
+          """
+          Called after a write to a meeting, its job, requirements or tickets.
+          Without a meeting_id (a new meeting) only the list is dropped.
+          """
+          tags = [meeting_tag(meeting_id), MEETINGS_TAG] if meeting_id else [MEETINGS_TAG]
+          try:
+               await self.invalidate(*tags)
+          except Exception as e:
+               logger.warning(f"Response cache invalidation failed: {str(e)}")
+
+     async def get_or_load(self, name: str, key: str, tags: Iterable[str], loader: Loader) -> Any:
+          started = time.perf_counter()
+          try:
+               value = await self.get(key)
+          except Exception as e:
+               logger.warning(f"Response cache read failed: {str(e)}")
+               value = None
+
+          if value is not None:
+               metrics.increment("response_cache_hits")
+               metrics.increment(f"response_cache_{name}_hits")
+          else:
+               metrics.increment("response_cache_misses")
+               metrics.increment(f"response_cache_{name}_misses")
+               payload, ttl = await loader()
+               value = jsonable_encoder(payload)
+               if ttl:
+                    try:
+                         await self.set(key, value, ttl, tags)
+                    except Exception as e:
+                         logger.warning(f"Response cache write failed: {str(e)}")
+
+          metrics.observe(f"{name}_seconds", time.perf_counter() - started)
+          return value
+
+
+class _EvictingLRUCache(LRUCache):
+     """
+     LRUCache that reports entries it evicts to make room
+     """
+
+     def __init__(self, maxsize: int, on_evict: Callable[[str, Any], None]):
+          super().__init__(maxsize=maxsize)
+          self.on_evict = on_evict
+
+     def popitem(self):
+          key, entry = super().popitem()
+          self.on_evict(key, entry)
+          return key, entry
+
+
+class MemoryResponseCache(ResponseCache):
+     """
+     Per-process LRU with per-entry TTL. Only sees invalidations made in this
+     process, so writes from separate workers show up once the TTL runs out.
+     Each entry keeps its tags, so a key leaves the tag index however the
+     entry goes (invalidated, evicted or expired).
+     """
+
+     def __init__(self, max_entries: int):
+          self._entries: LRUCache = _EvictingLRUCache(max_entries, self._untag)
+          self._tags: Dict[str, Set[str]] = defaultdict(set)
+          self._lock = threading.Lock()
+
+     def _untag(self, key: str, entry: Tuple[float, Any, Tuple[str, ...]]):
+          for tag in entry[2]:
+               keys = self._tags.get(tag)
+               if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                         del self._tags[tag]
+
+     def _drop(self, key: str):
+          entry = self._entries.pop(key, None)
+          if entry is not None:
+               self._untag(key, entry)
+
+     async def get(self, key: str) -> Optional[Any]:
+          with self._lock:
+               entry = self._entries.get(key)
+               if entry is None:
+                    return None
+               expires_at, value, _ = entry
+               if expires_at <= time.monotonic():
+                    self._drop(key)
+                    return None
+               return value
+
+     async def set(self, key: str, value: Any, ttl: float, tags: Iterable[str]) -> None:
+          tags = tuple(tags)
+          with self._lock:
+               self._drop(key)
+               self._entries[key] = (time.monotonic() + ttl, value, tags)
+               for tag in tags:
+                    self._tags[tag].add(key)
+
+     async def invalidate(self, *tags: str) -> None:
+          with self._lock:
+               for tag in tags:
+                    for key in list(self._tags.get(tag, ())):
+                         self._drop(key)
+
+
+class RedisResponseCache(ResponseCache):
+     """
+     Shared by every API and worker process, so invalidation reaches all of them
+     """
+
+     def __init__(self, url: str, prefix: str = "response_cache"):
+          import redis.asyncio as redis
+          self.redis = redis.from_url(url, decode_responses=True)
+          self.prefix = prefix
+
+     def _key(self, key: str) -> str:
+          return f"{self.prefix}:{key}"
+
+     def _tag(self, tag: str) -> str:
+          return f"{self.prefix}:tag:{tag}"
+
+     async def get(self, key: str) -> Optional[Any]:
+          value = await self.redis.get(self._key(key))
+          return json.loads(value) if value is not None else None
+
+     async def set(self, key: str, value: Any, ttl: float, tags: Iterable[str]) -> None:
+          async with self.redis.pipeline(transaction=False) as pipe:
+               pipe.set(self._key(key), json.dumps(value), ex=max(int(ttl), 1))
+               for tag in tags:
+                    pipe.sadd(self._tag(tag), key)
+                    pipe.expire(self._tag(tag), settings.RESPONSE_CACHE_TTL_SECONDS)
+               await pipe.execute()
+
+     async def invalidate(self, *tags: str) -> None:
+          for tag in tags:
+               keys = await self.redis.smembers(self._tag(tag))
+               await self.redis.delete(self._tag(tag), *(self._key(key) for key in keys))
+
+     async def close(self) -> None:
+          await self.redis.aclose()
+
+
+@lru_cache
+def get_response_cache() -> ResponseCache:
+     backend = settings.RESPONSE_CACHE_BACKEND.lower()
+     if backend == "redis":
+          logger.info("Using Redis response cache")
+          return RedisResponseCache(settings.REDIS_URL)
+     if backend == "memory":
+          return MemoryResponseCache(settings.RESPONSE_CACHE_MAX_ENTRIES)
+     return ResponseCache()
@@ -1,45 +1,364 @@
 from faster_whisper import WhisperModel
+from faster_whisper.vad import VadOptions, get_speech_timestamps
 from fastapi.concurrency import run_in_threadpool
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+import asyncio
 import math
-from typing import Tuple
+import multiprocessing
+import queue
+from typing import Awaitable, Callable, List, NamedTuple, Optional, Tuple, Union
+import numpy as np
+from app.config import settings
+from app.services.audio import SAMPLE_RATE, decode_audio
+from app.services.transcription_cache import TranscriptionCache, hash_file
 from app.utils.logger import logger
 from pprint import pprint
 
 
+class TranscribedSegment(NamedTuple):
+     start: float
+     end: float
+     text: str
+
+
+class TranscriptionResult(NamedTuple):
+     segments: List[TranscribedSegment]
+     language_probability: float
+     duration: float
+
+
+# Called with each segment as soon as it is decoded, and the total audio duration
+SegmentCallback = Callable[[TranscribedSegment, float], Awaitable[None]]
+
+
+# Model owned by a pool worker process, loaded once by _init_worker
+_worker_model: Optional[WhisperModel] = None
+
+
+def _load_model() -> WhisperModel:
+     return WhisperModel(
+          settings.WHISPER_MODEL_SIZE,
+          device=settings.WHISPER_DEVICE,
+          compute_type=settings.WHISPER_COMPUTE_TYPE,
+          cpu_threads=settings.WHISPER_CPU_THREADS,
+          num_workers=settings.WHISPER_NUM_WORKERS
+     )
+
+
+def _init_worker():
+     global _worker_model
+     _worker_model = _load_model()
+     logger.info(f"faster-whisper model loaded in worker process {multiprocessing.current_process().name}")
+
+
+def _ping() -> bool:
+     return _worker_model is not None
+
+
+def _as_samples(audio: Union[str, np.ndarray]) -> np.ndarray:
+     # Paths are decoded here, inside the pool worker when there is one, so
+     # the samples never have to be shipped between processes
+     return decode_audio(audio) if isinstance(audio, str) else audio
+
+
+def _run_transcription(model: WhisperModel, audio: Union[str, np.ndarray], **options) -> TranscriptionResult:
+     """
+     Run Whisper and drain the lazy segment generator in the calling
+     thread/process, where the decoding actually happens
+     """
+     segments, info = model.transcribe(_as_samples(audio), beam_size=settings.WHISPER_BEAM_SIZE, **options)
+     return TranscriptionResult(
+          segments=[TranscribedSegment(s.start, s.end, s.text) for s in segments],
+          language_probability=info.all_language_probs[0][1],
+          duration=info.duration
+     )
+
+
+def _transcribe_in_worker(audio: Union[str, np.ndarray], **options) -> TranscriptionResult:
+     return _run_transcription(_worker_model, audio, **options)
+
+
+def _stream_transcription(model: WhisperModel, audio: Union[str, np.ndarray], channel, **options):
+     """
+     Push segments onto channel as Whisper produces them:
+     ("info", language_probability, duration), ("segment", start, end, text)...,
+     then ("done",) or ("error", message)
+     """
+     try:
+          segments, info = model.transcribe(_as_samples(audio), beam_size=settings.WHISPER_BEAM_SIZE, **options)
+          channel.put(("info", info.all_language_probs[0][1], info.duration))
+          for s in segments:
+               channel.put(("segment", s.start, s.end, s.text))
+          channel.put(("done",))
+     except Exception as e:
+          channel.put(("error", str(e)))
+
+
+def _stream_in_worker(audio: Union[str, np.ndarray], channel, **options):
+     _stream_transcription(_worker_model, audio, channel, **options)
+
+
+def split_on_silence(audio: np.ndarray, chunk_seconds: float) -> List[Tuple[int, int]]:
+     """
+     Group VAD speech regions into chunks of roughly chunk_seconds and cut
+     in the middle of the silence between regions. Returns sample ranges that
+     cover the whole recording, in order.
+     """
+     speech = get_speech_timestamps(
+          audio,
+          VadOptions(min_silence_duration_ms=settings.TRANSCRIPTION_VAD_MIN_SILENCE_MS)
+     )
+     if not speech:
+          return [(0, len(audio))]
+
+     max_samples = int(chunk_seconds * SAMPLE_RATE)
+     chunks = []
+     chunk_start = 0
+     for previous, current in zip(speech, speech[1:]):
+          if current["end"] - chunk_start > max_samples:
+               cut = (previous["end"] + current["start"]) // 2
+               chunks.append((chunk_start, cut))
+               chunk_start = cut
+     chunks.append((chunk_start, len(audio)))
+     return chunks
+
 
 class TranscriptionService:
      def __init__(self):
           """
           Initializes the self-hosted transcription pipeline using faster-whisper.
+
+          With TRANSCRIPTION_WORKERS > 0 every worker process of the pool loads
+          its own model once at startup, so concurrent meetings don't share one
+          model behind the GIL. With 0 the model lives in this process.
           """
 
-          model_size = "small"
-          self.device = "cpu"
-          self.compute_type = "int8"
+          self.device = settings.WHISPER_DEVICE
+          self.compute_type = settings.WHISPER_COMPUTE_TYPE
+          self.num_processes = settings.TRANSCRIPTION_WORKERS
+          self.model = None
+          self.pool = None
+          self.manager = None
+          self.cache = TranscriptionCache() if settings.TRANSCRIPTION_CACHE_ENABLED else None
           try:
-               self.model = WhisperModel(model_size, device=self.device, compute_type=self.compute_type)
-               logger.info("fatser-whisper model loaded successfully")
+               if self.num_processes > 0:
+                    context = multiprocessing.get_context("spawn")
+                    self.pool = ProcessPoolExecutor(
+                         max_workers=self.num_processes,
+                         mp_context=context,
+                         initializer=_init_worker
+                    )
+                    # Queues that can be handed to pool processes for streaming segments back
+                    self.manager = context.Manager()
+                    self._warm_up_pool()
+                    logger.info(f"faster-whisper pool started with {self.num_processes} worker processes")
+               else:
+                    self.model = _load_model()
+                    logger.info("fatser-whisper model loaded successfully")
           except Exception as e:
                logger.error(f"Failed to load faster-whisper model: {e}")
                self.model = None
+               self.pool = None
                raise RuntimeError("Could not initialize the transcription pipeline.")
 
-     async def transcribe_audio(self, file_path: str) -> Tuple[str, float]:
+     def _warm_up_pool(self):
+          # Spawn-context pools start processes on demand; one task per slot
+          # brings them all up now instead of on the first meetings
+          futures = [self.pool.submit(_ping) for _ in range(self.num_processes)]
+          if not all(f.result() for f in futures):
+               raise RuntimeError("Worker process failed to load the model")
+
+     async def transcribe(
+          self,
+          audio: Union[str, np.ndarray],
+          on_segment: Optional[SegmentCallback] = None,
+          **options
+     ) -> TranscriptionResult:
+          """
+          Transcribe a whole file (path) or a segment (16 kHz mono float32 array).
+          With on_segment, segments are handed over as they are decoded.
+          """
+          if on_segment:
+               return await self._transcribe_streaming(audio, on_segment, **options)
+
+          if self.pool:
+               loop = asyncio.get_running_loop()
+               return await loop.run_in_executor(
+                    self.pool, partial(_transcribe_in_worker, audio, **options)
+               )
           if not self.model:
                raise Exception("Transcription pipeline is not available")
-          
-          logger.info(f"Starting faster-whisper transcription for: {file_path}")
+          return await run_in_threadpool(_run_transcription, self.model, audio, **options)
 
-          try:
-               segments, info = await run_in_threadpool(
-                    self.model.transcribe, file_path, beam_size=5
+     async def _transcribe_streaming(
+          self,
+          audio: Union[str, np.ndarray],
+          on_segment: SegmentCallback,
+          **options
+     ) -> TranscriptionResult:
+          if self.pool:
+               channel = self.manager.Queue()
+               loop = asyncio.get_running_loop()
+               producer = loop.run_in_executor(
+                    self.pool, partial(_stream_in_worker, audio, channel, **options)
+               )
+          elif self.model:
+               channel = queue.Queue()
+               producer = asyncio.ensure_future(
+                    run_in_threadpool(_stream_transcription, self.model, audio, channel, **options)
                )
+          else:
+               raise Exception("Transcription pipeline is not available")
+
+          segments = []
+          language_probability = 0.0
+          duration = 0.0
+          while True:
+               message = await self._next_message(channel, producer)
+               kind = message[0]
+               if kind == "info":
+                    _, language_probability, duration = message
+               elif kind == "segment":
+                    segment = TranscribedSegment(*message[1:])
+                    segments.append(segment)
+                    await on_segment(segment, duration)
+               elif kind == "error":
+                    raise Exception(message[1])
+               else:
+                    break
+
+          await producer
+          return TranscriptionResult(segments, language_probability, duration)
+
+     async def _next_message(self, channel, producer: asyncio.Future) -> tuple:
+          while True:
+               try:
+                    return await run_in_threadpool(channel.get, True, 1.0)
+               except queue.Empty:
+                    if producer.done():
+                         # Raises if the worker process died
+                         producer.result()
+                         raise Exception("Transcription worker exited without finishing")
+
+     async def transcribe_parallel(
+          self,
+          file_path: str,
+          on_segment: Optional[SegmentCallback] = None
+     ) -> TranscriptionResult:
+          """
+          Split a long recording at silences and transcribe the chunks in
+          parallel across the pool, then stitch the segments back together
+          on the original timeline. Short recordings go through a single pass.
+          """
+          audio = await run_in_threadpool(decode_audio, file_path, sampling_rate=SAMPLE_RATE)
+          duration = len(audio) / SAMPLE_RATE
+          if duration < settings.TRANSCRIPTION_PARALLEL_MIN_SECONDS:
+               return await self.transcribe(audio, on_segment=on_segment)
+
+          chunks = await run_in_threadpool(
+               split_on_silence, audio, settings.TRANSCRIPTION_CHUNK_SECONDS
+          )
+          logger.info(f"Transcribing {duration:.0f}s of audio as {len(chunks)} parallel chunks")
+
+          tasks = [
+               asyncio.ensure_future(self.transcribe(audio[start:end]))
+               for start, end in chunks
+          ]
+
+          # Chunks are awaited in order, so segments are emitted on the
+          # original timeline as soon as every earlier chunk is done
+          segments = []
+          weighted_probability = 0.0
+          try:
+               for (start, end), task in zip(chunks, tasks):
+                    result = await task
+                    offset = start / SAMPLE_RATE
+                    for s in result.segments:
+                         segment = TranscribedSegment(s.start + offset, s.end + offset, s.text)
+                         segments.append(segment)
+                         if on_segment:
+                              await on_segment(segment, duration)
+                    weighted_probability += result.language_probability * (end - start)
+          except BaseException:
+               for task in tasks:
+                    task.cancel()
+               raise
 
-               transcription_text = "".join(segment.text for segment in segments)
-               
-               # print(segments)
-               confidence = math.exp(info.all_language_probs[0][1])
+          return TranscriptionResult(
+               segments=segments,
+               language_probability=weighted_probability / len(audio),
+               duration=duration
+          )
+
+     async def _cached(self, cache_key: str, on_segment: Optional[SegmentCallback]) -> Optional[TranscriptionResult]:
+          entry = await run_in_threadpool(self.cache.get, cache_key)
+          if entry is None:
+               return None
+
+          result = TranscriptionResult(
+               segments=[TranscribedSegment(*s) for s in entry["segments"]],
+               language_probability=entry["language_probability"],
+               duration=entry["duration"]
+          )
+          if on_segment:
+               for segment in result.segments:
+                    await on_segment(segment, result.duration)
+          return result
+
+     async def transcribe_audio(
+          self,
+          file_path: str,
+          on_segment: Optional[SegmentCallback] = None,
+          content_hash: Optional[str] = None
+     ) -> Tuple[str, float]:
+          """
+          Transcribe a recording, served from the transcription cache when the
+          same audio was already transcribed with the same model settings.
+          Pass the upload's content_hash to skip re-hashing the file.
+          """
+          if not self.model and not self.pool:
+               raise Exception("Transcription pipeline is not available")
+
+          try:
+               cache_key = None
+               result = None
+               if self.cache:
+                    content_hash = content_hash or await run_in_threadpool(hash_file, file_path)
+                    cache_key = self.cache.key(content_hash)
+                    result = await self._cached(cache_key, on_segment)
+
+               if result:
+                    logger.info(f"Transcription cache hit for: {file_path}")
+               else:
+                    logger.info(f"Starting faster-whisper transcription for: {file_path}")
+                    if settings.TRANSCRIPTION_PARALLEL:
+                         result = await self.transcribe_parallel(file_path, on_segment=on_segment)
+                    else:
+                         result = await self.transcribe(file_path, on_segment=on_segment)
+
+                    if cache_key:
+                         await run_in_threadpool(self.cache.put, cache_key, result._asdict())
+
+               transcription_text = "".join(segment.text for segment in result.segments)
+
+               confidence = math.exp(result.language_probability)
                return transcription_text.strip(), confidence
           except Exception as e:
                logger.error(f"faster-whisper transcription failed: {str(e)}")
-               raise Exception(f"faster-whisper transcription failed: {str(e)}")
\ No newline at end of file
+               raise Exception(f"faster-whisper transcription failed: {str(e)}")
+
+     def close(self):
+          if self.pool:
+               self.pool.shutdown(wait=False, cancel_futures=True)
+          if self.manager:
+               self.manager.shutdown()
+
+
+@lru_cache
+def get_transcription_service() -> TranscriptionService:
+     """
+     Loads the model (or starts the pool) on first use. Blocking: call it
+     from a thread when on the event loop.
+     """
+     return TranscriptionService()
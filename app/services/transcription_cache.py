@@ -0,0 +1,102 @@
+import hashlib
+import json
+import os
+import tempfile
+from typing import Optional
+from app.config import settings
+from app.utils.logger import logger
+from app.utils.metrics import metrics
+
+
+def hash_file(file_path: str) -> str:
+     """
+     SHA-256 of a file, read in upload-sized chunks
+     """
+     hasher = hashlib.sha256()
+     with open(file_path, 'rb') as f:
+          for chunk in iter(lambda: f.read(settings.UPLOAD_CHUNK_SIZE), b''):
+               hasher.update(chunk)
+     return hasher.hexdigest()
+
+
+class TranscriptionCache:
+     """
+     Content-addressed transcript cache on disk. Entries are keyed by the
+     audio hash plus every setting that changes Whisper's output, and the
+     directory is kept under max_bytes by evicting least recently used
+     entries (access time is tracked through the file mtime).
+     """
+
+     def __init__(self, directory: Optional[str] = None, max_bytes: Optional[int] = None):
+          self.directory = directory or settings.TRANSCRIPTION_CACHE_DIR
+          self.max_bytes = max_bytes or settings.TRANSCRIPTION_CACHE_MAX_BYTES
+          os.makedirs(self.directory, exist_ok=True)
+
+     def key(self, content_hash: str) -> str:
+          parts = [
+               content_hash,
+               settings.WHISPER_MODEL_SIZE,
+               settings.WHISPER_COMPUTE_TYPE,
+               str(settings.WHISPER_BEAM_SIZE),
+               "parallel" if settings.TRANSCRIPTION_PARALLEL else "single"
+          ]
+          return hashlib.sha256(":".join(parts).encode()).hexdigest()
+
+     def _path(self, key: str) -> str:
+          return os.path.join(self.directory, f"{key}.json")
+
+     def get(self, key: str) -> Optional[dict]:
+          path = self._path(key)
+          try:
+               with open(path, 'r', encoding='utf-8') as f:
+                    entry = json.load(f)
+               os.utime(path)
+          except FileNotFoundError:
+               metrics.increment("transcription_cache_misses")
+               return None
+          except Exception as e:
+               logger.warning(f"Dropping unreadable transcription cache entry {key}: {str(e)}")
+               self._remove(path)
+               metrics.increment("transcription_cache_misses")
+               return None
+
+          metrics.increment("transcription_cache_hits")
+          return entry
+
+     def put(self, key: str, entry: dict):
+          # Write to a temp file and rename so concurrent workers never read half an entry
+          fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+          try:
+               with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(entry, f)
+               os.replace(tmp_path, self._path(key))
+          except Exception:
+               self._remove(tmp_path)
+               raise
+          self._evict()
+
+     def _evict(self):
+          entries = []
+          total = 0
+          for name in os.listdir(self.directory):
+               if not name.endswith(".json"):
+                    continue
+               try:
+                    stat = os.stat(os.path.join(self.directory, name))
+               except FileNotFoundError:
+                    continue
+               entries.append((stat.st_mtime, stat.st_size, name))
+               total += stat.st_size
+
+          entries.sort()
+          while total > self.max_bytes and entries:
+               _, size, name = entries.pop(0)
+               self._remove(os.path.join(self.directory, name))
+               total -= size
+               metrics.increment("transcription_cache_evictions")
+
+     def _remove(self, path: str):
+          try:
+               os.remove(path)
+          except FileNotFoundError:
+               pass
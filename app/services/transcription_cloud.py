@@ -1,9 +1,8 @@
 from openai import OpenAI
-import os
-import tempfile
-import ffmpeg
+from fastapi.concurrency import run_in_threadpool
 from typing import Tuple
 from app.config import settings
+from app.services.audio import encode_for_upload
 from app.utils.logger import logger
 
 
@@ -17,56 +16,27 @@ class TranscriptionService:
           Returns: (transcription_text, confidence_score)
           """
           try:
-               processed_path = await self._preprocess_audio(file_path)
-               print(processed_path)
+               audio_file = await self._preprocess_audio(file_path)
 
-               with open(processed_path, 'rb') as audio_file:
-                    transcript = await self.client.audio.transcriptions.create(
-                         model="whisper-1",
-                         file=audio_file,
-                         response_format="verbose_json"
-                    )
+               transcript = await self.client.audio.transcriptions.create(
+                    model="whisper-1",
+                    file=audio_file,
+                    response_format="verbose_json"
+               )
                
                confidence =  self._calculate_confidence(transcript.get('segments', []))
-
-               if processed_path != file_path:
-                    os.remove(processed_path)
                
                return transcript['text'], confidence
           except Exception as e:
                logger.error(f"Audio preprocessing failed: {str(e)}")
                return file_path  # Return original if preprocessing fails
 
-     async def _preprocess_audio(self, file_path: str) -> str:
+     async def _preprocess_audio(self, file_path: str) -> Tuple[str, bytes]:
           """
-          Preprocess audio file for optimal transcription
+          Encode the recording to a 16 kHz mono MP3 (video dropped) in one
+          ffmpeg pass, piped into memory, no temp files
           """
-          try: 
-               file_ext = os.path.splitext(file_path)[1].lower()
-               if file_ext in ['.mp3', '.wav', '.m4a']:
-                    return file_path
-               
-               with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as temp_file:
-                    output_path = temp_file.name
-               
-               (
-                    ffmpeg
-                    .input(file_path)
-                    .output(
-                         output_path,
-                         acodec='mp3',
-                         ar=16000,
-                         ac=1,
-                         ab='64k'
-                    )
-                    .overwrite_output()
-                    .run(quiet=True)
-               )
-
-               return output_path
-          except Exception as e:
-               logger.error(f"Audio preprocessing failed: {str(e)}")
-               return file_path  # Return original if preprocessing fails
+          return "audio.mp3", await run_in_threadpool(encode_for_upload, file_path)
 
      async def _calculate_confidence(self, segments: list) -> float:
           """
@@ -0,0 +1,47 @@
+import threading
+from collections import defaultdict
+
+
+class Metrics:
+     """
+     Minimal in-process counters and timings, exposed through GET /metrics.
+     Each process (API, worker) keeps its own numbers.
+     """
+
+     def __init__(self):
+          self._lock = threading.Lock()
+          self._counters = defaultdict(float)
+          self._timings = defaultdict(lambda: {"count": 0, "total": 0.0, "max": 0.0})
+
+     def increment(self, name: str, value: float = 1):
+          with self._lock:
+               self._counters[name] += value
+
+     def observe(self, name: str, seconds: float):
+          with self._lock:
+               timing = self._timings[name]
+               timing["count"] += 1
+               timing["total"] += seconds
+               timing["max"] = max(timing["max"], seconds)
+
+     def ratio(self, hits: str, misses: str) -> float:
+          with self._lock:
+               total = self._counters[hits] + self._counters[misses]
+               return self._counters[hits] / total if total else 0.0
+
+     def snapshot(self) -> dict:
+          with self._lock:
+               return {
+                    "counters": dict(self._counters),
+                    "timings": {
+                         name: {
+                              "count": t["count"],
+                              "avg": t["total"] / t["count"] if t["count"] else 0.0,
+                              "max": t["max"]
+                         }
+                         for name, t in self._timings.items()
+                    }
+               }
+
+
+metrics = Metrics()
@@ -0,0 +1,250 @@
+import argparse
+import asyncio
+import os
+import signal
+import socket
+from typing import Dict, List, Optional, Tuple
+from fastapi.concurrency import run_in_threadpool
+from app.config import settings
+from app.models.database import ProcessingJob, SessionLocal
+from app.services.events import publish_job
+from app.services.response_cache import get_response_cache
+from app.services.job_queue import (
+     STAGES, JobQueue, get_job_queue, claim_job, renew_lease, release_job, find_claimable_jobs,
+     release_expired_leases, count_waiting, next_stage
+)
+from app.utils.logger import logger
+from app.utils.metrics import metrics
+
+
+class Worker:
+     """
+     Pulls processing jobs off the queue and runs the pipeline stages it
+     serves, each with its own bounded number of slots, so one meeting can be
+     transcribed while others wait on Gemini or Jira. A worker serving only
+     some stages is one role of a split deployment (see README).
+
+     A stage stops taking new jobs while the next stage has
+     STAGE_BACKLOG_LIMIT or more jobs waiting, so a fast stage can't bury a
+     slow one.
+
+     Every claimed job holds a lease on its processing_jobs row which is renewed
+     while it runs. If the process dies the lease runs out and the recovery
+     loop (of this or any other worker) counts it as a failed attempt: the
+     job is retried with backoff, or failed once its attempts are used up.
+     """
+
+     def __init__(self, queue: JobQueue, concurrency: Dict[str, int]):
+          self.queue = queue
+          self.concurrency = concurrency
+          self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+          self._stopping = asyncio.Event()
+
+     async def run(self):
+          logger.info(f"Worker {self.worker_id} started with concurrency {self.concurrency}")
+          tasks = [
+               asyncio.create_task(self._slot(stage, i))
+               for stage, slots in self.concurrency.items()
+               for i in range(slots)
+          ]
+          tasks.append(asyncio.create_task(self._recover()))
+          try:
+               await self._stopping.wait()
+          finally:
+               for task in tasks:
+                    task.cancel()
+               await asyncio.gather(*tasks, return_exceptions=True)
+               logger.info(f"Worker {self.worker_id} stopped")
+
+     def stop(self):
+          self._stopping.set()
+
+     async def _slot(self, stage: str, index: int):
+          slot_id = f"{self.worker_id}:{stage}:{index}"
+          while not self._stopping.is_set():
+               try:
+                    if await run_in_threadpool(self._backlogged, stage):
+                         metrics.increment(f"worker_{stage}_backpressure_waits")
+                         await asyncio.sleep(settings.JOB_POLL_INTERVAL_SECONDS)
+                         continue
+                    job_id = await self.queue.dequeue(stage, timeout=settings.JOB_POLL_INTERVAL_SECONDS)
+                    if not job_id or not await run_in_threadpool(self._claim, job_id, slot_id, stage):
+                         continue
+                    await self._execute(job_id, stage, slot_id)
+               except asyncio.CancelledError:
+                    raise
+               except Exception as e:
+                    logger.error(f"Worker slot {slot_id} error: {str(e)}")
+                    await asyncio.sleep(settings.JOB_POLL_INTERVAL_SECONDS)
+
+     def _backlogged(self, stage: str) -> bool:
+          following = next_stage(stage)
+          if not following or settings.STAGE_BACKLOG_LIMIT <= 0:
+               return False
+          db = SessionLocal()
+          try:
+               return count_waiting(db, following) >= settings.STAGE_BACKLOG_LIMIT
+          finally:
+               db.close()
+
+     def _claim(self, job_id: str, slot_id: str, stage: str) -> bool:
+          db = SessionLocal()
+          try:
+               return claim_job(db, job_id, slot_id, stages=[stage])
+          finally:
+               db.close()
+
+     def _release(self, job_id: str, error: str) -> Tuple[Optional[float], Optional[ProcessingJob]]:
+          # Not expired on commit, so the job can be published after close
+          db = SessionLocal(expire_on_commit=False)
+          try:
+               delay = release_job(db, job_id, error)
+               return delay, db.get(ProcessingJob, job_id)
+          finally:
+               db.close()
+
+     def _renew(self, job_id: str, slot_id: str) -> bool:
+          db = SessionLocal()
+          try:
+               return renew_lease(db, job_id, slot_id)
+          finally:
+               db.close()
+
+     def _scan(self) -> Tuple[List[ProcessingJob], List[Tuple[str, str]]]:
+          """
+          Jobs released because their lease expired, and (id, stage) of due jobs
+          """
+          stages = list(self.concurrency)
+          db = SessionLocal(expire_on_commit=False)
+          try:
+               released = [
+                    db.get(ProcessingJob, job_id)
+                    for job_id in release_expired_leases(db, limit=100, stages=stages)
+               ]
+               return released, find_claimable_jobs(db, limit=100, stages=stages)
+          finally:
+               db.close()
+
+     async def _execute(self, job_id: str, stage: str, slot_id: str):
+          from app.services.pipeline import run_stage
+
+          logger.info(f"Worker {slot_id} picked up job {job_id}")
+          heartbeat = asyncio.create_task(self._heartbeat(job_id, slot_id))
+          try:
+               following = await run_stage(job_id, stage)
+               if following:
+                    await self.queue.enqueue(job_id, following)
+          except asyncio.CancelledError:
+               # Shutting down: leave the lease to expire so another worker resumes it
+               raise
+          except Exception as e:
+               delay, job = await run_in_threadpool(self._release, job_id, str(e))
+               if job:
+                    await get_response_cache().invalidate_meeting(job.meeting_id)
+                    await publish_job(job)
+
+               if delay is None:
+                    logger.error(f"Job {job_id} failed permanently: {str(e)}")
+               else:
+                    logger.warning(f"Job {job_id} failed, retrying in {delay:.0f}s: {str(e)}")
+                    await self.queue.enqueue_later(job_id, stage, delay)
+          finally:
+               heartbeat.cancel()
+
+     async def _heartbeat(self, job_id: str, slot_id: str):
+          interval = max(settings.JOB_LEASE_SECONDS / 3, 1)
+          while True:
+               await asyncio.sleep(interval)
+               try:
+                    if not await run_in_threadpool(self._renew, job_id, slot_id):
+                         logger.warning(f"Lost lease on job {job_id}")
+                         return
+               except Exception as e:
+                    logger.error(f"Lease renewal for job {job_id} failed: {str(e)}")
+
+     async def _recover(self):
+          """
+          Periodically release jobs whose worker died holding the lease and
+          re-dispatch jobs that are due after backoff
+          """
+          interval = max(settings.JOB_LEASE_SECONDS / 2, settings.JOB_POLL_INTERVAL_SECONDS)
+          while True:
+               try:
+                    released, jobs = await run_in_threadpool(self._scan)
+                    for job in released:
+                         logger.warning(f"Job {job.id} lost its worker: {job.message}")
+                         await get_response_cache().invalidate_meeting(job.meeting_id)
+                         await publish_job(job)
+                    if jobs:
+                         logger.info(f"Recovering {len(jobs)} due jobs")
+                         await self.queue.requeue(jobs)
+
+                    # Workers don't serve /metrics, so report their counters in the log
+                    counters = metrics.snapshot()["counters"]
+                    if counters:
+                         logger.info(f"Worker metrics: {counters}")
+               except asyncio.CancelledError:
+                    raise
+               except Exception as e:
+                    logger.error(f"Job recovery scan failed: {str(e)}")
+               await asyncio.sleep(interval)
+
+
+def stage_concurrency(stages: List[str], override: Optional[int] = None) -> Dict[str, int]:
+     """
+     Slots for each served stage, from the per-stage settings unless overridden
+     """
+     defaults = {
+          "transcribe": settings.TRANSCRIBE_CONCURRENCY,
+          "extract": settings.EXTRACT_CONCURRENCY,
+          "ticket": settings.TICKET_CONCURRENCY,
+     }
+     return {stage: override or defaults[stage] for stage in stages}
+
+
+def parse_roles(roles: List[str]) -> List[str]:
+     """
+     Stages served by the given roles; "all" (the default) serves every stage
+     """
+     stages = set()
+     for role in roles or ["all"]:
+          for name in role.split(","):
+               name = name.strip()
+               if name == "all":
+                    stages.update(STAGES)
+               elif name in STAGES:
+                    stages.add(name)
+               else:
+                    raise ValueError(f"Unknown worker role: {name}")
+     return [stage for stage in STAGES if stage in stages]
+
+
+async def run_worker(stages: List[str], concurrency: Optional[int] = None):
+     worker = Worker(get_job_queue(), stage_concurrency(stages, concurrency))
+
+     loop = asyncio.get_running_loop()
+     for sig in (signal.SIGINT, signal.SIGTERM):
+          try:
+               loop.add_signal_handler(sig, worker.stop)
+          except NotImplementedError:
+               pass
+
+     try:
+          await worker.run()
+     finally:
+          await worker.queue.close()
+
+
+if __name__ == "__main__":
+     parser = argparse.ArgumentParser(description="Meeting processing worker")
+     parser.add_argument(
+          "--role", action="append",
+          help=f"stages to serve: all (default) or any of {', '.join(STAGES)}, repeatable or comma separated"
+     )
+     parser.add_argument("--concurrency", type=int, default=None, help="slots for every served stage, instead of the per-stage settings")
+     args = parser.parse_args()
+     try:
+          stages = parse_roles(args.role)
+     except ValueError as e:
+          parser.error(str(e))
+     asyncio.run(run_worker(stages, args.concurrency))
@@ -0,0 +1,28 @@
+import os
+import tempfile
+
+# Nothing listens on port 9, so anything that does reach for Jira fails fast
+_DEFAULTS = {
+     "OPENAI_API_KEY": "bench",
+     "GEMINI_API_KEY": "bench",
+     "JIRA_SERVER": "http://127.0.0.1:9",
+     "JIRA_EMAIL": "bench@example.com",
+     "JIRA_API_TOKEN": "bench",
+     "SECRET_KEY": "bench",
+     "DEBUG": "True",
+}
+
+
+def bench_env(**overrides) -> dict:
+     """
+     Point the app at a throwaway SQLite database and dummy credentials,
+     plus any overrides. Variables already set in the environment win.
+     Settings are read on import, so call this before importing from app.
+     Returns the resulting environment, for subprocesses.
+     """
+     values = {**_DEFAULTS, **overrides}
+     if "DATABASE_URL" not in os.environ and "DATABASE_URL" not in values:
+          values["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp()}/bench.db"
+     for key, value in values.items():
+          os.environ.setdefault(key, str(value))
+     return dict(os.environ)
@@ -0,0 +1,101 @@
+"""
+Status-endpoint latency while requirement extractions are running.
+
+Gemini is replaced by a fake client that takes --llm-seconds per call.
+"blocking" mimics the old synchronous generate_content call on the event
+loop; "async" is the current client.aio path. The status endpoint is
+polled through the real router the whole time and its latency
+percentiles are reported.
+
+     python -m benchmarks.bench_extraction_latency --extractions 16 --llm-seconds 2
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from types import SimpleNamespace
+from unittest import mock
+
+from benchmarks import bench_env
+
+bench_env()
+
+RESPONSE = SimpleNamespace(text='{"requirements": []}')
+
+
+def fake_client(mode: str, seconds: float):
+     async def generate_content(**kwargs):
+          if mode == "blocking":
+               time.sleep(seconds)
+          else:
+               await asyncio.sleep(seconds)
+          return RESPONSE
+
+     return SimpleNamespace(aio=SimpleNamespace(models=SimpleNamespace(generate_content=generate_content)))
+
+
+def percentile(values, p):
+     values = sorted(values)
+     return values[min(int(len(values) * p), len(values) - 1)]
+
+
+async def _measure(mode: str, extractions: int, seconds: float, polls: int):
+     import httpx
+     from fastapi import FastAPI
+     from app.config import settings
+     from app.models.database import Base, Meeting, ProcessingJob, SessionLocal, engine
+     from app.services.extraction import RequirementExtractionService
+
+     with mock.patch("jira.JIRA"):
+          from app.api.routes import router
+
+     Base.metadata.create_all(engine)
+     db = SessionLocal()
+     meeting = Meeting(filename="m.wav", original_filename="m.wav", file_path="m.wav")
+     db.add(meeting)
+     db.flush()
+     db.add(ProcessingJob(meeting_id=meeting.id, status="processing", progress=30, message="Extracting"))
+     db.commit()
+     meeting_id = meeting.id
+     db.close()
+
+     settings.EXTRACTION_MAX_CONCURRENCY = extractions
+     with mock.patch("app.services.extraction.genai.Client", return_value=fake_client(mode, seconds)):
+          service = RequirementExtractionService()
+
+     app = FastAPI()
+     app.include_router(router, prefix="/api/v1")
+     transport = httpx.ASGITransport(app=app)
+
+     latencies = []
+     async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+          async def poll():
+               for _ in range(polls):
+                    start = time.perf_counter()
+                    response = await client.get(f"/api/v1/meetings/{meeting_id}/status")
+                    response.raise_for_status()
+                    latencies.append(time.perf_counter() - start)
+                    await asyncio.sleep(0.01)
+
+          work = [service.extract_requirements(f"transcript {i}") for i in range(extractions)] if mode != "idle" else []
+          await asyncio.gather(poll(), *work)
+
+     return latencies
+
+
+def main():
+     parser = argparse.ArgumentParser(description=__doc__)
+     parser.add_argument("--extractions", type=int, default=16)
+     parser.add_argument("--llm-seconds", type=float, default=2.0)
+     parser.add_argument("--polls", type=int, default=200)
+     args = parser.parse_args()
+
+     print(f"{'mode':<10} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+     for mode in ("idle", "async", "blocking"):
+          latencies = asyncio.run(_measure(mode, args.extractions, args.llm_seconds, args.polls))
+          print(f"{mode:<10} {statistics.median(latencies) * 1000:>8.1f} "
+                f"{percentile(latencies, 0.99) * 1000:>8.1f} {max(latencies) * 1000:>8.1f}")
+
+
+if __name__ == "__main__":
+     main()
@@ -0,0 +1,55 @@
+"""
+Per-issue versus bulk ticket creation against the local mock Jira server:
+wall time and number of HTTP requests spent, optionally with injected
+per-item failures to exercise partial-failure handling.
+
+     python -m benchmarks.bench_jira_bulk --requirements 200 --latency 0.2 --fail-rate 0.05
+"""
+import argparse
+import asyncio
+import os
+import time
+
+from benchmarks import bench_env
+
+bench_env(JIRA_RATE_LIMIT_PER_SECOND=1000, JIRA_RATE_LIMIT_BURST=1000)
+
+from benchmarks.bench_jira_concurrency import make_requirements
+from benchmarks.mock_jira import MockJira
+
+
+async def _run(bulk: bool, requirements):
+     from app.config import settings
+     from app.services.jira_service import JiraService
+
+     settings.JIRA_BULK_CREATE = bulk
+     service = JiraService()
+     start = time.perf_counter()
+     results = await service.create_tickets_for_requirements(requirements, "PROJ")
+     elapsed = time.perf_counter() - start
+     return elapsed, sum(1 for r in results if r.ticket), sum(1 for r in results if r.error)
+
+
+def main():
+     parser = argparse.ArgumentParser(description=__doc__)
+     parser.add_argument("--requirements", type=int, default=200)
+     parser.add_argument("--latency", type=float, default=0.2)
+     parser.add_argument("--fail-rate", type=float, default=0.0)
+     args = parser.parse_args()
+
+     requirements = make_requirements(args.requirements)
+     print(f"{'mode':<8} {'seconds':>9} {'requests':>9} {'created':>8} {'failed':>7}")
+     with MockJira(latency=args.latency, fail_rate=args.fail_rate) as jira:
+          os.environ["JIRA_SERVER"] = jira.url
+          from app.config import settings
+          settings.JIRA_SERVER = jira.url
+
+          for bulk in (False, True):
+               requests_before = jira.request_count
+               elapsed, created, failed = asyncio.run(_run(bulk, requirements))
+               print(f"{'bulk' if bulk else 'single':<8} {elapsed:>9.2f} "
+                     f"{jira.request_count - requests_before:>9} {created:>8} {failed:>7}")
+
+
+if __name__ == "__main__":
+     main()
@@ -0,0 +1,81 @@
+"""
+Ticket-creation wall time for one meeting against a local mock Jira server,
+sequential (JIRA_MAX_CONCURRENCY=1, the old behaviour) versus concurrent.
+With --throttle-every N the server answers every Nth request with a 429
+and the throttled/retried counters show how the transport coped.
+
+     python -m benchmarks.bench_jira_concurrency --requirements 40 --latency 0.2 --concurrency 1 4 8 16
+"""
+import argparse
+import asyncio
+import os
+import time
+
+from benchmarks import bench_env
+
+bench_env(JIRA_RATE_LIMIT_PER_SECOND=1000, JIRA_RATE_LIMIT_BURST=1000)
+
+from benchmarks.mock_jira import MockJira
+
+
+def make_requirements(count: int):
+     from app.models.schemas import RequirementExtracted, RequirementType
+
+     return [
+          RequirementExtracted(
+               text=f"We need feature number {i}",
+               summary=f"Feature {i}",
+               description=f"Implement feature {i}",
+               type=RequirementType.FEATURE,
+               labels=["bench"],
+               acceptance_criteria=["works"],
+               confidence=0.9,
+          )
+          for i in range(count)
+     ]
+
+
+async def _run(concurrency: int, requirements) -> float:
+     from app.config import settings
+     from app.services.jira_service import JiraService
+
+     settings.JIRA_MAX_CONCURRENCY = concurrency
+     service = JiraService()
+     start = time.perf_counter()
+     tickets = await service.create_tickets_from_requirements(requirements, "PROJ")
+     elapsed = time.perf_counter() - start
+     assert len(tickets) == len(requirements), f"only {len(tickets)} tickets created"
+     return elapsed
+
+
+def main():
+     parser = argparse.ArgumentParser(description=__doc__)
+     parser.add_argument("--requirements", type=int, default=40)
+     parser.add_argument("--latency", type=float, default=0.2)
+     parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8, 16])
+     parser.add_argument("--throttle-every", type=int, default=0)
+     parser.add_argument("--retry-after", type=float, default=0.5)
+     args = parser.parse_args()
+
+     with MockJira(latency=args.latency, throttle_every=args.throttle_every,
+                   retry_after=args.retry_after) as jira:
+          os.environ["JIRA_SERVER"] = jira.url
+          from app.config import settings
+          settings.JIRA_SERVER = jira.url
+
+          requirements = make_requirements(args.requirements)
+          from app.utils.metrics import metrics
+
+          print(f"{'concurrency':>12} {'seconds':>9} {'tickets/s':>10} {'throttled':>10} {'retries':>8}")
+          for concurrency in args.concurrency:
+               before = metrics.snapshot()["counters"]
+               elapsed = asyncio.run(_run(concurrency, requirements))
+               after = metrics.snapshot()["counters"]
+               throttled = after.get("jira_throttled", 0) - before.get("jira_throttled", 0)
+               retries = after.get("jira_retries", 0) - before.get("jira_retries", 0)
+               print(f"{concurrency:>12} {elapsed:>9.2f} {args.requirements / elapsed:>10.1f} "
+                     f"{throttled:>10.0f} {retries:>8.0f}")
+
+
+if __name__ == "__main__":
+     main()
@@ -0,0 +1,84 @@
+"""
+Wall-clock latency and accuracy of VAD-split parallel transcription against a
+single sequential pass over the same recording.
+
+WER is measured with the single-pass transcript as the reference; the script
+exits non-zero if it is above --max-wer.
+
+     TRANSCRIPTION_WORKERS=8 python -m benchmarks.bench_parallel_transcription all_hands.mp4
+"""
+import argparse
+import asyncio
+import re
+import sys
+import time
+
+from benchmarks import bench_env
+
+bench_env()
+
+
+def word_error_rate(reference: str, hypothesis: str) -> float:
+     ref = re.findall(r"[\w']+", reference.lower())
+     hyp = re.findall(r"[\w']+", hypothesis.lower())
+     if not ref:
+          return 0.0 if not hyp else 1.0
+
+     # Levenshtein distance over words, one row at a time
+     previous = list(range(len(hyp) + 1))
+     for i, r in enumerate(ref, 1):
+          current = [i] + [0] * len(hyp)
+          for j, h in enumerate(hyp, 1):
+               current[j] = min(
+                    previous[j] + 1,
+                    current[j - 1] + 1,
+                    previous[j - 1] + (r != h)
+               )
+          previous = current
+     return previous[-1] / len(ref)
+
+
+async def _run(path: str):
+     from app.config import settings
+     from app.services.transcription import TranscriptionService
+
+     settings.TRANSCRIPTION_PARALLEL_MIN_SECONDS = 0
+     service = TranscriptionService()
+     try:
+          start = time.perf_counter()
+          single = await service.transcribe(path)
+          single_seconds = time.perf_counter() - start
+
+          start = time.perf_counter()
+          parallel = await service.transcribe_parallel(path)
+          parallel_seconds = time.perf_counter() - start
+     finally:
+          service.close()
+
+     in_order = all(a.start <= b.start for a, b in zip(parallel.segments, parallel.segments[1:]))
+     wer = word_error_rate(
+          "".join(s.text for s in single.segments),
+          "".join(s.text for s in parallel.segments)
+     )
+     return single.duration, single_seconds, parallel_seconds, wer, in_order
+
+
+def main():
+     parser = argparse.ArgumentParser(description=__doc__)
+     parser.add_argument("audio")
+     parser.add_argument("--max-wer", type=float, default=0.05)
+     args = parser.parse_args()
+
+     duration, single_seconds, parallel_seconds, wer, in_order = asyncio.run(_run(args.audio))
+     print(f"audio duration       {duration:9.1f}s")
+     print(f"single pass          {single_seconds:9.1f}s")
+     print(f"parallel (VAD split) {parallel_seconds:9.1f}s  ({single_seconds / parallel_seconds:.1f}x)")
+     print(f"WER vs single pass   {wer:9.3f}  (max {args.max_wer})")
+     print(f"timestamps in order  {in_order!s:>9}")
+
+     if wer > args.max_wer or not in_order:
+          sys.exit(1)
+
+
+if __name__ == "__main__":
+     main()
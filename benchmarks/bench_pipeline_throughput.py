@@ -0,0 +1,209 @@
+"""
+Meetings per hour for a batch of synthetic recordings, processed strictly
+in sequence (every stage of one meeting before the next one starts) versus
+by a Worker with a bounded pool per stage, which transcribes the next
+meeting while earlier ones wait on Gemini and Jira.
+
+Recordings are --audio-seconds of tone and noise. Gemini is replaced by a
+fake that takes --llm-seconds per call and returns --requirements
+requirements; Jira is the local mock server with --jira-latency per
+request. --fake-transcription SECONDS swaps Whisper for a thread that
+sleeps that long (one transcribe slot then stands for one busy CPU).
+
+     python -m benchmarks.bench_pipeline_throughput --meetings 20 --llm-seconds 5 --jira-latency 0.2
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+import wave
+from unittest import mock
+
+import numpy as np
+
+from benchmarks import bench_env
+from benchmarks.bench_jira_concurrency import make_requirements
+from benchmarks.mock_jira import MockJira
+
+# Every run transcribes the same recordings, the cache would hide the work
+bench_env(DEBUG=False, JIRA_RATE_LIMIT_PER_SECOND=1000, JIRA_RATE_LIMIT_BURST=1000, TRANSCRIPTION_CACHE_ENABLED=False)
+
+SAMPLE_RATE = 16000
+
+
+def write_recording(path: str, seconds: float, seed: int):
+     rng = np.random.default_rng(seed)
+     t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+     audio = 0.3 * np.sin(2 * np.pi * rng.uniform(150, 400) * t) + 0.05 * rng.standard_normal(t.size)
+     pcm = (np.clip(audio, -1, 1) * 32767).astype(np.int16)
+     with wave.open(path, "wb") as f:
+          f.setnchannels(1)
+          f.setsampwidth(2)
+          f.setframerate(SAMPLE_RATE)
+          f.writeframes(pcm.tobytes())
+
+
+class FakeExtraction:
+     def __init__(self, seconds: float, count: int):
+          self.seconds = seconds
+          self.count = count
+
+     async def extract_requirements(self, transcription: str):
+          await asyncio.sleep(self.seconds)
+          return make_requirements(self.count)
+
+
+class FakeTranscription:
+     def __init__(self, seconds: float):
+          self.seconds = seconds
+
+     async def transcribe_audio(self, file_path: str, on_segment=None, content_hash=None):
+          from fastapi.concurrency import run_in_threadpool
+
+          await run_in_threadpool(time.sleep, self.seconds)
+          return "synthetic meeting", 0.9
+
+
+def seed(recordings: list) -> list:
+     from app.models.database import Meeting, ProcessingJob, SessionLocal
+     from app.services.job_queue import STAGES
+
+     db = SessionLocal()
+     job_ids = []
+     for path in recordings:
+          meeting = Meeting(filename=os.path.basename(path), original_filename=os.path.basename(path), file_path=path)
+          db.add(meeting)
+          db.flush()
+          job = ProcessingJob(
+               meeting_id=meeting.id, stage=STAGES[0], status="queued", progress=0,
+               message="Queued for processing....", payload={"project_key": "PROJ"}, max_attempts=1
+          )
+          db.add(job)
+          db.flush()
+          job_ids.append(job.id)
+     db.commit()
+     db.close()
+     return job_ids
+
+
+def count_finished(job_ids: list) -> tuple:
+     from app.models.database import ProcessingJob, SessionLocal
+
+     db = SessionLocal()
+     try:
+          statuses = [
+               status for (status,) in
+               db.query(ProcessingJob.status).filter(ProcessingJob.id.in_(job_ids)).all()
+          ]
+     finally:
+          db.close()
+     return statuses.count("completed"), statuses.count("failed")
+
+
+async def run_sequential(job_ids: list):
+     from app.services.job_queue import STAGES
+     from app.services.pipeline import run_stage
+
+     for job_id in job_ids:
+          stage = STAGES[0]
+          while stage:
+               try:
+                    stage = await run_stage(job_id, stage)
+               except Exception:
+                    break
+
+
+async def run_pipelined(job_ids: list, concurrency: dict):
+     from app.services.job_queue import STAGES, MemoryJobQueue
+     from app.worker import Worker
+
+     queue = MemoryJobQueue()
+     worker = Worker(queue, concurrency)
+     task = asyncio.create_task(worker.run())
+     for job_id in job_ids:
+          await queue.enqueue(job_id, STAGES[0])
+     while sum(count_finished(job_ids)) < len(job_ids):
+          await asyncio.sleep(0.2)
+     worker.stop()
+     await task
+
+
+async def _measure(mode: str, recordings: list, args) -> dict:
+     from app.services.jira_metadata import get_jira_metadata
+     from app.services.jira_service import get_jira_service
+     from app.services.job_queue import STAGES
+     from app.worker import stage_concurrency
+
+     # Services hold asyncio primitives, build them on this run's loop
+     get_jira_service.cache_clear()
+     get_jira_metadata.cache_clear()
+
+     job_ids = seed(recordings)
+     started = time.perf_counter()
+     with mock.patch("app.services.pipeline.get_extraction_service",
+                     return_value=FakeExtraction(args.llm_seconds, args.requirements)):
+          if mode == "sequential":
+               await run_sequential(job_ids)
+          else:
+               concurrency = stage_concurrency(list(STAGES))
+               concurrency.update({
+                    stage: value for stage, value in
+                    (("transcribe", args.transcribe), ("extract", args.extract), ("ticket", args.ticket))
+                    if value
+               })
+               await run_pipelined(job_ids, concurrency)
+     elapsed = time.perf_counter() - started
+
+     completed, failed = count_finished(job_ids)
+     return {"seconds": elapsed, "per_hour": len(job_ids) / elapsed * 3600, "completed": completed, "failed": failed}
+
+
+def main():
+     parser = argparse.ArgumentParser(description=__doc__)
+     parser.add_argument("--meetings", type=int, default=20)
+     parser.add_argument("--audio-seconds", type=float, default=60.0)
+     parser.add_argument("--llm-seconds", type=float, default=5.0)
+     parser.add_argument("--requirements", type=int, default=5, help="requirements (and tickets) per meeting")
+     parser.add_argument("--jira-latency", type=float, default=0.2)
+     parser.add_argument("--fake-transcription", type=float, default=0.0, help="seconds per meeting instead of Whisper")
+     parser.add_argument("--transcribe", type=int, default=0, help="transcribe slots (default TRANSCRIBE_CONCURRENCY)")
+     parser.add_argument("--extract", type=int, default=0, help="extract slots (default EXTRACT_CONCURRENCY)")
+     parser.add_argument("--ticket", type=int, default=0, help="ticket slots (default TICKET_CONCURRENCY)")
+     args = parser.parse_args()
+
+     audio_dir = tempfile.mkdtemp()
+     recordings = []
+     for i in range(args.meetings):
+          path = os.path.join(audio_dir, f"meeting-{i}.wav")
+          write_recording(path, args.audio_seconds, i)
+          recordings.append(path)
+
+     with MockJira(latency=args.jira_latency) as jira:
+          os.environ["JIRA_SERVER"] = jira.url
+          from app.config import settings
+          from app.models.database import Base, engine
+          settings.JIRA_SERVER = jira.url
+          settings.JOB_POLL_INTERVAL_SECONDS = 0.1
+          Base.metadata.create_all(engine)
+
+          if args.fake_transcription:
+               patcher = mock.patch(
+                    "app.services.transcription.get_transcription_service",
+                    return_value=FakeTranscription(args.fake_transcription)
+               )
+               patcher.start()
+          else:
+               # Load the model up front so neither mode pays for it
+               from app.services.transcription import get_transcription_service
+               get_transcription_service()
+
+          print(f"{'mode':<11} {'seconds':>9} {'meetings/h':>11} {'completed':>10} {'failed':>7}")
+          for mode in ("sequential", "pipelined"):
+               result = asyncio.run(_measure(mode, recordings, args))
+               print(f"{mode:<11} {result['seconds']:>9.1f} {result['per_hour']:>11.0f} "
+                     f"{result['completed']:>10} {result['failed']:>7}")
+
+
+if __name__ == "__main__":
+     main()
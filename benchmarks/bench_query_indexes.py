@@ -0,0 +1,162 @@
+"""
+Per-endpoint read latency on a large database, without and with the
+indexes added in migrations e6b3f0a8d214 and 7b2d9e4c1f58.
+
+Seeds --meetings meetings, each with a processing job and --requirements
+requirements that all have a Jira ticket, then drops the indexes on
+meetings (created_at, id), requirements.meeting_id, jira_tickets.requirement_id
+and processing_jobs.meeting_id, times the read endpoints through the real
+router, recreates the indexes and times them again.
+
+Uses a throwaway SQLite file unless DATABASE_URL points somewhere else
+(use an empty database, the tables are created and filled here).
+
+     python -m benchmarks.bench_query_indexes --meetings 1000000
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from benchmarks import bench_env
+
+# Time the queries, not response cache hits
+bench_env(RESPONSE_CACHE_BACKEND="none")
+
+BATCH_SIZE = 10000
+
+INDEXES = [
+     ("ix_meetings_created_at_id", "meetings", "created_at, id"),
+     ("ix_requirements_meeting_id", "requirements", "meeting_id"),
+     ("ix_jira_tickets_requirement_id", "jira_tickets", "requirement_id"),
+     ("ix_processing_jobs_meeting_id", "processing_jobs", "meeting_id"),
+]
+
+
+def percentile(values, p):
+     values = sorted(values)
+     return values[min(int(len(values) * p), len(values) - 1)]
+
+
+def seed(engine, meetings: int, requirements: int) -> list:
+     """
+     Bulk insert the data set and return the meeting ids
+     """
+     from app.models.database import Meeting, ProcessingJob, Requirement, JiraTicket
+
+     meeting_ids = []
+     start = datetime.now(timezone.utc) - timedelta(seconds=meetings)
+     for offset in range(0, meetings, BATCH_SIZE):
+          meeting_rows, job_rows, requirement_rows, ticket_rows = [], [], [], []
+          for i in range(offset, min(offset + BATCH_SIZE, meetings)):
+               meeting_id = str(uuid.uuid4())
+               meeting_ids.append(meeting_id)
+               meeting_rows.append({
+                    "id": meeting_id, "filename": f"{i}.wav", "original_filename": f"{i}.wav",
+                    "file_path": f"uploads/{i}.wav", "duration": 1800.0, "processed": True,
+                    "created_at": start + timedelta(seconds=i)
+               })
+               job_rows.append({
+                    "id": str(uuid.uuid4()), "meeting_id": meeting_id, "status": "completed",
+                    "progress": 100, "message": "Processing completed successfully",
+                    "attempts": 1, "max_attempts": 3
+               })
+               for r in range(requirements):
+                    requirement_id = str(uuid.uuid4())
+                    requirement_rows.append({
+                         "id": requirement_id, "meeting_id": meeting_id, "text": "text",
+                         "summary": f"Requirement {r}", "requirement_type": "task",
+                         "jira_ticket_key": f"PROJ-{i * requirements + r}"
+                    })
+                    ticket_rows.append({
+                         "id": str(uuid.uuid4()), "requirement_id": requirement_id,
+                         "ticket_key": f"PROJ-{i * requirements + r}", "url": "http://jira/browse",
+                         "summary": f"Requirement {r}", "status": "To Do"
+                    })
+
+          with engine.begin() as conn:
+               conn.execute(Meeting.__table__.insert(), meeting_rows)
+               conn.execute(ProcessingJob.__table__.insert(), job_rows)
+               if requirement_rows:
+                    conn.execute(Requirement.__table__.insert(), requirement_rows)
+                    conn.execute(JiraTicket.__table__.insert(), ticket_rows)
+          print(f"seeded {len(meeting_ids)}/{meetings} meetings", end="\r", flush=True)
+     print()
+     return meeting_ids
+
+
+def set_indexes(engine, present: bool):
+     from sqlalchemy import text
+
+     with engine.begin() as conn:
+          for name, table, column in INDEXES:
+               if present:
+                    conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({column})"))
+               else:
+                    conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+          if engine.dialect.name == "postgresql":
+               conn.execute(text("ANALYZE"))
+
+
+async def measure(meeting_ids: list, requests: int) -> dict:
+     import httpx
+     from fastapi import FastAPI
+     from app.api.routes import router
+     from app.models.database import async_engine
+
+     app = FastAPI()
+     app.include_router(router, prefix="/api/v1")
+     endpoints = {
+          "status": "/api/v1/meetings/{id}/status",
+          "transcript": "/api/v1/meetings/{id}/transcript",
+          "tickets": "/api/v1/meetings/{id}/tickets",
+          "list": "/api/v1/meetings?limit=20",
+     }
+
+     results = {}
+     async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+          for name, path in endpoints.items():
+               latencies = []
+               for _ in range(requests):
+                    url = path.format(id=random.choice(meeting_ids))
+                    start = time.perf_counter()
+                    response = await client.get(url)
+                    response.raise_for_status()
+                    latencies.append(time.perf_counter() - start)
+               results[name] = latencies
+
+     await async_engine.dispose()
+     return results
+
+
+def main():
+     parser = argparse.ArgumentParser(description=__doc__)
+     parser.add_argument("--meetings", type=int, default=1000000)
+     parser.add_argument("--requirements", type=int, default=2, help="requirements (and tickets) per meeting")
+     parser.add_argument("--requests", type=int, default=50, help="requests per endpoint and phase")
+     args = parser.parse_args()
+
+     from app.models.database import Base, engine
+
+     Base.metadata.create_all(engine)
+     started = time.perf_counter()
+     meeting_ids = seed(engine, args.meetings, args.requirements)
+     print(f"seeded in {time.perf_counter() - started:.0f}s")
+
+     phases = {}
+     for phase, present in (("before", False), ("after", True)):
+          set_indexes(engine, present)
+          phases[phase] = asyncio.run(measure(meeting_ids, args.requests))
+
+     print(f"{'endpoint':<12} {'before p50':>11} {'before p99':>11} {'after p50':>10} {'after p99':>10}")
+     for name in phases["before"]:
+          before, after = phases["before"][name], phases["after"][name]
+          print(f"{name:<12} {statistics.median(before) * 1000:>9.1f}ms {percentile(before, 0.99) * 1000:>9.1f}ms "
+                f"{statistics.median(after) * 1000:>8.1f}ms {percentile(after, 0.99) * 1000:>8.1f}ms")
+
+
+if __name__ == "__main__":
+     main()
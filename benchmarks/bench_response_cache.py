@@ -0,0 +1,129 @@
+"""
+Load test of the read endpoints with and without the response cache.
+
+Seeds --meetings finished meetings with requirements and tickets, then
+--clients concurrent clients each send --requests reads spread over
+/meetings/{id}/status, /meetings/{id}/tickets, /meetings/{id} and
+/meetings, picking meetings from a hot set of --hot ids. Reports
+throughput, latency, cache hit ratio and SQL statements per request.
+
+     python -m benchmarks.bench_response_cache --clients 50 --requests 200
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from benchmarks import bench_env
+
+bench_env()
+
+ENDPOINTS = [
+     "/api/v1/meetings/{id}/status",
+     "/api/v1/meetings/{id}/tickets",
+     "/api/v1/meetings/{id}",
+     "/api/v1/meetings?limit=20",
+]
+
+
+def percentile(values, p):
+     values = sorted(values)
+     return values[min(int(len(values) * p), len(values) - 1)]
+
+
+async def _load(backend: str, meeting_ids: list, clients: int, requests: int):
+     import httpx
+     from fastapi import FastAPI
+     from app.api.routes import router
+     from app.config import settings
+     from app.models.database import async_engine
+     from app.services.response_cache import get_response_cache
+     from app.utils.metrics import metrics
+
+     settings.RESPONSE_CACHE_BACKEND = backend
+     get_response_cache.cache_clear()
+
+     app = FastAPI()
+     app.include_router(router, prefix="/api/v1")
+
+     before = metrics.snapshot()["counters"]
+     latencies = []
+     async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+          async def run_client():
+               for _ in range(requests):
+                    url = random.choice(ENDPOINTS).format(id=random.choice(meeting_ids))
+                    start = time.perf_counter()
+                    response = await client.get(url)
+                    response.raise_for_status()
+                    latencies.append(time.perf_counter() - start)
+
+          started = time.perf_counter()
+          await asyncio.gather(*(run_client() for _ in range(clients)))
+          elapsed = time.perf_counter() - started
+
+     await async_engine.dispose()
+     after = metrics.snapshot()["counters"]
+
+     def delta(name):
+          return after.get(name, 0) - before.get(name, 0)
+
+     lookups = delta("response_cache_hits") + delta("response_cache_misses")
+     return {
+          "rps": len(latencies) / elapsed,
+          "p50": statistics.median(latencies),
+          "p99": percentile(latencies, 0.99),
+          "hit_ratio": delta("response_cache_hits") / lookups if lookups else 0.0,
+          "queries_per_request": delta("db_queries") / len(latencies)
+     }
+
+
+def seed(meetings: int, requirements: int) -> list:
+     from app.models.database import Base, Meeting, ProcessingJob, Requirement, JiraTicket, SessionLocal, engine
+
+     Base.metadata.create_all(engine)
+     db = SessionLocal()
+     meeting_ids = []
+     for i in range(meetings):
+          meeting = Meeting(filename=f"{i}.wav", original_filename=f"{i}.wav", file_path=f"{i}.wav", processed=True)
+          db.add(meeting)
+          db.flush()
+          db.add(ProcessingJob(meeting_id=meeting.id, status="completed", progress=100, message="done"))
+          for r in range(requirements):
+               requirement = Requirement(
+                    meeting_id=meeting.id, text="text", summary=f"Requirement {r}",
+                    requirement_type="task", jira_ticket_key=f"PROJ-{i}-{r}"
+               )
+               db.add(requirement)
+               db.flush()
+               db.add(JiraTicket(
+                    requirement_id=requirement.id, ticket_key=f"PROJ-{i}-{r}",
+                    url="http://jira/browse", summary=f"Requirement {r}", status="To Do"
+               ))
+          meeting_ids.append(meeting.id)
+     db.commit()
+     db.close()
+     return meeting_ids
+
+
+def main():
+     parser = argparse.ArgumentParser(description=__doc__)
+     parser.add_argument("--meetings", type=int, default=2000)
+     parser.add_argument("--requirements", type=int, default=3)
+     parser.add_argument("--hot", type=int, default=100, help="distinct meetings that are read")
+     parser.add_argument("--clients", type=int, default=50)
+     parser.add_argument("--requests", type=int, default=200, help="requests per client")
+     args = parser.parse_args()
+
+     meeting_ids = seed(args.meetings, args.requirements)
+     hot = random.sample(meeting_ids, min(args.hot, len(meeting_ids)))
+
+     print(f"{'cache':<8} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8} {'hit %':>6} {'queries/req':>12}")
+     for backend in ("none", "memory"):
+          result = asyncio.run(_load(backend, hot, args.clients, args.requests))
+          print(f"{backend:<8} {result['rps']:>8.0f} {result['p50'] * 1000:>8.1f} {result['p99'] * 1000:>8.1f} "
+                f"{result['hit_ratio'] * 100:>6.1f} {result['queries_per_request']:>12.2f}")
+
+
+if __name__ == "__main__":
+     main()
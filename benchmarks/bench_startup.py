@@ -0,0 +1,88 @@
+"""
+API startup cost: time to import app.main, and time from launching uvicorn
+to the first successful request (/health/live, then /health/ready).
+
+Jira points at an address nothing listens on, to show that an unreachable
+Jira no longer holds up (or breaks) startup. Each measurement runs in a
+fresh interpreter.
+
+     python -m benchmarks.bench_startup --runs 5
+"""
+import argparse
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+from benchmarks import bench_env
+
+# For the child interpreters; this process never imports the app
+ENV = bench_env(DEBUG=False, JOB_QUEUE_BACKEND="database")
+
+IMPORT_SCRIPT = "import time; t = time.perf_counter(); import app.main; print(time.perf_counter() - t)"
+
+
+def free_port() -> int:
+     with socket.socket() as s:
+          s.bind(("127.0.0.1", 0))
+          return s.getsockname()[1]
+
+
+def import_time() -> float:
+     output = subprocess.run(
+          [sys.executable, "-c", IMPORT_SCRIPT],
+          env=ENV, capture_output=True, text=True, check=True
+     )
+     return float(output.stdout.strip().splitlines()[-1])
+
+
+def wait_for(url: str, started: float, timeout: float) -> float:
+     while time.perf_counter() - started < timeout:
+          try:
+               with urllib.request.urlopen(url, timeout=1) as response:
+                    if response.status == 200:
+                         return time.perf_counter() - started
+          except Exception:
+               pass
+          time.sleep(0.02)
+     raise TimeoutError(f"{url} not up after {timeout}s")
+
+
+def first_request_time(timeout: float):
+     port = free_port()
+     started = time.perf_counter()
+     server = subprocess.Popen(
+          [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+          env=ENV, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+     )
+     try:
+          live = wait_for(f"http://127.0.0.1:{port}/api/v1/health/live", started, timeout)
+          ready = wait_for(f"http://127.0.0.1:{port}/api/v1/health/ready", started, timeout)
+          return live, ready
+     finally:
+          server.terminate()
+          server.wait()
+
+
+def main():
+     parser = argparse.ArgumentParser(description=__doc__)
+     parser.add_argument("--runs", type=int, default=5)
+     parser.add_argument("--timeout", type=float, default=60.0)
+     args = parser.parse_args()
+
+     imports, lives, readies = [], [], []
+     for _ in range(args.runs):
+          imports.append(import_time())
+          live, ready = first_request_time(args.timeout)
+          lives.append(live)
+          readies.append(ready)
+
+     print(f"{'metric':<22} {'median s':>9} {'max s':>7}")
+     for name, values in (("import app.main", imports), ("first /health/live", lives), ("first /health/ready", readies)):
+          print(f"{name:<22} {statistics.median(values):>9.2f} {max(values):>7.2f}")
+
+
+if __name__ == "__main__":
+     main()
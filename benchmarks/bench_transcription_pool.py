@@ -0,0 +1,56 @@
+"""
+Transcription throughput against the number of worker processes.
+
+Transcribes --files copies of one recording concurrently for each value of
+--workers and reports recordings per minute. On a many-core box keep
+workers * cpu_threads close to the number of physical cores.
+
+     python -m benchmarks.bench_transcription_pool meeting.wav --workers 1 2 4 8 --cpu-threads 4
+"""
+import argparse
+import asyncio
+import os
+import time
+
+from benchmarks import bench_env
+
+# Every run transcribes the same recording, the cache would hide the pool
+bench_env(TRANSCRIPTION_CACHE_ENABLED=False)
+
+
+async def _run(path: str, files: int) -> float:
+     from app.services.transcription import TranscriptionService
+
+     service = TranscriptionService()
+     try:
+          start = time.perf_counter()
+          await asyncio.gather(*(service.transcribe_audio(path) for _ in range(files)))
+          return time.perf_counter() - start
+     finally:
+          service.close()
+
+
+def main():
+     parser = argparse.ArgumentParser(description=__doc__)
+     parser.add_argument("audio")
+     parser.add_argument("--workers", type=int, nargs="+", default=[0, 1, 2, 4])
+     parser.add_argument("--cpu-threads", type=int, default=0)
+     parser.add_argument("--files", type=int, default=8)
+     args = parser.parse_args()
+
+     # Spawned pool processes read their settings from the environment
+     os.environ["WHISPER_CPU_THREADS"] = str(args.cpu_threads)
+
+     from app.config import settings
+     settings.WHISPER_CPU_THREADS = args.cpu_threads
+
+     print(f"{'workers':>8} {'cpu_threads':>12} {'seconds':>9} {'files/min':>10}")
+     for workers in args.workers:
+          settings.TRANSCRIPTION_WORKERS = workers
+          os.environ["TRANSCRIPTION_WORKERS"] = str(workers)
+          elapsed = asyncio.run(_run(args.audio, args.files))
+          print(f"{workers:>8} {args.cpu_threads:>12} {elapsed:>9.1f} {args.files / elapsed * 60:>10.2f}")
+
+
+if __name__ == "__main__":
+     main()
@@ -0,0 +1,114 @@
+"""
+Peak RSS of FileService.save_uploaded_file against upload size.
+
+Each (mode, size) pair runs in a fresh subprocess so ru_maxrss reflects a
+single upload. "buffered" reproduces the old read-everything path, "streaming"
+is the current chunked implementation.
+
+     python -m benchmarks.bench_upload --sizes 16 64 256 --concurrency 10
+"""
+import argparse
+import asyncio
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks import bench_env
+
+bench_env()
+
+MB = 1024 * 1024
+
+
+def _peak_rss_mb() -> float:
+     # ru_maxrss is KiB on Linux, bytes on macOS
+     rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+     return rss / MB if sys.platform == "darwin" else rss / 1024
+
+
+def _make_source(size_mb: int) -> str:
+     fd, path = tempfile.mkstemp(suffix=".wav")
+     with os.fdopen(fd, "wb") as f:
+          for _ in range(size_mb):
+               f.write(os.urandom(MB))
+     return path
+
+
+async def _run_child(mode: str, size_mb: int, concurrency: int) -> dict:
+     import aiofiles
+     from starlette.datastructures import UploadFile
+     from app.config import settings
+     from app.services.file_service import FileService
+
+     settings.MAX_FILE_SIZE = max(settings.MAX_FILE_SIZE, (size_mb + 1) * MB)
+     upload_dir = tempfile.mkdtemp()
+     settings.UPLOAD_DIR = upload_dir
+     service = FileService()
+
+     source = _make_source(size_mb)
+     baseline = _peak_rss_mb()
+
+     async def buffered(upload: UploadFile):
+          path = os.path.join(upload_dir, f"buffered-{id(upload)}.wav")
+          async with aiofiles.open(path, "wb") as f:
+               content = await upload.read()
+               await f.write(content)
+          return path
+
+     async def one():
+          with open(source, "rb") as fh:
+               upload = UploadFile(file=fh, filename="meeting.wav")
+               if mode == "buffered":
+                    return await buffered(upload)
+               path, _, _ = await service.save_uploaded_file(upload)
+               return path
+
+     start = time.perf_counter()
+     paths = await asyncio.gather(*(one() for _ in range(concurrency)))
+     elapsed = time.perf_counter() - start
+
+     for path in paths:
+          os.remove(path)
+     os.remove(source)
+
+     return {
+          "mode": mode,
+          "size_mb": size_mb,
+          "concurrency": concurrency,
+          "peak_rss_delta_mb": round(_peak_rss_mb() - baseline, 1),
+          "seconds": round(elapsed, 3),
+     }
+
+
+def main():
+     parser = argparse.ArgumentParser(description=__doc__)
+     parser.add_argument("--sizes", type=int, nargs="+", default=[16, 64, 256])
+     parser.add_argument("--concurrency", type=int, default=1)
+     parser.add_argument("--child", nargs=2, metavar=("MODE", "SIZE"))
+     args = parser.parse_args()
+
+     if args.child:
+          mode, size = args.child
+          result = asyncio.run(_run_child(mode, int(size), args.concurrency))
+          print(json.dumps(result))
+          return
+
+     print(f"{'mode':<10} {'size MB':>8} {'uploads':>8} {'peak RSS +MB':>13} {'seconds':>8}")
+     for size in args.sizes:
+          for mode in ("buffered", "streaming"):
+               out = subprocess.run(
+                    [sys.executable, "-m", "benchmarks.bench_upload",
+                     "--child", mode, str(size), "--concurrency", str(args.concurrency)],
+                    check=True, capture_output=True, text=True
+               ).stdout.strip().splitlines()[-1]
+               r = json.loads(out)
+               print(f"{r['mode']:<10} {r['size_mb']:>8} {r['concurrency']:>8} "
+                     f"{r['peak_rss_delta_mb']:>13} {r['seconds']:>8}")
+
+
+if __name__ == "__main__":
+     main()
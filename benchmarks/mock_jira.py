@@ -0,0 +1,158 @@
+"""
+Small threaded stand-in for the Jira REST API used by the Jira benchmarks.
+
+Implements just what JiraService touches: serverInfo, single and bulk issue
+creation, issue fetch, search, projects and issue types. Every request
+sleeps for `latency` seconds; `fail_rate` makes that share of created
+issues fail and `throttle_every` answers every Nth request with a 429.
+"""
+import itertools
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+class MockJira:
+     def __init__(self, latency: float = 0.05, fail_rate: float = 0.0,
+                  throttle_every: int = 0, retry_after: float = 1.0, port: int = 0):
+          self.latency = latency
+          self.fail_rate = fail_rate
+          self.throttle_every = throttle_every
+          self.retry_after = retry_after
+          self.counter = itertools.count(1)
+          self.requests = itertools.count(1)
+          self.lock = threading.Lock()
+          self.request_count = 0
+          self.issues = {}
+          self.server = ThreadingHTTPServer(("127.0.0.1", port), self._handler())
+          self.server.daemon_threads = True
+          self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+     def __enter__(self):
+          threading.Thread(target=self.server.serve_forever, daemon=True).start()
+          return self
+
+     def __exit__(self, *exc):
+          self.server.shutdown()
+          self.server.server_close()
+
+     def _new_issue(self, fields: dict) -> dict:
+          number = next(self.counter)
+          key = f"{fields.get('project', {}).get('key', 'PROJ')}-{number}"
+          issue = {
+               "id": str(10000 + number),
+               "key": key,
+               "self": f"{self.url}/rest/api/2/issue/{key}",
+               "fields": {
+                    "summary": fields.get("summary"),
+                    "status": {"name": "To Do", "id": "1"},
+               },
+          }
+          with self.lock:
+               self.issues[key] = issue
+          return issue
+
+     def _handler(self):
+          mock = self
+
+          class Handler(BaseHTTPRequestHandler):
+               def log_message(self, *args):
+                    pass
+
+               def _send(self, status: int, body, headers=None):
+                    payload = json.dumps(body).encode()
+                    self.send_response(status)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(payload)))
+                    for name, value in (headers or {}).items():
+                         self.send_header(name, value)
+                    self.end_headers()
+                    self.wfile.write(payload)
+
+               def _body(self) -> dict:
+                    length = int(self.headers.get("Content-Length") or 0)
+                    return json.loads(self.rfile.read(length) or b"{}")
+
+               def _throttled(self) -> bool:
+                    with mock.lock:
+                         mock.request_count += 1
+                    n = next(mock.requests)
+                    if mock.throttle_every and n % mock.throttle_every == 0:
+                         self._send(429, {"errorMessages": ["Rate limit exceeded"]},
+                                    {"Retry-After": str(mock.retry_after)})
+                         return True
+                    return False
+
+               def do_GET(self):
+                    if self._throttled():
+                         return
+                    time.sleep(mock.latency)
+                    url = urlparse(self.path)
+                    path = url.path.rstrip("/")
+                    if path.endswith("/serverInfo"):
+                         return self._send(200, {
+                              "baseUrl": mock.url, "version": "9.4.0",
+                              "versionNumbers": [9, 4, 0], "deploymentType": "Server",
+                         })
+                    if path.endswith("/project"):
+                         return self._send(200, [
+                              {"id": "1", "key": "PROJ", "name": "Project"},
+                              {"id": "2", "key": "OPS", "name": "Operations"},
+                         ])
+                    if path.rsplit("/", 2)[-2] == "project":
+                         key = path.rsplit("/", 1)[-1]
+                         return self._send(200, {
+                              "id": "1", "key": key, "name": key,
+                              "issueTypes": [
+                                   {"id": str(i), "name": name, "subtask": False}
+                                   for i, name in enumerate(["Task", "Story", "Bug", "Epic"], 1)
+                              ]
+                         })
+                    if "/issuetype" in path or path.endswith("/statuses"):
+                         return self._send(200, [
+                              {"id": str(i), "name": name, "subtask": False}
+                              for i, name in enumerate(["Task", "Story", "Bug", "Epic"], 1)
+                         ])
+                    if path.endswith("/user/assignable/search"):
+                         return self._send(200, [{"name": "dev", "displayName": "Developer", "accountId": "1"}])
+                    if path.endswith("/search"):
+                         jql = parse_qs(url.query).get("jql", [""])[0]
+                         keys = [k.strip() for k in jql.split("(")[-1].rstrip(")").split(",")]
+                         issues = [mock.issues[k] for k in keys if k in mock.issues]
+                         return self._send(200, {"startAt": 0, "maxResults": len(issues),
+                                                 "total": len(issues), "issues": issues})
+                    if "/issue/" in path:
+                         key = path.rsplit("/", 1)[-1]
+                         if key in mock.issues:
+                              return self._send(200, mock.issues[key])
+                    self._send(404, {"errorMessages": ["Not found"]})
+
+               def do_POST(self):
+                    if self._throttled():
+                         return
+                    time.sleep(mock.latency)
+                    path = urlparse(self.path).path.rstrip("/")
+                    body = self._body()
+                    if path.endswith("/issue/bulk"):
+                         issues, errors = [], []
+                         for i, update in enumerate(body.get("issueUpdates", [])):
+                              if random.random() < mock.fail_rate:
+                                   errors.append({
+                                        "status": 400, "failedElementNumber": i,
+                                        "elementErrors": {"errors": {"summary": "Injected failure"}},
+                                   })
+                              else:
+                                   issue = mock._new_issue(update.get("fields", {}))
+                                   issues.append({k: issue[k] for k in ("id", "key", "self")})
+                         return self._send(201, {"issues": issues, "errors": errors})
+                    if path.endswith("/issue"):
+                         if random.random() < mock.fail_rate:
+                              return self._send(400, {"errors": {"summary": "Injected failure"}})
+                         issue = mock._new_issue(body.get("fields", {}))
+                         return self._send(201, {k: issue[k] for k in ("id", "key", "self")})
+                    self._send(404, {"errorMessages": ["Not found"]})
+
+          return Handler
@@ -22,36 +22,81 @@ function App() {
     setStatus({ message, type });
   };
 
-  const pollStatus = useCallback(async (meetingId) => {
-    try {
-      const response = await fetch(`/api/v1/meetings/${meetingId}/status`);
-      const data = await response.json();
-
-      console.log(data);
-      if (!response.ok) throw new Error(data.detail || "Failed to get status");
+  const fetchTickets = useCallback(async (meetingId) => {
+    const ticketsResponse = await fetch(
+      `/api/v1/meetings/${meetingId}?fields=tickets`
+    );
+    const ticketsData = await ticketsResponse.json();
+    setTickets(ticketsData.tickets || []);
+  }, []);
 
+  // Returns true once the job has finished
+  const applyStatus = useCallback(
+    async (meetingId, data) => {
       setProgress(data.progress);
       showStatus(data.message, "info");
 
       if (data.status === "completed") {
         showStatus("Processing Complete! 🎉", "success");
         setIsProcessing(false);
-        const ticketsResponse = await fetch(
-          `/api/v1/meetings/${meetingId}/tickets`
-        );
-        const ticketsData = await ticketsResponse.json();
-        setTickets(ticketsData.tickets || []);
-      } else if (data.status === "failed") {
+        await fetchTickets(meetingId);
+        return true;
+      }
+      if (data.status === "failed") {
         showStatus(`Processing failed: ${data.message}`, "error");
         setIsProcessing(false);
-      } else {
-        setTimeout(() => pollStatus(meetingId), 3000);
+        return true;
       }
-    } catch (error) {
-      showStatus(`Status check failed: ${error.message}`, "error");
-      setIsProcessing(false);
-    }
-  }, []);
+      return false;
+    },
+    [fetchTickets]
+  );
+
+  const pollStatus = useCallback(
+    async (meetingId) => {
+      try {
+        const response = await fetch(`/api/v1/meetings/${meetingId}/status`);
+        const data = await response.json();
+
+        if (!response.ok) throw new Error(data.detail || "Failed to get status");
+
+        if (!(await applyStatus(meetingId, data))) {
+          setTimeout(() => pollStatus(meetingId), 3000);
+        }
+      } catch (error) {
+        showStatus(`Status check failed: ${error.message}`, "error");
+        setIsProcessing(false);
+      }
+    },
+    [applyStatus]
+  );
+
+  // Progress is pushed over Server-Sent Events; polling is the fallback
+  // when EventSource isn't available or the stream breaks
+  const watchStatus = useCallback(
+    (meetingId) => {
+      if (!window.EventSource) return pollStatus(meetingId);
+
+      const source = new EventSource(`/api/v1/meetings/${meetingId}/events`);
+      let finished = false;
+
+      source.onmessage = (event) => {
+        const data = JSON.parse(event.data);
+        // The server ends the stream after the final event; don't treat that as an error
+        if (data.status === "completed" || data.status === "failed") {
+          finished = true;
+          source.close();
+        }
+        applyStatus(meetingId, data);
+      };
+
+      source.onerror = () => {
+        source.close();
+        if (!finished) pollStatus(meetingId);
+      };
+    },
+    [applyStatus, pollStatus]
+  );
 
   const handleUpload = async () => {
     if (!selectedFile) return showStatus("Please select a file first", "error");
@@ -79,7 +124,7 @@ function App() {
       if (!response.ok) throw new Error(result.detail || "Upload failed");
 
       showStatus("File uploaded. Starting process... ⚙️", "success");
-      pollStatus(result.meeting_id);
+      watchStatus(result.meeting_id);
     } catch (error) {
       showStatus(`Error: ${error.message}`, "error");
       setIsProcessing(false);
@@ -0,0 +1,32 @@
+"""Add stage to processing_jobs
+
+Revision ID: 5e8c3a7f2b90
+Revises: 7b2d9e4c1f58
+Create Date: 2026-10-17 16:31:05.274819
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e8c3a7f2b90'
+down_revision: Union[str, Sequence[str], None] = '7b2d9e4c1f58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('processing_jobs', sa.Column('stage', sa.String(), server_default='transcribe', nullable=False))
+    # Finished jobs went through every stage
+    op.execute("UPDATE processing_jobs SET stage = 'ticket' WHERE status = 'completed'")
+    op.create_index('ix_processing_jobs_stage_status', 'processing_jobs', ['stage', 'status'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_processing_jobs_stage_status', table_name='processing_jobs')
+    op.drop_column('processing_jobs', 'stage')
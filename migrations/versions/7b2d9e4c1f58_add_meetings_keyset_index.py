@@ -0,0 +1,31 @@
+"""Add (created_at, id) index on meetings for keyset pagination
+
+Revision ID: 7b2d9e4c1f58
+Revises: e6b3f0a8d214
+Create Date: 2026-10-17 15:48:12.630194
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7b2d9e4c1f58'
+down_revision: Union[str, Sequence[str], None] = 'e6b3f0a8d214'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_meetings_created_at_id', 'meetings', ['created_at', 'id'], unique=False)
+    # Covered by the composite index
+    op.drop_index('ix_meetings_created_at', table_name='meetings')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('ix_meetings_created_at', 'meetings', ['created_at'], unique=False)
+    op.drop_index('ix_meetings_created_at_id', table_name='meetings')
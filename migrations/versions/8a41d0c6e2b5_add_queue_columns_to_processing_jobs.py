@@ -0,0 +1,38 @@
+"""Add queue and lease columns to processing_jobs
+
+Revision ID: 8a41d0c6e2b5
+Revises: 3f9c2a7d41e8
+Create Date: 2026-10-17 10:03:17.554012
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8a41d0c6e2b5'
+down_revision: Union[str, Sequence[str], None] = '3f9c2a7d41e8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('processing_jobs', sa.Column('payload', sa.JSON(), nullable=True))
+    op.add_column('processing_jobs', sa.Column('attempts', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('processing_jobs', sa.Column('max_attempts', sa.Integer(), server_default='3', nullable=False))
+    op.add_column('processing_jobs', sa.Column('run_after', sa.DateTime(), nullable=True))
+    op.add_column('processing_jobs', sa.Column('lease_expires_at', sa.DateTime(), nullable=True))
+    op.add_column('processing_jobs', sa.Column('worker_id', sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('processing_jobs', 'worker_id')
+    op.drop_column('processing_jobs', 'lease_expires_at')
+    op.drop_column('processing_jobs', 'run_after')
+    op.drop_column('processing_jobs', 'max_attempts')
+    op.drop_column('processing_jobs', 'attempts')
+    op.drop_column('processing_jobs', 'payload')
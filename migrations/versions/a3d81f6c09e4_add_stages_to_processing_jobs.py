@@ -0,0 +1,29 @@
+"""Add per-stage status to processing_jobs
+
+Revision ID: a3d81f6c09e4
+Revises: 5e8c3a7f2b90
+Create Date: 2026-10-17 17:12:40.518306
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3d81f6c09e4'
+down_revision: Union[str, Sequence[str], None] = '5e8c3a7f2b90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Left empty for existing jobs; their stage status is derived from stage and status
+    op.add_column('processing_jobs', sa.Column('stages', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('processing_jobs', 'stages')
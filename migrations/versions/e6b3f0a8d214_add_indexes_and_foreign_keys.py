@@ -0,0 +1,59 @@
+"""Add indexes and foreign keys for hot query paths
+
+Revision ID: e6b3f0a8d214
+Revises: 4d7e1a9b3c26
+Create Date: 2026-10-17 15:02:37.418265
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6b3f0a8d214'
+down_revision: Union[str, Sequence[str], None] = '4d7e1a9b3c26'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, referenced table)
+FOREIGN_KEYS = [
+    ('requirements', 'meeting_id', 'meetings'),
+    ('jira_tickets', 'requirement_id', 'requirements'),
+    ('processing_jobs', 'meeting_id', 'meetings'),
+    ('transcript_segments', 'meeting_id', 'meetings'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_meetings_created_at', 'meetings', ['created_at'], unique=False)
+    op.create_index('ix_requirements_meeting_id', 'requirements', ['meeting_id'], unique=False)
+    op.create_index('ix_jira_tickets_requirement_id', 'jira_tickets', ['requirement_id'], unique=False)
+    op.create_index('ix_processing_jobs_meeting_id', 'processing_jobs', ['meeting_id'], unique=False)
+
+    # Rows left behind by deleted parents would make the constraints fail
+    for table, column, referenced in FOREIGN_KEYS:
+        op.execute(
+            f"DELETE FROM {table} WHERE {column} NOT IN (SELECT id FROM {referenced})"
+        )
+
+    for table, column, referenced in FOREIGN_KEYS:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.create_foreign_key(
+                f'fk_{table}_{column}_{referenced}', referenced,
+                [column], ['id'], ondelete='CASCADE'
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column, referenced in reversed(FOREIGN_KEYS):
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_constraint(f'fk_{table}_{column}_{referenced}', type_='foreignkey')
+
+    op.drop_index('ix_processing_jobs_meeting_id', table_name='processing_jobs')
+    op.drop_index('ix_jira_tickets_requirement_id', table_name='jira_tickets')
+    op.drop_index('ix_requirements_meeting_id', table_name='requirements')
+    op.drop_index('ix_meetings_created_at', table_name='meetings')
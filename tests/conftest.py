@@ -0,0 +1,37 @@
+import os
+import tempfile
+
+import pytest
+
+# Settings are read on import, so the environment is set before any app module loads
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{tempfile.mkdtemp()}/test.db")
+os.environ.setdefault("OPENAI_API_KEY", "test")
+os.environ.setdefault("GEMINI_API_KEY", "test")
+os.environ.setdefault("JIRA_SERVER", "http://127.0.0.1:9")
+os.environ.setdefault("JIRA_EMAIL", "test@example.com")
+os.environ.setdefault("JIRA_API_TOKEN", "test")
+os.environ.setdefault("SECRET_KEY", "test")
+os.environ.setdefault("DEBUG", "False")
+
+
+@pytest.fixture
+def mock_jira(monkeypatch):
+     """
+     The benchmark mock Jira server, with the Jira client, transport and
+     metadata cache rebuilt against it
+     """
+     from app.config import settings
+     from app.services.jira_metadata import get_jira_metadata
+     from app.services.jira_transport import get_jira_transport
+     from benchmarks.mock_jira import MockJira
+
+     with MockJira(latency=0.0, retry_after=0.01) as jira:
+          monkeypatch.setattr(settings, "JIRA_SERVER", jira.url)
+          monkeypatch.setattr(settings, "JIRA_BACKOFF_BASE_SECONDS", 0.01)
+          monkeypatch.setattr(settings, "JIRA_RATE_LIMIT_PER_SECOND", 1000.0)
+          monkeypatch.setattr(settings, "JIRA_RATE_LIMIT_BURST", 1000)
+          get_jira_transport.cache_clear()
+          get_jira_metadata.cache_clear()
+          yield jira
+          get_jira_transport.cache_clear()
+          get_jira_metadata.cache_clear()
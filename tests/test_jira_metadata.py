@@ -0,0 +1,22 @@
+import asyncio
+
+import pytest
+
+
+def test_failed_load_is_cached():
+     from app.services.jira_metadata import MetadataCache
+
+     cache = MetadataCache(ttl_seconds=60, stale_seconds=60, failure_seconds=60)
+     calls = []
+
+     async def load():
+          calls.append(1)
+          raise ConnectionError("Jira is down")
+
+     async def get_twice():
+          for _ in range(2):
+               with pytest.raises(ConnectionError):
+                    await cache.get("projects", load)
+
+     asyncio.run(get_twice())
+     assert len(calls) == 1
@@ -0,0 +1,35 @@
+import asyncio
+
+from benchmarks.bench_jira_concurrency import make_requirements
+
+
+def _create(requirements):
+     from app.services.jira_service import JiraService
+
+     return asyncio.run(JiraService().create_tickets_for_requirements(requirements, "PROJ"))
+
+
+def test_bulk_create_posts_every_issue_once(mock_jira, monkeypatch):
+     from app.config import settings
+
+     monkeypatch.setattr(settings, "JIRA_BULK_CREATE", True)
+     monkeypatch.setattr(settings, "JIRA_BULK_BATCH_SIZE", 4)
+
+     results = _create(make_requirements(10))
+
+     assert [result.error for result in results] == [None] * 10
+     assert sorted(result.ticket.key for result in results) == sorted(mock_jira.issues)
+     assert len(mock_jira.issues) == 10
+
+
+def test_throttled_single_create_makes_one_issue(mock_jira, monkeypatch):
+     from app.config import settings
+
+     monkeypatch.setattr(settings, "JIRA_BULK_CREATE", False)
+     mock_jira.throttle_every = 2
+
+     results = _create(make_requirements(3))
+
+     assert [result.error for result in results] == [None] * 3
+     assert sorted(result.ticket.key for result in results) == sorted(mock_jira.issues)
+     assert len(mock_jira.issues) == 3